@@ -0,0 +1,290 @@
+"""
+End-to-end benchmark of the webhook handler code paths.
+
+Replays what the alertmanager, Azure Monitor and Dynatrace handler runbooks
+do – import the runsession and webhook memo, fetch the persona, match SLXs
+(`Get Slxs With Tag` / `Get Slxs With Targeted Entity Reference`), run
+`Perform Improved Task Search`, expand the scope from workspace.yaml when it
+is a single SLX, and `Create RunSession From Task Search` – against a local
+stand-in API serving synthetic workspaces.
+
+Each (handler, workspace size) run happens in a fresh Python process, as a
+runbook does, and reports wall time, API calls per endpoint and peak RSS:
+
+    python benchmarks/bench_handlers.py                     # 1k, 10k, 50k SLXs
+    python benchmarks/bench_handlers.py --sizes 1000 --repeat 5 --json out.json
+    python benchmarks/bench_handlers.py --baseline out.json # fail on regressions
+
+With ``--baseline`` the exit status is 1 when any scenario is slower than
+the baseline by more than ``--tolerance`` (wall time) or makes more API calls.
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LIBRARIES = os.path.join(os.path.dirname(HERE), "libraries")
+sys.path.insert(0, HERE)
+
+import stand_in_api  # noqa: E402
+
+HANDLERS = ("alertmanager", "azure-monitor", "dynatrace")
+DEFAULT_SIZES = (1000, 10000, 50000)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic webhooks – each targets resources that exist in every workspace
+# ---------------------------------------------------------------------------
+
+def webhook_for(handler: str) -> Dict[str, Any]:
+    if handler == "alertmanager":
+        return {
+            "status": "firing",
+            "groupLabels": {"alertname": "KubeDeploymentReplicasMismatch"},
+            "commonLabels": {"namespace": "ns-7", "resource_name": "res-407"},
+        }
+    if handler == "azure-monitor":
+        return {
+            "schemaId": "azureMonitorCommonAlertSchema",
+            "data": {
+                "essentials": {
+                    "alertId": "/subscriptions/sub-1/providers/Microsoft.AlertsManagement/alerts/a1",
+                    "alertRule": "High CPU",
+                    "severity": "Sev2",
+                    "signalType": "Metric",
+                    "monitorCondition": "Fired",
+                    "monitoringService": "Platform",
+                    "description": "CPU above 90%",
+                    "alertTargetIDs": [
+                        "/subscriptions/sub-1/resourcegroups/rg-1/providers/microsoft.web/sites/res-407"
+                    ],
+                    "firedDateTime": "2025-01-01T00:00:00Z",
+                },
+                "alertContext": {},
+            },
+        }
+    if handler == "dynatrace":
+        return {
+            "state": "OPEN",
+            "impactedEntities": [{"name": "svc-407 on port 8080"}],
+            "problemDetailsJSON": {"rootCauseEntity": {"name": "res-407"}},
+        }
+    raise ValueError(handler)
+
+
+# ---------------------------------------------------------------------------
+# Worker: one handler run in this process
+# ---------------------------------------------------------------------------
+
+def _expand_scope(wu, scopes: List[str]) -> List[str]:
+    if len(scopes) != 1:
+        return scopes
+    config = wu.get_workspace_config()
+    return scopes + list(wu.get_nearby_slxs(config, scopes[0]))
+
+
+def _search_and_create(wu, ru, session: Dict, entities: List[str], scopes: List[str], source: str) -> Dict:
+    persona = ru.get_persona_details(persona=session["personaShortName"])
+    confidence = persona["spec"]["run"]["confidenceThreshold"]
+    search, strategy, final_scopes, query = wu.perform_improved_task_search(
+        entity_data=entities,
+        persona=session["personaShortName"],
+        confidence_threshold=confidence,
+        slx_scope=scopes,
+    )
+    expanded = _expand_scope(wu, list(final_scopes))
+    if expanded != list(final_scopes):
+        search, strategy, final_scopes, query = wu.perform_improved_task_search(
+            entity_data=entities,
+            persona=session["personaShortName"],
+            confidence_threshold=confidence,
+            slx_scope=expanded,
+        )
+    _, total = wu.build_task_report_md(search_response=search, score_threshold=confidence)
+    created = {}
+    if total:
+        created = ru.create_runsession_from_task_search(
+            search_response=search,
+            persona_shortname=session["personaShortName"],
+            score_threshold=confidence,
+            runsession_prefix=f"bench-{source}",
+            notes=session["notes"],
+            source=session["source"],
+        )
+    return {"strategy": strategy, "scopes": len(final_scopes), "tasks": total, "created": bool(created)}
+
+
+def run_handler(handler: str) -> Dict[str, Any]:
+    from RW.Workspace import workspace_utils as wu
+    from RW.RunSession import runsession_utils as ru
+
+    session = json.loads(wu.import_runsession_details())
+    webhook = json.loads(wu.import_memo_variable(key="webhookJson"))
+
+    if handler == "alertmanager":
+        labels = [f"{k}:{v}" for k, v in webhook["commonLabels"].items()]
+        slxs = wu.get_slxs_with_tag(tag_list=labels)
+        entities = list(webhook["commonLabels"].values())
+    elif handler == "azure-monitor":
+        from RW.Azure import Azure
+        azure = Azure()
+        parsed = azure.parse_alert(webhook)
+        kql_entities, _query = azure.extract_kql_entities_with_query(webhook)
+        entities = kql_entities or [r["resource_name"] for r in parsed["resources"]]
+        slxs = wu.get_slxs_with_targeted_entity_reference(entities, ["resource_name", "child_resource"])
+    else:
+        from RW.Dynatrace.dynatrace_parser import parse_dynatrace_entities
+        entities = parse_dynatrace_entities(webhook)
+        slxs = wu.get_slxs_with_targeted_entity_reference(entities, ["entity_name", "resource_name"])
+
+    scopes = [s.get("shortName", "") for s in slxs]
+    outcome = {"matched_slxs": len(scopes)}
+    if scopes:
+        outcome.update(_search_and_create(wu, ru, session, entities, scopes, handler))
+    return outcome
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss survives exec on Linux, so a worker would report at least the
+    # driver's size (which holds the whole synthetic workspace); VmHWM doesn't.
+    try:
+        with open("/proc/self/status", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def worker(handler: str) -> None:
+    sys.path.insert(0, LIBRARIES)
+    t0 = time.perf_counter()
+    import RW.Workspace  # noqa: F401  (import cost is part of a runbook's start-up)
+    import RW.RunSession  # noqa: F401
+    imported = time.perf_counter()
+    rss_after_import = _peak_rss_mb()
+    outcome = run_handler(handler)
+    done = time.perf_counter()
+    print(json.dumps({
+        "import_s": round(imported - t0, 3),
+        "handler_s": round(done - imported, 3),
+        "rss_after_import_mb": rss_after_import,
+        "peak_rss_mb": _peak_rss_mb(),
+        "outcome": outcome,
+    }))
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def run_scenario(state: "stand_in_api.StandInState", root: str, handler: str) -> Dict[str, Any]:
+    state.runsession = stand_in_api.runsession(webhook_for(handler), handler)
+    state.reset_counters()
+    env = dict(
+        os.environ,
+        RW_WORKSPACE=stand_in_api.WORKSPACE,
+        RW_WORKSPACE_API_URL=root,
+        RW_SESSION_ID=stand_in_api.RUNSESSION_ID,
+        RW_RUNREQUEST_ID=stand_in_api.RUNREQUEST_ID,
+        RW_USER_TOKEN="benchmark-token",
+    )
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", handler],
+        env=env, capture_output=True, text=True, check=False,
+    )
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(f"{handler} worker failed:\n{proc.stderr}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    with state.lock:
+        calls = dict(state.calls)
+        sent = state.bytes_sent
+    result.update(wall_s=round(wall, 3), api_calls=sum(calls.values()), calls=calls, bytes=sent)
+    return result
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    last = runs[-1]
+    return {
+        "wall_s": round(statistics.median(r["wall_s"] for r in runs), 3),
+        "handler_s": round(statistics.median(r["handler_s"] for r in runs), 3),
+        "import_s": round(statistics.median(r["import_s"] for r in runs), 3),
+        "peak_rss_mb": max(r["peak_rss_mb"] for r in runs),
+        "api_calls": last["api_calls"],
+        "bytes": last["bytes"],
+        "calls": last["calls"],
+        "outcome": last["outcome"],
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    problems = []
+    for key, now in results.items():
+        before = baseline.get(key)
+        if not before:
+            continue
+        if now["wall_s"] > before["wall_s"] * (1 + tolerance):
+            problems.append(f"{key}: wall {before['wall_s']}s → {now['wall_s']}s")
+        if now["api_calls"] > before["api_calls"]:
+            problems.append(f"{key}: API calls {before['api_calls']} → {now['api_calls']}")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--handlers", nargs="+", choices=HANDLERS, default=list(HANDLERS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="added per API request")
+    parser.add_argument("--json", help="write results here")
+    parser.add_argument("--baseline", help="compare against an earlier --json file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed wall-time slowdown")
+    parser.add_argument("--worker", choices=HANDLERS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker)
+        return 0
+
+    results: Dict[str, Dict[str, Any]] = {}
+    print(f"{'scenario':<26}{'wall s':>8}{'handler s':>11}{'import s':>10}{'API calls':>11}{'MB sent':>9}{'peak RSS MB':>13}")
+    for size in args.sizes:
+        state = stand_in_api.StandInState(size, latency=args.latency_ms / 1000)
+        server, root = stand_in_api.start(state)
+        try:
+            for handler in args.handlers:
+                runs = [run_scenario(state, root, handler) for _ in range(args.repeat)]
+                key = f"{handler}/{size}"
+                results[key] = summary = summarize(runs)
+                print(f"{key:<26}{summary['wall_s']:>8}{summary['handler_s']:>11}{summary['import_s']:>10}"
+                      f"{summary['api_calls']:>11}{summary['bytes'] / 1e6:>9.1f}{summary['peak_rss_mb']:>13}")
+        finally:
+            server.shutdown()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump({"generated": time.time(), "latency_ms": args.latency_ms, "results": results}, fh, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            problems = compare(results, json.load(fh)["results"], args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
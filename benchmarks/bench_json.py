@@ -0,0 +1,191 @@
+"""
+JSON decode time and transfer size for large Workspace API payloads.
+
+Fixtures:
+  • slx-page   – one `/slxs` page of 500 full SLX specs
+  • runsession – a runsession whose run requests carry whole webhook bodies
+                 in their memos (the handler case)
+
+For each fixture this prints the bytes on the wire (identity, gzip and –
+when a brotli module is installed – br) and the decode and encode time the old way
+(`requests`' ``Response.json()``: bytes → str → stdlib json) against
+`RW.Workspace.json_codec.response_json` (orjson straight from bytes when
+installed). It then fetches each fixture over loopback through the pooled
+session, with and without compression, to show the end-to-end effect:
+
+    python benchmarks/bench_json.py
+    python benchmarks/bench_json.py --memo-kb 200 --run-requests 50 --repeat 20
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "libraries"))
+
+import requests  # noqa: E402
+
+import stand_in_api  # noqa: E402
+from RW.Workspace import json_codec  # noqa: E402
+from RW.Workspace.http_session import accept_encoding, get_anonymous_session  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def webhook_body(kb: int) -> Dict[str, Any]:
+    """An alert payload of roughly *kb* KiB: labels, annotations and log lines."""
+    rnd = random.Random(kb)
+    alerts = []
+    i = 0
+    while len(json.dumps(alerts)) < kb * 1024:
+        alerts.append({
+            "status": "firing",
+            "labels": {"alertname": f"HighErrorRate{i % 7}", "namespace": f"ns-{i % 50}",
+                       "pod": f"res-{i}-7c9d8f-x{i % 13}", "severity": "critical"},
+            "annotations": {"summary": f"Error rate above 5% for res-{i}",
+                            "description": "5xx responses over the last 10 minutes; " * 4},
+            "startsAt": "2025-01-01T00:00:00Z",
+            "logs": [f"2025-01-01T00:00:{s:02d}Z ERROR trace={rnd.getrandbits(64):016x} upstream "
+                     f"timed out after {rnd.randint(100, 30000)}ms (pod res-{i}) – retrying" for s in range(10)],
+            "value": rnd.random(),
+        })
+        i += 1
+    return {"receiver": "runwhen", "status": "firing", "alerts": alerts}
+
+
+def fixtures(memo_kb: int, run_requests: int) -> Dict[str, bytes]:
+    slxs = stand_in_api.synthetic_slxs(500)
+    page = {"count": 50000, "next": "https://papi.example.com/api/v3/workspaces/ws/slxs?limit=500&offset=500",
+            "results": slxs}
+    session = stand_in_api.runsession(webhook_body(memo_kb), "alertmanager")
+    template = session["runRequests"][0]
+    session["runRequests"] = [dict(template, id=n, memo=[{"webhookJson": webhook_body(memo_kb // 4 or 1)}])
+                              for n in range(run_requests)]
+    session["runRequests"][0] = template
+    return {"slx-page": json.dumps(page).encode(), "runsession": json.dumps(session).encode()}
+
+
+class _Raw:
+    """Just enough of a `requests.Response` for both decoders."""
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.encoding = "utf-8"
+
+    def json(self):
+        # What requests does: decode to text, then stdlib json
+        return json.loads(self.content.decode(self.encoding))
+
+
+def _median_ms(fn: Callable[[], Any], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return round(statistics.median(times) * 1000, 2)
+
+
+def offline(name: str, body: bytes, repeat: int) -> None:
+    sizes = {"identity": len(body), "gzip": len(gzip.compress(body, 6))}
+    if brotli is not None:
+        sizes["br"] = len(brotli.compress(body, quality=5))
+    raw = _Raw(body)
+    stdlib_ms = _median_ms(raw.json, repeat)
+    codec_ms = _median_ms(lambda: json_codec.response_json(raw), repeat)
+    packed = gzip.compress(body, 6)
+    gunzip_ms = _median_ms(lambda: gzip.decompress(packed), repeat)
+    data = raw.json()
+    encode_before_ms = _median_ms(lambda: json.dumps(data), repeat)
+    encode_after_ms = _median_ms(lambda: json_codec.dumps(data), repeat)
+    print(f"{name:<12}" + "".join(f"{k}={v / 1024:,.0f}KiB  " for k, v in sizes.items()))
+    print(f"{'':<12}decode: Response.json() {stdlib_ms} ms → response_json ({json_codec.json_backend()}) {codec_ms} ms"
+          f"  ({_ratio(stdlib_ms, codec_ms)}); gunzip {gunzip_ms} ms")
+    print(f"{'':<12}encode: json.dumps {encode_before_ms} ms → json_codec.dumps {encode_after_ms} ms"
+          f"  ({_ratio(encode_before_ms, encode_after_ms)})")
+
+
+def _ratio(before: float, after: float) -> str:
+    return f"{before / after:.1f}x" if after else "n/a"
+
+
+def _serve(bodies: Dict[str, bytes]) -> Tuple[ThreadingHTTPServer, str, Dict[str, int]]:
+    wire: Dict[str, int] = {}
+    compressed = {k: gzip.compress(v, 6) for k, v in bodies.items()}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and a small compressed body go out as separate writes
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            name = self.path.strip("/")
+            body, encoding = bodies[name], None
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body, encoding = compressed[name], "gzip"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.end_headers()
+            self.wfile.write(body)
+            wire[name] = len(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}", wire
+
+
+def end_to_end(bodies: Dict[str, bytes], repeat: int) -> None:
+    server, root, wire = _serve(bodies)
+    try:
+        plain = requests.Session()
+        plain.headers["Accept-Encoding"] = "identity"
+        pooled = get_anonymous_session(root)
+        for name in bodies:
+            url = f"{root}/{name}"
+            before_ms = _median_ms(lambda: plain.get(url).json(), repeat)
+            before_bytes = wire[name]
+            after_ms = _median_ms(lambda: json_codec.response_json(pooled.get(url)), repeat)
+            after_bytes = wire[name]
+            print(f"{name:<12}loopback fetch+decode: identity + Response.json() {before_ms} ms, "
+                  f"{before_bytes / 1024:,.0f}KiB → {accept_encoding()!r} + response_json {after_ms} ms, "
+                  f"{after_bytes / 1024:,.0f}KiB")
+    finally:
+        server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memo-kb", type=int, default=100, help="size of the handler's webhook memo")
+    parser.add_argument("--run-requests", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    bodies = fixtures(args.memo_kb, args.run_requests)
+    print(f"JSON backend: {json_codec.json_backend()}; Accept-Encoding: {accept_encoding()}\n")
+    for name, body in bodies.items():
+        offline(name, body, args.repeat)
+    print()
+    end_to_end(bodies, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+RunSession digest cost for the notification runbooks (Slack, GitHub).
+
+Builds a runsession with many run requests and issues. It times the digest
+two ways:
+- the keyword-per-field sequence the runbooks used to run:
+  Count Open Issues, Get Open Issues, Summarize RunSession Users,
+  Extract Issue Keywords, Get Most Referenced Resource and
+  Get RunSession Source;
+- one Summarize RunSession call.
+
+Both are timed on JSON text the process has not seen before, so it must be
+decoded, and on the already-parsed dict:
+
+    python benchmarks/bench_runsession.py
+    python benchmarks/bench_runsession.py --run-requests 2000 --issues 5 --repeat 20
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "libraries"))
+
+from RW.RunSession import runsession_utils as rs  # noqa: E402
+
+SOURCE_FIELDS = ("fromSearchQuery", "fromIssue", "fromSliAlert", "fromAlert")
+
+
+def synthetic_runsession(run_requests: int, issues: int, seed: int = 1) -> Dict[str, Any]:
+    rnd = random.Random(seed)
+    requests = []
+    for n in range(run_requests):
+        requests.append({
+            "id": n,
+            "created": f"2025-02-{rnd.randint(1, 28):02d}T{rnd.randint(0, 23):02d}:"
+                       f"{rnd.randint(0, 59):02d}:00.{rnd.randint(0, 999999):06d}Z",
+            "requester": rnd.choice(["ops@example.com", "ws@workspaces.runwhen.com", "sre@example.com"]),
+            "persona": {"spec": {"fullName": rnd.choice(["Eager Edgar", "Cautious Cathy"])}},
+            rnd.choice(SOURCE_FIELDS): {"id": n},
+            "issues": [{
+                "closed": rnd.random() < 0.3,
+                "severity": rnd.randint(1, 4),
+                "title": f"Pod `res-{rnd.randint(0, 200)}` in `ns-{rnd.randint(0, 20)}` is restarting",
+                "nextSteps": "Check the pod logs",
+                "details": "restart count above threshold",
+            } for _ in range(issues)],
+        })
+    return {"id": seed, "runRequests": requests}
+
+
+def per_keyword(data: Any) -> None:
+    rs.count_open_issues(data)
+    rs.get_open_issues(data)
+    rs.summarize_runsession_users(data)
+    rs.extract_issue_keywords(data)
+    rs.get_most_referenced_resource(data)
+    rs.get_runsession_source(rs.parse_runsession(data))
+
+
+def one_pass(data: Any) -> None:
+    rs.summarize_runsession(data)
+
+
+def _median_ms(fn: Callable[[], Any], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return round(statistics.median(times) * 1000, 2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--run-requests", type=int, default=500)
+    parser.add_argument("--issues", type=int, default=10, help="issues per run request")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    session = synthetic_runsession(args.run_requests, args.issues)
+    text = json.dumps(session)
+    print(f"{args.run_requests} run requests, {args.run_requests * args.issues} issues, "
+          f"{len(text) / 1024:,.0f} KiB of JSON\n")
+
+    counter = iter(range(sys.maxsize))
+
+    def fresh_text() -> str:
+        # Text the parse cache has not seen, so the digest includes one decode
+        return text + " " * (next(counter) % 64 + 1)
+
+    print(f"{'digest':<14}{'fresh text ms':>15}{'parsed dict ms':>16}")
+    for name, fn in (("per keyword", per_keyword), ("one pass", one_pass)):
+        text_ms = _median_ms(lambda: fn(fresh_text()), args.repeat)
+        dict_ms = _median_ms(lambda: fn(session), args.repeat)
+        print(f"{name:<14}{text_ms:>15}{dict_ms:>16}")
+
+
+if __name__ == "__main__":
+    main()
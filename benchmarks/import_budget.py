@@ -0,0 +1,173 @@
+"""
+Import-time budget for the RW keyword libraries.
+
+Every runbook is a fresh Robot process, so the time spent in ``Library``
+imports is paid on every run. For each codebundle this measures what its
+``Library RW.*`` settings cost on top of what any runbook loads anyway
+(Robot itself and RW.Core), the way Robot imports them – module import plus
+keyword creation – in a fresh interpreter with bytecode already compiled, as
+in an installed image (the bytecode goes to a temporary PYTHONPYCACHEPREFIX,
+so the tree stays clean, and the run that writes it is not counted):
+
+    python benchmarks/import_budget.py                 # table, exit 1 if over budget
+    python benchmarks/import_budget.py --json out.json
+    python benchmarks/import_budget.py --scale 1.5     # looser budgets on slow machines
+
+Only libraries shipped from this repository are timed; RW.Core, RW.CLI and
+RW.platform come from elsewhere. Budgets are the median of ``--repeat``
+runs in milliseconds, plus a count of newly imported modules, which is
+steadier across machines and catches a heavy dependency creeping back in.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+LIBRARIES = os.path.join(REPO, "libraries")
+CODEBUNDLES = os.path.join(REPO, "codebundles")
+
+# scenario -> (milliseconds, newly imported modules). Set a little above what
+# the libraries cost now; the async client, HTTP metrics, SLX catalog/index and
+# the profiler are imported by the keywords that need them, never up front.
+BUDGETS: Dict[str, Tuple[float, int]] = {
+    # The Workspace keywords plus the HTTP modules they share (endpoints,
+    # session, retry policy, TTL cache, runsession cache)
+    "library RW.Workspace": (18, 12),
+    # Parses runsession text through RW.Workspace.runsession_cache; importing
+    # workspace_utils again would take it over
+    "library RW.RunSession": (12, 10),
+    # croniter and dateutil
+    "library RW.Cron": (18, 15),
+    "cron-scheduler-sli": (35, 26),
+    "alertmanager-webbook-handler": (25, 16),
+    "azure-monitor-webhook-handler": (25, 16),
+    "dynatrace-webbook-handler": (25, 16),
+    "github-create-issue-from-runsession": (25, 16),
+    "pagerduty-webhook-handler": (25, 16),
+    "slack-post-message-from-runsession": (25, 16),
+}
+DEFAULT_BUDGET = (10, 7)
+
+# Support packages, not keyword libraries
+NOT_LIBRARIES = {"RW.Profiling"}
+
+_LIBRARY_SETTING = re.compile(r"^Library\s+(RW\.\w+)", re.MULTILINE)
+
+
+def repo_libraries() -> List[str]:
+    rw = os.path.join(LIBRARIES, "RW")
+    return sorted(
+        f"RW.{name}" for name in os.listdir(rw)
+        if os.path.isfile(os.path.join(rw, name, "__init__.py")) and f"RW.{name}" not in NOT_LIBRARIES
+    )
+
+
+def scenarios() -> Dict[str, List[str]]:
+    """Codebundle -> the repo libraries its .robot files import."""
+    ours = set(repo_libraries())
+    found: Dict[str, List[str]] = {}
+    for bundle in sorted(os.listdir(CODEBUNDLES)):
+        path = os.path.join(CODEBUNDLES, bundle)
+        libs = set()
+        for name in os.listdir(path) if os.path.isdir(path) else ():
+            if name.endswith(".robot"):
+                with open(os.path.join(path, name), encoding="utf-8") as fh:
+                    libs.update(_LIBRARY_SETTING.findall(fh.read()))
+        libs &= ours
+        if libs:
+            found[bundle] = sorted(libs)
+    return found
+
+
+def worker(libraries: List[str]) -> None:
+    sys.path.insert(0, LIBRARIES)
+    # What every runbook has loaded before our libraries
+    import robot.running  # noqa: F401
+    from robot.libraries.BuiltIn import BuiltIn  # noqa: F401
+    from robot.running.testlibraries import TestLibrary
+    try:
+        import RW.Core  # noqa: F401
+    except ImportError:
+        pass
+
+    before = set(sys.modules)
+    started = time.perf_counter()
+    for name in libraries:
+        TestLibrary.from_name(name)
+    elapsed = time.perf_counter() - started
+    new = set(sys.modules) - before
+    print(json.dumps({"ms": round(elapsed * 1000, 1), "modules": len(new)}))
+
+
+def measure(libraries: List[str], repeat: int, env: Dict[str, str]) -> Dict[str, float]:
+    runs = []
+    for _ in range(repeat + 1):
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker", *libraries],
+            env=env, capture_output=True, text=True, check=False,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"importing {libraries} failed:\n{proc.stderr}")
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    runs = runs[1:]  # the first run compiled the bytecode
+    return {
+        "ms": round(statistics.median(r["ms"] for r in runs), 1),
+        "modules": max(r["modules"] for r in runs),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the millisecond budgets")
+    parser.add_argument("--json", help="write results here")
+    parser.add_argument("--worker", nargs="+", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker)
+        return 0
+
+    cases = {f"library {lib}": [lib] for lib in repo_libraries()}
+    cases.update(scenarios())
+
+    pycache = tempfile.TemporaryDirectory(prefix="rw-import-budget-")
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache.name)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    results = {}
+    over = []
+    print(f"{'scenario':<40}{'ms':>8}{'budget':>8}{'modules':>9}{'budget':>8}")
+    for name, libraries in cases.items():
+        result = measure(libraries, args.repeat, env)
+        ms_budget, module_budget = BUDGETS.get(name, DEFAULT_BUDGET)
+        ms_budget *= args.scale
+        result.update(libraries=libraries, ms_budget=ms_budget, module_budget=module_budget)
+        results[name] = result
+        flag = ""
+        if result["ms"] > ms_budget or result["modules"] > module_budget:
+            over.append(name)
+            flag = "  OVER"
+        print(f"{name:<40}{result['ms']:>8}{ms_budget:>8.0f}{result['modules']:>9}{module_budget:>8}{flag}")
+    pycache.cleanup()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump({"generated": time.time(), "results": results}, fh, indent=2)
+
+    for name in over:
+        print(f"OVER BUDGET {name}: {results[name]['ms']} ms, {results[name]['modules']} modules")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""
+Local stand-in for the RunWhen Workspace API, serving a synthetic workspace.
+
+Implements just enough of the API for the webhook handler code paths:
+
+  GET   /api/v3/workspaces/<ws>/slxs                  count/next paging, ETag
+  GET   /api/v3/workspaces/<ws>/slxs/<name>
+  GET   /api/v3/workspaces/<ws>/branches/main/workspace.yaml
+  GET   /api/v3/workspaces/<ws>/personas/<persona>
+  GET   /api/v3/workspaces/<ws>/runsessions/<id>
+  POST  /api/v3/workspaces/<ws>/runsessions
+  PATCH /api/v3/workspaces/<ws>/runsessions/<id>
+  POST  /api/v3/workspaces/<ws>/task-search
+
+Every request is counted per endpoint template; `latency` adds a fixed delay
+per request to stand in for the network. Run it on its own with
+``python benchmarks/stand_in_api.py --slxs 10000`` to point a local Robot run
+at it.
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+WORKSPACE = "bench-ws"
+PERSONA = "eager-edgar"
+RUNSESSION_ID = "1001"
+RUNREQUEST_ID = "1"
+
+NAMESPACES = 50
+RESOURCE_TYPES = ("deployment", "statefulset", "service", "ingress", "pod", "webapp")
+GROUP_SIZE = 10
+
+
+def synthetic_slxs(count: int, workspace: str = WORKSPACE) -> List[Dict[str, Any]]:
+    """*count* SLXs shaped like real ones (tags, alias, config, statement)."""
+    slxs = []
+    for i in range(count):
+        short = f"slx-{i:05d}"
+        ns = f"ns-{i % NAMESPACES}"
+        rtype = RESOURCE_TYPES[i % len(RESOURCE_TYPES)]
+        slxs.append({
+            "name": f"{workspace}--{short}",
+            "shortName": short,
+            "spec": {
+                "alias": f"{ns} {rtype} res-{i} Health",
+                "statement": f"res-{i} in {ns} should be available and healthy",
+                "owners": ["sre@example.com"],
+                "tags": [
+                    {"name": "resource_name", "value": f"res-{i}"},
+                    {"name": "child_resource", "value": f"child-{i % 500}"},
+                    {"name": "entity_name", "value": f"svc-{i % 2000}"},
+                    {"name": "resource_type", "value": rtype},
+                    {"name": "namespace", "value": ns},
+                    {"name": "cluster", "value": f"cluster-{i % 5}"},
+                    {"name": "platform", "value": "kubernetes"},
+                ],
+                "configProvided": [
+                    {"name": "NAMESPACE", "value": ns},
+                    {"name": "CONTEXT", "value": f"cluster-{i % 5}"},
+                    {"name": "LABELS", "value": f"app=res-{i},tier=backend"},
+                ],
+            },
+        })
+    return slxs
+
+
+def workspace_yaml(slxs: List[Dict[str, Any]], workspace: str = WORKSPACE) -> Dict[str, Any]:
+    groups = []
+    for start in range(0, len(slxs), GROUP_SIZE):
+        members = [s["shortName"] for s in slxs[start:start + GROUP_SIZE]]
+        groups.append({"name": f"group-{start // GROUP_SIZE}", "slxs": members, "dependsOn": []})
+    return {"kind": "Workspace", "metadata": {"name": workspace}, "spec": {"slxGroups": groups}}
+
+
+def runsession(webhook: Dict[str, Any], source: str, workspace: str = WORKSPACE) -> Dict[str, Any]:
+    """The handler's own runsession, carrying *webhook* as its memo."""
+    return {
+        "id": int(RUNSESSION_ID),
+        "personaShortName": PERSONA,
+        "notes": "benchmark",
+        "source": source,
+        "runRequests": [{
+            "id": int(RUNREQUEST_ID),
+            "slxName": f"{workspace}--webhook-handler",
+            "created": "2025-01-01T00:00:00Z",
+            "taskTitles": ["Handle webhook"],
+            "memo": [{"webhookJson": webhook}],
+            "issues": [],
+        }],
+    }
+
+
+class StandInState:
+    """Synthetic workspace plus request counters."""
+
+    def __init__(self, slx_count: int, latency: float = 0.0, page_limit: int = 500):
+        self.slxs = synthetic_slxs(slx_count)
+        self.by_name = {slx["shortName"]: slx for slx in self.slxs}
+        self.config = workspace_yaml(self.slxs)
+        self.runsession: Dict[str, Any] = runsession({}, "benchmark")
+        self.latency = latency
+        self.page_limit = page_limit
+        self.calls: Counter = Counter()
+        self.bytes_sent = 0
+        self.lock = threading.Lock()
+        self.created = 0
+        self._pages: Dict[Tuple[int, int], bytes] = {}
+        self.etag = '"' + hashlib.sha1(str(slx_count).encode()).hexdigest() + '"'
+
+    def reset_counters(self) -> None:
+        with self.lock:
+            self.calls.clear()
+            self.bytes_sent = 0
+
+    def page(self, base: str, offset: int, limit: int) -> bytes:
+        key = (offset, limit)
+        body = self._pages.get(key)
+        if body is None:
+            nxt = offset + limit
+            body = json.dumps({
+                "count": len(self.slxs),
+                "next": f"{base}?limit={limit}&offset={nxt}" if nxt < len(self.slxs) else None,
+                "results": self.slxs[offset:nxt],
+            }).encode()
+            self._pages[key] = body
+        return body
+
+    def task_search(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Up to ten tasks from the scope; scoped searches score higher, as they do for real."""
+        scope = body.get("scope") or [s["shortName"] for s in self.slxs[:10]]
+        score = 0.9 if body.get("scope") else 0.45
+        tasks = []
+        for n, short in enumerate(scope[:10]):
+            tasks.append({
+                "score": round(score - n * 0.01, 3),
+                "workspaceTask": {
+                    "slxShortName": short,
+                    "unresolvedTitle": f"Check health of {short}",
+                    "resolvedTitle": f"Check health of {short}",
+                },
+            })
+        return {"tasks": tasks, "query": body.get("query")}
+
+
+def _template(method: str, path: str) -> str:
+    parts = path.split("/")
+    # /api/v3/workspaces/<ws>/<collection>[/<id>[/...]]
+    if len(parts) > 4:
+        parts[4] = "{workspace}"
+    if len(parts) > 6 and parts[5] in ("slxs", "runsessions", "personas"):
+        parts[6] = "{id}"
+    return f"{method} {'/'.join(parts)}"
+
+
+def make_handler(state: StandInState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and small bodies go out as separate writes
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, code: int, body: Any = None, raw: Optional[bytes] = None, headers: Optional[Dict] = None):
+            data = raw if raw is not None else (b"" if body is None else json.dumps(body).encode())
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(data)
+            with state.lock:
+                state.bytes_sent += len(data)
+
+        def _read_json(self) -> Dict[str, Any]:
+            n = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(n) or b"{}")
+
+        def _begin(self, method: str):
+            if state.latency:
+                time.sleep(state.latency)
+            url = urlparse(self.path)
+            with state.lock:
+                state.calls[_template(method, url.path)] += 1
+            return url, parse_qs(url.query)
+
+        def do_GET(self):
+            url, query = self._begin("GET")
+            path = url.path
+            if path.endswith("/slxs"):
+                if self.headers.get("If-None-Match") == state.etag:
+                    return self._send(304, headers={"ETag": state.etag})
+                offset = int(query.get("offset", ["0"])[0])
+                limit = min(int(query.get("limit", [str(state.page_limit)])[0]), state.page_limit)
+                base = f"http://{self.headers.get('Host')}{path}"
+                return self._send(200, raw=state.page(base, offset, limit), headers={"ETag": state.etag})
+            if "/slxs/" in path:
+                slx = state.by_name.get(path.rsplit("/", 1)[-1])
+                return self._send(200, slx) if slx else self._send(404, {"detail": "not found"})
+            if path.endswith("/workspace.yaml"):
+                return self._send(200, {"asJson": state.config})
+            if "/personas/" in path:
+                return self._send(200, {"name": path.rsplit("/", 1)[-1],
+                                        "spec": {"run": {"confidenceThreshold": 0.7}}})
+            if "/runsessions/" in path:
+                return self._send(200, state.runsession)
+            return self._send(404, {"detail": "not found"})
+
+        def do_POST(self):
+            url, _ = self._begin("POST")
+            body = self._read_json()
+            if url.path.endswith("/task-search"):
+                return self._send(200, state.task_search(body))
+            if url.path.endswith("/runsessions"):
+                with state.lock:
+                    state.created += 1
+                    new_id = 5000 + state.created
+                return self._send(201, {"id": new_id, **body})
+            return self._send(404, {"detail": "not found"})
+
+        def do_PATCH(self):
+            self._begin("PATCH")
+            body = self._read_json()
+            return self._send(200, {"id": int(RUNSESSION_ID), **body})
+
+    return Handler
+
+
+def start(state: StandInState, port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """Serve *state* on a background thread; returns ``(server, RW_WORKSPACE_API_URL)``."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api/v3/workspaces"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slxs", type=int, default=1000)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    server, root = start(StandInState(args.slxs, args.latency_ms / 1000), args.port)
+    print(f"RW_WORKSPACE_API_URL={root}\nRW_WORKSPACE={WORKSPACE}\nRW_SESSION_ID={RUNSESSION_ID}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
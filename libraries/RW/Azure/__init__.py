@@ -1,2 +1,5 @@
 from .azure_alert_parser import Azure
 __all__ = ["Azure"]
+
+from RW.Profiling import profile_library
+profile_library(globals(), "Azure")
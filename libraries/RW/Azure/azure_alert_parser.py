@@ -22,10 +22,11 @@ Supported alert types
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Any, Dict, List, Tuple, Union
 
+from RW.Workspace.json_codec import loads
+
 # ──────────────────────────────────────────────────────────────────────────────
 #  Constants / Look-ups
 # ──────────────────────────────────────────────────────────────────────────────
@@ -165,7 +166,7 @@ def parse_azure_monitor_alert(
     payload: Union[str, Dict[str, Any]]
 ) -> Dict[str, Any]:
     if isinstance(payload, str):
-        payload = json.loads(payload)
+        payload = loads(payload)
     if payload.get("schemaId") != "azureMonitorCommonAlertSchema":
         raise ValueError("Unsupported or missing schemaId")
 
@@ -278,7 +279,7 @@ class Azure:                   # Robot will pick up this class
         Returns a list of entity names found in the KQL query patterns.
         """
         if isinstance(payload, str):
-            payload = json.loads(payload)
+            payload = loads(payload)
 
         entity_names = []
         
@@ -315,7 +316,7 @@ class Azure:                   # Robot will pick up this class
         Returns a tuple of (entity_names, query_text) for better logging.
         """
         if isinstance(payload, str):
-            payload = json.loads(payload)
+            payload = loads(payload)
 
         entity_names = []
         query_text = ""
@@ -5,3 +5,6 @@ Scope: GLOBAL
 """
 
 from .cron_utils import *
+
+from RW.Profiling import profile_library
+profile_library(globals(), "Cron")
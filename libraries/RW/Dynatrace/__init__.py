@@ -1 +1,4 @@
 from .dynatrace_parser import *
+
+from RW.Profiling import profile_library
+profile_library(globals(), "Dynatrace")
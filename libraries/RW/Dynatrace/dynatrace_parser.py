@@ -1,9 +1,10 @@
 # dynatrace_parser.py
 from __future__ import annotations
-import json
 import re
 from typing import Any, Dict, List, Set
 
+from RW.Workspace.json_codec import loads
+
 CLEAN_SUFFIX_RE = re.compile(r"\s+on port \d+$", re.I)
 
 def _clean(raw: str) -> str:
@@ -21,7 +22,7 @@ def _clean(raw: str) -> str:
 def parse_dynatrace_entities(payload: str | Dict[str, Any]) -> List[str]:
     """Return a unique list of cleaned entity names (best-guess order)."""
     if isinstance(payload, str):
-        payload = json.loads(payload)
+        payload = loads(payload)
 
     candidates: Set[str] = set()
 
@@ -1,5 +1,8 @@
 import json, requests
 from RW import platform
+from RW.Workspace.http_session import get_anonymous_session
+from RW.Workspace.json_codec import response_json
+from RW.Workspace.retry_policy import request_with_retry
 
 
 def create_github_issue(title, body, github_token: platform.Secret, repo, github_server="https://api.github.com"):
@@ -13,6 +16,6 @@ def create_github_issue(title, body, github_token: platform.Secret, repo, github
         "title": title,
         "body": body
     }
-    response = requests.post(url, headers=headers, json=data)
+    response = request_with_retry(get_anonymous_session(url), "POST", url, headers=headers, json=data)
     response.raise_for_status()
-    return response.json()
\ No newline at end of file
+    return response_json(response)
\ No newline at end of file
@@ -4,13 +4,15 @@ PagerDuty keyword library for performing tasks for interacting with PagerDuty in
 Scope: Global
 """
 
-import re, logging, json, jmespath, requests, os
+import re, logging, json, requests, os
 from datetime import datetime
 from robot.libraries.BuiltIn import BuiltIn
 
 from RW import platform
-from RW.Core import Core
-from RW.Workspace import workspace_utils
+from RW.Workspace.endpoints import normalize_workspace_path
+from RW.Workspace.http_session import get_anonymous_session
+from RW.Workspace.json_codec import response_json
+from RW.Workspace.retry_policy import request_with_retry
 
 
 logger = logging.getLogger(__name__)
@@ -42,9 +44,9 @@ def get_user_email(
     url = f"https://api.pagerduty.com/users/{userid}"
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)  # Increased timeout from 10 to 30 seconds
+        response = request_with_retry(get_anonymous_session(url), "GET", url, headers=headers, timeout=30)  # Increased timeout from 10 to 30 seconds
         if response.status_code == 200:
-            user_data = response.json()
+            user_data = response_json(response)
             email = user_data.get('user', {}).get('email')
             return email
     except requests.exceptions.RequestException as e:
@@ -66,10 +68,13 @@ def add_runsession_note_to_incident(
         email: email address of the userID 
     """
 
+    # Imported on use so it does not also become an RW.PagerDuty keyword
+    from RW.Workspace.endpoints import import_platform_variable
+
     try:
-        rw_runsession = workspace_utils.import_platform_variable("RW_SESSION_ID")
-        rw_workspace = workspace_utils.import_platform_variable("RW_WORKSPACE")
-        rw_workspace_api_url = workspace_utils.import_platform_variable("RW_WORKSPACE_API_URL")
+        rw_runsession = import_platform_variable("RW_SESSION_ID")
+        rw_workspace = import_platform_variable("RW_WORKSPACE")
+        rw_workspace_api_url = import_platform_variable("RW_WORKSPACE_API_URL")
     except ImportError:
         BuiltIn().log(f"Failure importing required variables", level='WARN')
         return None
@@ -81,12 +86,7 @@ def add_runsession_note_to_incident(
 
     app_url = rw_workspace_api_url.replace("papi", "app").split("/api")[0]
     
-    # Handle case where rw_workspace might already include "workspaces/" prefix
-    workspace_path = rw_workspace.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    runsession_url=f"{app_url}/map/{workspace_path}?selectedRunSessions={rw_runsession}"
+    runsession_url=f"{app_url}/map/{normalize_workspace_path(rw_workspace)}?selectedRunSessions={rw_runsession}"
 
 
     headers = {
@@ -104,7 +104,7 @@ def add_runsession_note_to_incident(
     url = f"https://api.pagerduty.com/incidents/{incidentid}/notes"
 
     try:
-        response = requests.post(url, json=note, headers=headers, timeout=30)  # Increased timeout from 10 to 30 seconds
+        response = request_with_retry(get_anonymous_session(url), "POST", url, json=note, headers=headers, timeout=30)  # Increased timeout from 10 to 30 seconds
         if response.status_code == 200:
             return response
     except requests.exceptions.RequestException as e:
@@ -0,0 +1,48 @@
+"""
+Opt-in profiling of RW keyword libraries.
+
+Not a keyword library itself: the RW libraries call `profile_library` from
+their ``__init__`` and it does nothing unless RW_PROFILE is set. The
+profiler itself (`keyword_profiler`) is only imported for a library that is
+actually profiled.
+"""
+
+import os
+import sys
+from typing import Any, Dict
+
+from robot.api.deco import not_keyword
+
+_OFF = ("", "0", "false", "no", "off")
+_ALL = ("1", "true", "yes", "on", "all")
+
+
+def _setting(name: str, default: str) -> str:
+    """Environment variable *name*, else Robot variable ``${name}``, else *default*."""
+    value = os.getenv(name)
+    # Only ask Robot when it is actually running; don't import it just to look
+    if value is None and "robot.running" in sys.modules:
+        try:
+            from robot.libraries.BuiltIn import BuiltIn
+            value = BuiltIn().get_variable_value("${%s}" % name)
+        except Exception:
+            value = None
+    return default if value is None else str(value).strip()
+
+
+def _enabled_for(library: str) -> bool:
+    wanted = _setting("RW_PROFILE", "").lower()
+    if wanted in _OFF:
+        return False
+    if wanted in _ALL:
+        return True
+    return library.lower() in {w.strip() for w in wanted.split(",")}
+
+
+@not_keyword
+def profile_library(namespace: Dict[str, Any], library: str) -> None:
+    """Wrap *library*'s keywords with profiling when RW_PROFILE selects it (see `keyword_profiler`)."""
+    if not _enabled_for(library):
+        return
+    from .keyword_profiler import profile_library as _profile_library
+    _profile_library(namespace, library)
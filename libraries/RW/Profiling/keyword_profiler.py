@@ -0,0 +1,257 @@
+"""
+Opt-in profiling around RW keyword entry points.
+
+Set RW_PROFILE (environment variable or Robot variable, e.g.
+``robot -v RW_PROFILE:Workspace,RunSession``) to ``1``/``all`` or a
+comma-separated list of library names. Each keyword call of those libraries
+is then run under cProfile while a sampling thread records its stacks; the
+Robot log gets the top RW_PROFILE_TOP functions by cumulative time plus links
+to the raw ``.prof`` file (for snakeviz / pstats) and a collapsed-stack
+``.folded`` file (for flamegraph.pl / speedscope), written under
+RW_PROFILE_DIR (default ``${OUTPUT_DIR}/rw-profiles``).
+
+When RW_PROFILE is unset, `profile_library` returns at import time and the
+keywords are left untouched, so there is no per-call cost.
+"""
+
+import functools
+import inspect
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+from robot.api.deco import not_keyword
+
+from . import _enabled_for, _setting
+
+# Hybrid/dynamic library API and listener methods are not keywords
+_LIBRARY_API = {
+    "get_keyword_names",
+    "run_keyword",
+    "get_keyword_arguments",
+    "get_keyword_types",
+    "get_keyword_tags",
+    "get_keyword_documentation",
+    "get_keyword_source",
+    "close",
+}
+
+_MAX_STACK_DEPTH = 128
+
+
+class _Settings:
+    """Internal: profiling knobs, read once when the first library opts in."""
+
+    def __init__(self):
+        self.top = int(_setting("RW_PROFILE_TOP", "30"))
+        self.interval = float(_setting("RW_PROFILE_INTERVAL_MS", "5")) / 1000
+        self.output_dir = _setting("RW_PROFILE_DIR", "")
+        self.robot_output_dir: Optional[str] = None
+        if "robot.running" in sys.modules:
+            try:
+                from robot.libraries.BuiltIn import BuiltIn
+                self.robot_output_dir = BuiltIn().get_variable_value("${OUTPUT_DIR}")
+            except Exception:
+                self.robot_output_dir = None
+        if not self.output_dir:
+            self.output_dir = os.path.join(self.robot_output_dir or os.getcwd(), "rw-profiles")
+
+
+_SETTINGS: Optional[_Settings] = None
+_STATE = threading.local()
+_SEQUENCE = iter(range(1, sys.maxsize))
+_SEQUENCE_LOCK = threading.Lock()
+_WRAPPER_CODES: set = set()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Stack sampling (collapsed stacks for flamegraphs)
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _collapse(frame) -> str:
+    """``root;...;leaf`` for *frame*, cut at the profiling wrapper when it is on the stack."""
+    labels = []
+    while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+        if frame.f_code in _WRAPPER_CODES:
+            break
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class _StackSampler(threading.Thread):
+    """Internal: samples one thread's stack every *interval* seconds."""
+
+    def __init__(self, target: int, interval: float):
+        super().__init__(name="rw-profile-sampler", daemon=True)
+        self.target = target
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        while not self._done.wait(self.interval):
+            frame = sys._current_frames().get(self.target)
+            if frame is not None:
+                self.stacks[_collapse(frame)] += 1
+
+    def finish(self) -> Counter:
+        self._done.set()
+        self.join()
+        return self.stacks
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# One profiled keyword call
+# ──────────────────────────────────────────────────────────────────────────────
+
+class _ProfileRun:
+    """Internal: cProfile plus stack sampler around one keyword call."""
+
+    def __init__(self, label: str):
+        import cProfile
+
+        self.label = label
+        self.profiler = cProfile.Profile()
+        self.sampler = _StackSampler(threading.get_ident(), _SETTINGS.interval)
+        self.started = 0.0
+
+    def start(self) -> bool:
+        try:
+            self.profiler.enable()
+        except ValueError:
+            # Another profiler (coverage, a debugger) already owns this thread
+            return False
+        _STATE.active = True
+        self.sampler.start()
+        self.started = time.perf_counter()
+        return True
+
+    def finish(self) -> None:
+        self.profiler.disable()
+        elapsed = time.perf_counter() - self.started
+        stacks = self.sampler.finish()
+        _STATE.active = False
+        try:
+            _report(self.label, elapsed, self.profiler, stacks)
+        except Exception as e:
+            from robot.api import logger
+            logger.warn(f"Could not write profile for {self.label}: {e}")
+
+
+def _write_outputs(label: str, profiler, stacks: Counter) -> Dict[str, str]:
+    with _SEQUENCE_LOCK:
+        sequence = next(_SEQUENCE)
+    os.makedirs(_SETTINGS.output_dir, exist_ok=True)
+    safe_label = re.sub(r"[^\w.-]", "_", label)
+    stem = os.path.join(_SETTINGS.output_dir, f"{sequence:03d}-{safe_label}")
+    paths = {"prof": stem + ".prof"}
+    profiler.dump_stats(paths["prof"])
+    if stacks:
+        paths["folded"] = stem + ".folded"
+        with open(paths["folded"], "w", encoding="utf-8") as fh:
+            for stack, count in stacks.most_common():
+                fh.write(f"{stack} {count}\n")
+    return paths
+
+
+def _link(path: str) -> str:
+    href = path
+    if _SETTINGS.robot_output_dir:
+        href = os.path.relpath(path, _SETTINGS.robot_output_dir)
+    return f'<a href="{_escape(href)}">{_escape(os.path.basename(path))}</a>'
+
+
+def _escape(value: str) -> str:
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def _report(label: str, elapsed: float, profiler, stacks: Counter) -> None:
+    import io
+    import pstats
+
+    from robot.api import logger
+
+    buf = io.StringIO()
+    pstats.Stats(profiler, stream=buf).strip_dirs().sort_stats("cumulative").print_stats(_SETTINGS.top)
+    paths = _write_outputs(label, profiler, stacks)
+    links = " ".join(_link(p) for p in paths.values())
+    logger.info(
+        f"<b>Profile of {_escape(label)}</b>: {elapsed * 1000:.1f} ms, "
+        f"{sum(stacks.values())} stack samples. {links}"
+        f"<pre>{_escape(buf.getvalue().strip())}</pre>",
+        html=True,
+    )
+
+
+def _profiled(fn: Callable, label: str) -> Callable:
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            if getattr(_STATE, "active", False):
+                return await fn(*args, **kwargs)
+            run = _ProfileRun(label)
+            if not run.start():
+                return await fn(*args, **kwargs)
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                run.finish()
+
+        _WRAPPER_CODES.add(async_wrapper.__code__)
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        # Keywords calling keywords are covered by the outermost profile
+        if getattr(_STATE, "active", False):
+            return fn(*args, **kwargs)
+        run = _ProfileRun(label)
+        if not run.start():
+            return fn(*args, **kwargs)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            run.finish()
+
+    _WRAPPER_CODES.add(wrapper.__code__)
+    return wrapper
+
+
+def _is_keyword(name: str, obj: Any) -> bool:
+    return not name.startswith("_") and not getattr(obj, "robot_not_keyword", False)
+
+
+@not_keyword
+def profile_library(namespace: Dict[str, Any], library: str) -> None:
+    """
+    Wrap the keywords in a library package's *namespace* (its ``globals()``)
+    with profiling when RW_PROFILE selects *library*. Covers module-level
+    keyword functions and the public methods of library classes defined in
+    the package; anything imported from elsewhere is left alone.
+    """
+    global _SETTINGS
+    if not _enabled_for(library):
+        return
+    if _SETTINGS is None:
+        _SETTINGS = _Settings()
+
+    package = namespace["__name__"] + "."
+    for name, obj in list(namespace.items()):
+        if not _is_keyword(name, obj) or not getattr(obj, "__module__", "").startswith(package):
+            continue
+        if inspect.isclass(obj):
+            for attr, member in list(vars(obj).items()):
+                if inspect.isfunction(member) and _is_keyword(attr, member) and attr not in _LIBRARY_API:
+                    setattr(obj, attr, _profiled(member, f"{library}.{attr}"))
+        elif inspect.isfunction(obj):
+            namespace[name] = _profiled(obj, f"{library}.{name}")
@@ -1 +1,4 @@
-from .runsession_utils import *
\ No newline at end of file
+from .runsession_utils import *
+
+from RW.Profiling import profile_library
+profile_library(globals(), "RunSession")
@@ -1,13 +1,18 @@
-import re, logging, json, jmespath, requests, os
+import re, logging, json, requests, os
+import copy
 from datetime import datetime
 from robot.libraries.BuiltIn import BuiltIn
 from collections import Counter
 from collections import defaultdict
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union
 
-from RW.Core import Core
 from RW import platform
-from RW.Workspace import import_platform_variable
+from RW.Workspace.endpoints import import_platform_variable, normalize_workspace_path, workspace_endpoints
+from RW.Workspace.json_codec import loads, response_json
+from RW.Workspace.retry_policy import request_with_retry
+from RW.Workspace.runsession_cache import parse_runsession_json
+# Aliased so it does not also become an RW.RunSession keyword
+from RW.Workspace.runsession_cache import invalidate_runsession_cache as _invalidate_runsession_cache
 
 
 logger = logging.getLogger(__name__)
@@ -18,6 +23,17 @@ SHELL_HISTORY: list[str] = []
 SECRET_PREFIX = "secret__"
 SECRET_FILE_PREFIX = "secret_file__"
 
+# Resource names are quoted in issue titles with backticks, e.g. "Pod `web-1` restarting"
+_BACKTICKED = re.compile(r'`(.*?)`')
+
+# runRequest field -> runsession source, checked in this order
+_SOURCE_KEYS = (
+    ("fromSearchQuery", "searchQuery"),
+    ("fromIssue", "issue"),
+    ("fromSliAlert", "sliAlert"),
+    ("fromAlert", "alert"),
+)
+
 
 def get_runsession_url(rw_runsession=None):
     """Return a direct link to the RunSession."""
@@ -30,12 +46,7 @@ def get_runsession_url(rw_runsession=None):
         BuiltIn().log(f"Failure getting required variables", level='WARN')
         return None
 
-    # Handle case where rw_workspace might already include "workspaces/" prefix
-    workspace_path = rw_workspace.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    runsession_url = f"{rw_workspace_app_url}/map/{workspace_path}?selectedRunSessions={rw_runsession}"
+    runsession_url = f"{rw_workspace_app_url}/map/{normalize_workspace_path(rw_workspace)}?selectedRunSessions={rw_runsession}"
     return runsession_url
 
 def get_runsession_source(payload: dict) -> str:
@@ -53,56 +64,61 @@ def get_runsession_source(payload: dict) -> str:
     if "source" in payload:
         return payload["source"]
 
-    # 2) Otherwise, examine runRequests
+    # 2) Otherwise, examine the earliest runRequest by created time
     run_requests = payload.get("runRequests", [])
     if not run_requests:
         return "Unknown"
+    return _request_source(min(run_requests, key=_created_at))
+
 
-    # Sort runRequests by created time to find the earliest
-    def _parse_iso_datetime(dt: str) -> datetime:
-        # '2025-02-11T08:49:06.773513Z' -> parse with replacement of 'Z' to '+00:00'
-        return datetime.fromisoformat(dt.replace("Z", "+00:00"))
-
-    sorted_requests = sorted(run_requests, key=lambda rr: _parse_iso_datetime(rr["created"]))
-    earliest_rr = sorted_requests[0]
-
-    # 3) Check the relevant fields in the earliest runRequest
-    source_keys = ["fromSearchQuery", "fromIssue", "fromSliAlert", "fromAlert"]
-    for key in source_keys:
-        val = earliest_rr.get(key)
-        if val:
-            # "fromSearchQuery" -> "searchQuery"
-            # "fromIssue"       -> "issue"
-            # "fromSliAlert"    -> "sliAlert"
-            # "fromAlert"       -> "alert"
-            stripped = key[4:]  # removes "from", leaving e.g. "SearchQuery"
-            # optionally lowercase the first character:
-            stripped = stripped[0].lower() + stripped[1:]
-            return stripped
-    # 4) If no source found
+def _created_at(run_request: dict) -> datetime:
+    # '2025-02-11T08:49:06.773513Z' -> parse with replacement of 'Z' to '+00:00'
+    return datetime.fromisoformat(run_request["created"].replace("Z", "+00:00"))
+
+
+def _request_source(run_request: dict) -> str:
+    """The source named by the first `from*` field set on *run_request* (fromIssue -> "issue"), else "Unknown"."""
+    for key, source in _SOURCE_KEYS:
+        if run_request.get(key):
+            return source
     return "Unknown"
 
 
-def count_open_issues(data: str):
+# The analysis keywords below take the runsession either as the JSON string
+# returned by Import Runsession Details / Import Related RunSession Details
+# or as the dict from Parse RunSession. Either way it is decoded at most once.
+# The dict parsed from text is shared between keywords, so nothing from it is
+# handed back to Robot uncopied (see _private).
+RunSessionData = Union[str, Dict[str, Any]]
+
+
+def _private(data: RunSessionData, value: Any) -> Any:
+    """Internal: *value* taken from the runsession *data*, copied when *data* was text."""
+    return value if isinstance(data, dict) else copy.deepcopy(value)
+
+
+def parse_runsession(data: RunSessionData) -> Dict[str, Any]:
+    """
+    Return the runsession *data* as a dictionary, for reading fields such as
+    ``${session["id"]}`` and for passing to the other RunSession keywords.
+    The dictionary belongs to the caller and may be modified.
+    """
+    if isinstance(data, dict):
+        return data
+    # Decoding again is cheaper than deep-copying the shared parse
+    return loads(data)
+
+
+def count_open_issues(data: RunSessionData):
     """Return a count of issues that have not been closed."""
     open_issues = 0 
-    runsession = json.loads(data) 
+    runsession = parse_runsession_json(data)
     for run_request in runsession.get("runRequests", []):
         for issue in run_request.get("issues", []): 
             if not issue["closed"]:
                 open_issues+=1
     return(open_issues)
 
-def get_open_issues(data: str):
-    """Return a count of issues that have not been closed."""
-    open_issue_list = []
-    runsession = json.loads(data) 
-    for run_request in runsession.get("runRequests", []):
-        for issue in run_request.get("issues", []): 
-            if not issue["closed"]:
-                open_issue_list.append(issue)
-    return open_issue_list
-
 def generate_open_issue_markdown_table(data_list):
     """Generates a markdown report sorted by severity."""
     severity_mapping = {1: "🔥 Critical", 2: "🔴 High", 3: "⚠️ Medium", 4: "ℹ️ Low"}
@@ -110,42 +126,42 @@ def generate_open_issue_markdown_table(data_list):
     # Sort data by severity (ascending order)
     sorted_data = sorted(data_list, key=lambda x: x.get("severity", 4))
     
-    markdown_output = "-----\n"
+    parts = ["-----\n"]
     for data in sorted_data:
         severity = severity_mapping.get(data.get("severity", 4), "Unknown")
         title = data.get("title", "N/A")
         next_steps = data.get("nextSteps", "N/A").strip()
         details = data.get("details", "N/A")
         
-        markdown_output += f"#### {title}\n\n- **Severity:** {severity}\n\n- **Next Steps:**\n{next_steps}\n\n"
-        markdown_output += f"- **Details:**\n```json\n- {details}\n```\n\n"
+        parts.append(f"#### {title}\n\n- **Severity:** {severity}\n\n- **Next Steps:**\n{next_steps}\n\n")
+        parts.append(f"- **Details:**\n```json\n- {details}\n```\n\n")
     
-    return markdown_output
+    return "".join(parts)
 
-def get_open_issues(data: str):
+def get_open_issues(data: RunSessionData):
     """Return a count of issues that have not been closed."""
     open_issue_list = []
-    runsession = json.loads(data) 
+    runsession = parse_runsession_json(data)
     for run_request in runsession.get("runRequests", []):
         for issue in run_request.get("issues", []): 
             if not issue["closed"]:
                 open_issue_list.append(issue)
-    return open_issue_list
+    return _private(data, open_issue_list)
 
-def summarize_runsession_users(data: str, output_format: str = "text") -> str:
+def summarize_runsession_users(data: RunSessionData, output_format: str = "text") -> str:
     """
-    Parse a JSON string representing a RunWhen 'runsession' object
-    (with 'runRequests' entries), gather the unique participants and
+    Take a RunWhen 'runsession' object (JSON string or dict, with
+    'runRequests' entries), gather the unique participants and
     the engineering assistants involved, and return a summary in either
     plain text or Markdown format.
 
-    :param data: JSON string with top-level 'runRequests' list, each item
+    :param data: JSON string or dict with top-level 'runRequests' list, each item
                  possibly containing 'requester' and 'persona->spec->fullName'.
     :param output_format: "text" or "markdown" (default: "text").
     :return: A string summarizing the participants and engineering assistants.
     """
     try:
-        runsession = json.loads(data)
+        runsession = parse_runsession_json(data)
     except json.JSONDecodeError:
         # If the payload is not valid JSON, handle or raise
         return "Error: Could not decode JSON from input."
@@ -156,24 +172,32 @@ def summarize_runsession_users(data: str, output_format: str = "text") -> str:
 
     # Gather data from each runRequest if present
     for request in runsession.get("runRequests", []):
-        # Extract persona full name
-        persona = request.get("persona") or {}
-        spec = persona.get("spec") or {}
-        persona_full_name = spec.get("fullName", "Unknown")
+        requester, persona_full_name = _request_people(request)
+        participants.add(requester)
+        engineering_assistants.add(persona_full_name)
 
-        # Extract requester
-        requester = request.get("requester")
-        if not requester:
-            requester = "Unknown"
+    return _format_users(participants, engineering_assistants, output_format)
 
-        # Normalize system requesters
-        if "@workspaces.runwhen.com" in requester:
-            requester = "RunWhen System"
 
-        # Add to sets
-        participants.add(requester)
-        engineering_assistants.add(persona_full_name)
+def _request_people(request: dict):
+    """(requester, engineering assistant full name) of a runRequest, "Unknown" when missing."""
+    # Extract persona full name
+    persona = request.get("persona") or {}
+    spec = persona.get("spec") or {}
+    persona_full_name = spec.get("fullName", "Unknown")
+
+    # Extract requester
+    requester = request.get("requester")
+    if not requester:
+        requester = "Unknown"
 
+    # Normalize system requesters
+    if "@workspaces.runwhen.com" in requester:
+        requester = "RunWhen System"
+    return requester, persona_full_name
+
+
+def _format_users(participants, engineering_assistants, output_format: str) -> str:
     # Format output
     if output_format.lower() == "markdown":
         # Construct a Markdown list
@@ -198,8 +222,8 @@ def summarize_runsession_users(data: str, output_format: str = "text") -> str:
             text_lines.append(f"  - {assistant}")
         return "\n".join(text_lines)
 
-def extract_issue_keywords(data: str):
-    runsession = json.loads(data) 
+def extract_issue_keywords(data: RunSessionData):
+    runsession = parse_runsession_json(data)
     issue_keywords = set()
     
     for request in runsession.get("runRequests", []):
@@ -207,13 +231,13 @@ def extract_issue_keywords(data: str):
         
         for issue in issues:
             if not issue.get("closed", False):
-                matches = re.findall(r'`(.*?)`', issue.get("title", ""))
+                matches = _BACKTICKED.findall(issue.get("title", ""))
                 issue_keywords.update(matches)
     
     return list(issue_keywords)
 
-def get_most_referenced_resource(data: str):
-    runsession = json.loads(data) 
+def get_most_referenced_resource(data: RunSessionData):
+    runsession = parse_runsession_json(data)
     
     keyword_counter = Counter()
     
@@ -221,13 +245,78 @@ def get_most_referenced_resource(data: str):
         issues = request.get("issues", [])
         
         for issue in issues:
-            matches = re.findall(r'`(.*?)`', issue.get("title", ""))
+            matches = _BACKTICKED.findall(issue.get("title", ""))
             keyword_counter.update(matches)
     
     most_common_resource = keyword_counter.most_common(1)
     
     return most_common_resource[0][0] if most_common_resource else "No keywords found"
 
+
+def summarize_runsession(data: RunSessionData, output_format: str = "text") -> Dict[str, Any]:
+    """
+    Everything the notification runbooks report about a runsession, from a
+    single pass over its runRequests and issues:
+
+    - ``id``
+    - ``open_issue_count`` / ``open_issues`` – as Count Open Issues / Get Open Issues
+    - ``issue_keywords`` – backticked names in open issue titles, first seen first
+    - ``most_referenced_resource`` – as Get Most Referenced Resource
+    - ``participants`` / ``engineering_assistants`` – sorted names
+    - ``users`` – Summarize RunSession Users text in *output_format* ("text" or "markdown")
+    - ``source`` – as Get RunSession Source
+
+    Issues without a ``closed`` field count as open.
+    """
+    runsession = parse_runsession_json(data)
+    run_requests = runsession.get("runRequests") or []
+    need_source = "source" not in runsession
+
+    open_issues = []
+    issue_keywords: Dict[str, None] = {}  # insertion-ordered set
+    referenced: Dict[str, int] = {}       # a plain dict: Counter.update costs more per call
+    participants = set()
+    engineering_assistants = set()
+    earliest = earliest_created = None
+
+    for request in run_requests:
+        if need_source:
+            created = _created_at(request)
+            if earliest is None or created < earliest_created:
+                earliest, earliest_created = request, created
+        requester, persona_full_name = _request_people(request)
+        participants.add(requester)
+        engineering_assistants.add(persona_full_name)
+
+        for issue in request.get("issues") or []:
+            title = issue.get("title") or ""
+            names = _BACKTICKED.findall(title) if "`" in title else ()
+            for name in names:
+                referenced[name] = referenced.get(name, 0) + 1
+            if not issue.get("closed", False):
+                open_issues.append(issue)
+                for name in names:
+                    issue_keywords[name] = None
+
+    if not need_source:
+        source = runsession["source"]
+    else:
+        source = _request_source(earliest) if earliest is not None else "Unknown"
+    # First name with the highest count, as Counter.most_common(1) picks it
+    most_referenced = max(referenced.items(), key=lambda item: item[1])[0] if referenced else "No keywords found"
+
+    return {
+        "id": runsession.get("id"),
+        "open_issue_count": len(open_issues),
+        "open_issues": _private(data, open_issues),
+        "issue_keywords": list(issue_keywords),
+        "most_referenced_resource": most_referenced,
+        "participants": sorted(participants),
+        "engineering_assistants": sorted(engineering_assistants),
+        "users": _format_users(participants, engineering_assistants, output_format),
+        "source": source,
+    }
+
 def create_runsession_from_task_search(
     *,
     search_response: dict,
@@ -255,17 +344,9 @@ def create_runsession_from_task_search(
         BuiltIn().log(f"[create_runsession] env var missing: {e}", level="WARN")
         return {}
 
-    # Handle case where rw_workspace might already include "workspaces/" prefix
-    workspace_path = rw_workspace.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-    
-    # Handle case where rw_api_url might already include "/workspaces" suffix
-    base_url = rw_api_url.rstrip('/')
-    if base_url.endswith('/workspaces'):
-        url = f"{base_url}/{workspace_path}/runsessions"
-    else:
-        url = f"{base_url}/workspaces/{workspace_path}/runsessions"
+    ep = workspace_endpoints(rw_api_url, rw_workspace)
+    workspace_path = ep.workspace_path
+    url = ep.runsessions()
 
     # ── 1. Convert tasks → runRequests ─────────────────────────────────────
     tasks: List[dict] = search_response.get("tasks", [])
@@ -338,23 +419,18 @@ def create_runsession_from_task_search(
         }
         body["dedupe_config"] = dedupe_config
 
-    # ── 3. Auth headers ────────────────────────────────────────────────────
-    if api_token:
-        sess = requests.Session()
-        sess.headers["Authorization"] = f"Bearer {api_token.value}"
-    elif os.getenv("RW_USER_TOKEN"):
-        sess = requests.Session()
-        sess.headers["Authorization"] = f"Bearer {os.environ['RW_USER_TOKEN']}"
-    else:
-        # inside a runbook/runtime – session already carries auth headers
-        sess = platform.get_authenticated_session()
+    # ── 3. Auth headers (api_token › RW_USER_TOKEN › platform session) ─────
+    sess = ep.session(api_token)
 
     # ── 4. POST ────────────────────────────────────────────────────────────
     headers = {"Content-Type": "application/json"}
     try:
-        resp = sess.post(url, json=body, headers=headers, timeout=30)  # Increased timeout from 10 to 30 seconds
+        resp = request_with_retry(sess, "POST", url, json=body, headers=headers, timeout=30)  # Increased timeout from 10 to 30 seconds
         resp.raise_for_status()
-        return resp.json()
+        created = response_json(resp)
+        if isinstance(created, dict) and created.get("id") is not None:
+            _invalidate_runsession_cache(str(created["id"]))
+        return created
     except requests.RequestException as e:
         BuiltIn().log(
             f"[create_runsession] POST failed: "
@@ -374,43 +450,21 @@ def get_persona_details(
     :return: Parsed JSON response of the persona configuration.
     """
     try:
-        rw_workspace = import_platform_variable("RW_WORKSPACE")
-        rw_workspace_api_url = import_platform_variable("RW_WORKSPACE_API_URL")
+        ep = workspace_endpoints()
     except ImportError as e:
         BuiltIn().log(f"Missing required platform variables: {e}", level="WARN")
         return {}
 
-    # Handle case where rw_workspace might already include "workspaces/" prefix
-    workspace_path = rw_workspace.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    # Handle case where rw_workspace_api_url might already include "/workspaces" suffix
-    base_url = rw_workspace_api_url.rstrip('/')
-    if base_url.endswith('/workspaces'):
-        url = f"{base_url}/{workspace_path}/personas/{persona}"
-    else:
-        url = f"{base_url}/workspaces/{workspace_path}/personas/{persona}"
-
-    user_token = os.getenv("RW_USER_TOKEN")
-    if user_token:
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {user_token}"
-        }
-        session = requests.Session()
-        session.headers.update(headers)
-    else:
-        session = platform.get_authenticated_session()
-
+    url = ep.url("personas", persona)
+    session = ep.session()
 
     try:
-        response = session.get(url, timeout=30, verify=platform.REQUEST_VERIFY)  # Increased timeout from 10 to 30 seconds
+        response = request_with_retry(session, "GET", url, timeout=30, verify=platform.REQUEST_VERIFY)  # Increased timeout from 10 to 30 seconds
         response.raise_for_status()
-        return response.json()
+        return response_json(response)
     except (requests.RequestException, json.JSONDecodeError) as e:
         BuiltIn().log(f"Persona fetch failed: {e}", level="WARN")
-        platform_logger.exception(e)
+        logger.exception(e)
         return {}
 
 def add_tasks_to_runsession_from_search(
@@ -452,6 +506,8 @@ def add_tasks_to_runsession_from_search(
     except ImportError as e:
         BuiltIn().log(f"[patch_runsession] Missing env var: {e}", level="WARN")
         return {}
+    ep = workspace_endpoints(rw_api_url, rw_workspace)
+    workspace_path = ep.workspace_path
 
     # ── 1. Filter tasks by score ───────────────────────────────────────────
     tasks = search_response.get("tasks", [])
@@ -501,37 +557,19 @@ def add_tasks_to_runsession_from_search(
         return patch_body
 
     # ── 3. PATCH the RunSession ──────────────────────────────────────────────
-    base = rw_api_url.rstrip("/")                #  ➜ “…/api/v3”  or “…/api/v3/workspaces”
-    if not base.endswith("/workspaces"):
-        base += "/workspaces" 
-    # Handle case where rw_workspace might already include "workspaces/" prefix
-    workspace_path = rw_workspace.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    # Handle case where rw_api_url might already include "/workspaces" suffix
-    if base.endswith('/workspaces'):
-        url = f"{base}/{workspace_path}/runsessions/{runsession_id}"
-    else:
-        url = f"{base}/workspaces/{workspace_path}/runsessions/{runsession_id}"
+    url = ep.runsessions(runsession_id)
 
     # ── 3a. Choose auth method ------------------------------------------------
     if api_token is not None:
         # explicit platform.Secret
-        session = requests.Session()
-        session.headers.update({"Authorization": f"Bearer {api_token.value}"})
         BuiltIn().log("[patch_runsession] using api_token parameter", level="INFO")
-
     elif os.getenv("RW_USER_TOKEN"):
         # local dev or ad-hoc run
-        session = requests.Session()
-        session.headers.update({"Authorization": f"Bearer {os.environ['RW_USER_TOKEN']}"})
         BuiltIn().log("[patch_runsession] using RW_USER_TOKEN from env", level="INFO")
-
     else:
         # inside a runbook/runtime – session already carries auth headers
-        session = platform.get_authenticated_session()
         BuiltIn().log("[patch_runsession] using platform authenticated session", level="INFO")
+    session = ep.session(api_token)
 
     headers = {"Content-Type": "application/json"}
 
@@ -542,9 +580,10 @@ def add_tasks_to_runsession_from_search(
     )
 
     try:
-        resp = session.patch(url, json=patch_body, headers=headers, timeout=30)  # Increased timeout from 10 to 30 seconds
+        resp = request_with_retry(session, "PATCH", url, json=patch_body, headers=headers, timeout=30)  # Increased timeout from 10 to 30 seconds
         resp.raise_for_status()
-        return resp.json()
+        _invalidate_runsession_cache(runsession_id)
+        return response_json(resp)
     except requests.RequestException as e:
         BuiltIn().log(f"[patch_runsession] PATCH failed: {e}", level="WARN")
         return {}
@@ -2,6 +2,8 @@
 
 import requests
 from RW import platform
+from RW.Workspace.http_session import get_anonymous_session
+from RW.Workspace.retry_policy import request_with_retry
 from robot.api.deco import keyword
 from robot.libraries.BuiltIn import BuiltIn
 
@@ -42,7 +44,8 @@ class Slack:
             payload["text"] = text
 
         try:
-            response = requests.post(webhook_url.value, json=payload, timeout=30)  # Increased timeout from 10 to 30 seconds
+            session = get_anonymous_session(webhook_url.value)
+            response = request_with_retry(session, "POST", webhook_url.value, json=payload, timeout=30)  # Increased timeout from 10 to 30 seconds
             if response.status_code != 200:
                 raise AssertionError(
                     f"Error sending Slack message: {response.status_code} - {response.text}"
@@ -1,2 +1,51 @@
-from .workspace_utils import *
-from .slx_utils import *
\ No newline at end of file
+"""
+RW.Workspace keyword library.
+
+The keyword modules load on first use of a package attribute – in a Robot
+run that is the `Workspace` library class – so the RW libraries that only
+need the HTTP helpers (`RW.Workspace.endpoints`, `.http_session`,
+`.retry_policy`) don't import every Workspace keyword module with them.
+Even then the async client, the HTTP metrics store and the SLX catalog and
+index stay unloaded until a keyword needs them (see `lazy_keywords` and
+`slx_catalog`).
+"""
+
+import importlib
+
+# Keyword modules whose public names make up this package's namespace
+_KEYWORD_MODULES = ("workspace_utils", "slx_utils", "lazy_keywords")
+_LOADED = False
+
+
+def _load_keywords() -> None:
+    """Internal: the equivalent of ``from .<module> import *`` for each keyword module."""
+    global _LOADED
+    if _LOADED:
+        return
+    _LOADED = True
+    namespace = globals()
+    for name in _KEYWORD_MODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        public = getattr(module, "__all__", None) or [n for n in vars(module) if not n.startswith("_")]
+        namespace.update((n, getattr(module, n)) for n in public)
+
+    from .workspace_library import Workspace
+    namespace["Workspace"] = Workspace
+
+    from RW.Profiling import profile_library
+    profile_library(namespace, "Workspace")
+
+
+def __getattr__(name: str):
+    if name.startswith("__") or _LOADED:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _load_keywords()
+    try:
+        return globals()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__():
+    _load_keywords()
+    return sorted(globals())
@@ -0,0 +1,411 @@
+"""
+Asyncio client for the Workspace API behind the async keyword variants
+(defined in `lazy_keywords`, which imports this module on first use).
+
+Robot Framework 6.1+ runs `async def` keywords on its event loop, so these
+keywords let a handler overlap many API calls (SLX pages, task searches,
+runsession reads and writes) without managing threads itself.
+
+Transport:
+  • aiohttp (``pip install rw-workspace-utils[async]``) – one pooled
+    `ClientSession` per event loop, with the shared retry policy and per-host
+    circuit breakers applied natively.
+  • otherwise each request runs on a worker thread through the pooled
+    `requests` sessions and `request_with_retry`, so behaviour is identical,
+    just with threads doing the waiting.
+
+Either way at most RW_ASYNC_CONCURRENCY requests per client are in flight at
+once. Task searches and runsession reads share the synchronous keywords'
+caches, so mixing sync and async keywords never downloads twice.
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import json
+import os
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from robot.api.deco import not_keyword
+
+from RW import platform
+from RW.Workspace.endpoints import WorkspaceEndpoints, import_platform_variable, workspace_endpoints
+from RW.Workspace.http_metrics import record_request
+from RW.Workspace.http_session import POOL_MAXSIZE
+from RW.Workspace.json_codec import loads, response_json
+from RW.Workspace.retry_policy import (
+    DEFAULT_POLICY,
+    IDEMPOTENT_METHODS,
+    CircuitOpenError,
+    _retry_after_seconds,
+    circuit_breaker,
+    request_with_retry,
+)
+from RW.Workspace.runsession_cache import (
+    _RUNSESSION_CACHE,
+    _forget_created_runsession,
+    invalidate_runsession_cache as _invalidate_runsession_cache,
+)
+from RW.Workspace.slx_catalog import _next_slx_page_url, _remaining_slx_page_urls, _slx_list_url
+from RW.Workspace.workspace_utils import (
+    _TASK_SEARCH_CACHE,
+    _normalize_fields,
+    _project_fields,
+    _task_search_key,
+    warning_log,
+)
+
+# aiohttp costs ~150 ms to import; only pay for it once an async keyword runs
+_AIOHTTP: Any = None
+
+
+def _aiohttp() -> Any:
+    """Internal: the aiohttp module, imported on first use (None when not installed)."""
+    global _AIOHTTP
+    if _AIOHTTP is None:
+        try:
+            import aiohttp
+        except ImportError:
+            aiohttp = False
+        _AIOHTTP = aiohttp
+    return _AIOHTTP or None
+
+# Requests in flight at once per client (and event loop)
+ASYNC_CONCURRENCY: int = int(os.getenv("RW_ASYNC_CONCURRENCY", "16"))
+
+
+class AsyncResponse:
+    """The parts of `requests.Response` the keywords use, for aiohttp replies."""
+
+    def __init__(self, status_code: int, headers: Dict[str, str], url: str, content: bytes):
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+        self.url = url
+        self.content = content
+
+    def json(self) -> Any:
+        return loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+def _ssl_option(verify: Any) -> Any:
+    """Internal: aiohttp's ``ssl=`` for a requests-style *verify* (bool or CA bundle path)."""
+    if verify is False:
+        return False
+    if isinstance(verify, str) and verify:
+        return _ca_context(verify)
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _ca_context(path: str) -> "ssl.SSLContext":
+    """Internal: an SSL context trusting the CA file or directory at *path*."""
+    import ssl
+
+    if os.path.isdir(path):
+        return ssl.create_default_context(capath=path)
+    return ssl.create_default_context(cafile=path)
+
+
+class _LoopState:
+    """Internal: what a client keeps per event loop."""
+
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.session: Optional["aiohttp.ClientSession"] = None
+        self.inflight: Dict[Any, "asyncio.Future"] = {}
+
+
+class AsyncWorkspaceClient:
+    """
+    Workspace API client for one workspace and auth source.
+
+    URLs come from the same `WorkspaceEndpoints` as the sync keywords, so
+    both share cache entries. Auth follows `get_workspace_session` precedence.
+    """
+
+    def __init__(
+        self,
+        endpoints: WorkspaceEndpoints,
+        api_token: Optional[platform.Secret] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.endpoints = endpoints
+        self.concurrency = concurrency or ASYNC_CONCURRENCY
+        self._sync_session = endpoints.session(api_token)
+        # aiohttp can only replay header-based auth (bearer / runtime headers)
+        self.uses_aiohttp = _aiohttp() is not None and self._sync_session.auth is None
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+
+    # ── transport ──────────────────────────────────────────────────────────
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = self._loops[loop] = _LoopState(self.concurrency)
+        return state
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Send one request under the shared retry policy and return the final
+        response (`requests.Response` or `AsyncResponse`); raises like
+        `request_with_retry`. Accepts ``json``, ``headers``, ``timeout`` and
+        ``verify`` keyword arguments.
+        """
+        state = self._state()
+        async with state.semaphore:
+            if not self.uses_aiohttp:
+                return await asyncio.to_thread(
+                    request_with_retry, self._sync_session, method, url, idempotent=idempotent, **kwargs
+                )
+            return await self._aiohttp_request(state, method, url, idempotent=idempotent, **kwargs)
+
+    async def _aiohttp_request(
+        self,
+        state: _LoopState,
+        method: str,
+        url: str,
+        *,
+        idempotent: Optional[bool] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 120.0,
+        verify: Any = None,
+    ) -> AsyncResponse:
+        aiohttp = _aiohttp()
+        if verify is None:
+            # Same default as the sync session, so both transports verify alike
+            verify = self._sync_session.verify
+        if state.session is None or state.session.closed:
+            state.session = aiohttp.ClientSession(
+                headers=dict(self._sync_session.headers),
+                connector=aiohttp.TCPConnector(limit_per_host=POOL_MAXSIZE),
+            )
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        policy = DEFAULT_POLICY
+        breaker = circuit_breaker(url)
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                record_request(method, url, "CircuitOpen", max(attempt - 1, 0), 0, time.perf_counter() - started)
+                raise CircuitOpenError(f"Circuit open for {url}: failing fast")
+            try:
+                async with state.session.request(
+                    method, url, json=json, headers=headers, timeout=client_timeout,
+                    ssl=_ssl_option(verify),
+                ) as r:
+                    resp = AsyncResponse(r.status, dict(r.headers), str(r.url), await r.read())
+            except BaseException as exc:
+                # Recorded whatever it is (cancellation included) so a probe is never left open
+                breaker.record_failure()
+                if not isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError)):
+                    raise
+                if isinstance(exc, aiohttp.ClientConnectorError):
+                    err: requests.RequestException = requests.ConnectTimeout(str(exc))
+                elif isinstance(exc, asyncio.TimeoutError):
+                    err = requests.ReadTimeout(f"{method} {url} timed out after {timeout}s")
+                else:
+                    err = requests.ConnectionError(str(exc))
+                attempt += 1
+                if attempt >= policy.max_attempts or not policy.retry_exception(err, idempotent):
+                    record_request(method, url, type(err).__name__, attempt - 1, 0, time.perf_counter() - started)
+                    raise err from exc
+                await asyncio.sleep(policy.backoff(attempt))
+                continue
+
+            if resp.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            attempt += 1
+            if attempt >= policy.max_attempts or not policy.retry_status(resp.status_code, idempotent):
+                record_request(
+                    method, url, resp.status_code, attempt - 1, len(resp.content), time.perf_counter() - started
+                )
+                return resp
+            await asyncio.sleep(policy.backoff(attempt, _retry_after_seconds(resp)))
+
+    async def _coalesced(self, key: Any, make) -> Any:
+        """Run ``await make()`` once per *key* among concurrent callers on this loop."""
+        state = self._state()
+        future = state.inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+        future = asyncio.ensure_future(make())
+        state.inflight[key] = future
+        try:
+            return await future
+        finally:
+            state.inflight.pop(key, None)
+
+    async def _get_json(self, url: str, timeout: float = 120.0) -> Any:
+        resp = await self.request("GET", url, timeout=timeout, verify=platform.REQUEST_VERIFY)
+        resp.raise_for_status()
+        return response_json(resp)
+
+    async def aclose(self) -> None:
+        """Close this loop's aiohttp session (a no-op for the thread transport)."""
+        state = self._loops.get(asyncio.get_running_loop())
+        if state is not None and state.session is not None:
+            await state.session.close()
+
+    # ── SLXs ───────────────────────────────────────────────────────────────
+    async def list_slxs(self) -> List[Dict]:
+        """Every SLX in the workspace; pages after the first are fetched concurrently."""
+        url = _slx_list_url(self.endpoints)
+        resp = await self.request("GET", url, timeout=120)
+        resp.raise_for_status()
+        body = response_json(resp)
+        slxs: List[Dict] = list(body.get("results", []))
+
+        remaining = _remaining_slx_page_urls(body, resp.url)
+        if remaining is not None:
+            pages = await asyncio.gather(*(self._get_json(u) for u in remaining))
+            for page in pages:
+                slxs.extend(page.get("results", []))
+            return slxs
+
+        # Cursor-style `next` links have to be followed one by one
+        next_url = _next_slx_page_url(body, resp.url)
+        while next_url:
+            resp = await self.request("GET", next_url, timeout=120)
+            resp.raise_for_status()
+            body = response_json(resp)
+            slxs.extend(body.get("results", []))
+            next_url = _next_slx_page_url(body, resp.url)
+        return slxs
+
+    # ── task search ────────────────────────────────────────────────────────
+    async def task_search(
+        self,
+        query: str,
+        slx_scope: Optional[List[str]] = None,
+        persona: Optional[str] = None,
+        timeout: float = 120.0,
+    ) -> Dict:
+        """Task search (as *persona* when given); served from the shared cache when possible."""
+        url = self.endpoints.task_search
+        body: Dict[str, Any] = {"query": [query], "scope": slx_scope or []}
+        if persona:
+            body["persona"] = self.endpoints.qualify(persona)
+
+        key = _task_search_key(url, body)
+        cached = _TASK_SEARCH_CACHE.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        async def search() -> Dict:
+            # Task search is read-only, so the POST is safe to retry
+            resp = await self.request(
+                "POST", url, json=body, timeout=timeout,
+                verify=platform.REQUEST_VERIFY, idempotent=True,
+            )
+            resp.raise_for_status()
+            result = response_json(resp)
+            _TASK_SEARCH_CACHE.put(key, result)
+            return result
+
+        # Callers own their copy; the cached response must stay pristine
+        return copy.deepcopy(await self._coalesced(("task-search", key), search))
+
+    # ── runsessions / personas ─────────────────────────────────────────────
+    async def get_runsession(self, runsession_id: str, fields: Optional[List[str]] = None) -> Dict:
+        """RunSession JSON (limited to *fields*), shared with the sync runsession cache."""
+        url = self.endpoints.runsessions(runsession_id)
+        fields = fields or []
+        full = _RUNSESSION_CACHE.peek((url, ()))
+        if full is not None:
+            return _project_fields(full, fields) if fields else full
+        if fields:
+            projected = _RUNSESSION_CACHE.peek((url, tuple(fields)))
+            if projected is not None:
+                return projected
+
+        async def fetch() -> Dict:
+            data = await self._get_json(url)
+            _RUNSESSION_CACHE.put((url, ()), data)
+            return data
+
+        data = await self._coalesced(("runsession", url), fetch)
+        return _project_fields(data, fields) if fields else data
+
+    async def create_runsession(self, body: Dict) -> Dict:
+        resp = await self.request("POST", self.endpoints.runsessions(), json=body, timeout=30)
+        resp.raise_for_status()
+        created = response_json(resp)
+        _forget_created_runsession(created)
+        return created
+
+    async def patch_runsession(self, runsession_id: str, patch_body: Dict) -> Dict:
+        url = self.endpoints.runsessions(runsession_id)
+        resp = await self.request("PATCH", url, json=patch_body, timeout=30)
+        resp.raise_for_status()
+        _invalidate_runsession_cache(runsession_id)
+        return response_json(resp)
+
+    async def get_persona(self, persona: str) -> Dict:
+        # Same URL as the sync `Get Persona Details`, which doesn't qualify the name
+        return await self._get_json(self.endpoints.url("personas", persona), timeout=30)
+
+
+_CLIENTS: Dict[Tuple[str, str, str], AsyncWorkspaceClient] = {}
+
+
+def _close_sessions() -> None:
+    """
+    Internal: close the aiohttp sessions the shared clients opened, on every
+    event loop that is still open and idle. The `Workspace` library calls
+    this when Robot closes it, which happens before Robot closes its loop.
+    """
+    for client in list(_CLIENTS.values()):
+        for loop, state in list(client._loops.items()):
+            session = state.session
+            if session is None or session.closed or loop.is_closed() or loop.is_running():
+                continue
+            loop.run_until_complete(session.close())
+
+
+@not_keyword
+def get_async_client(api_token: Optional[platform.Secret] = None) -> AsyncWorkspaceClient:
+    """The shared client for RW_WORKSPACE / RW_WORKSPACE_API_URL (raises ImportError if unset)."""
+    ep = workspace_endpoints()
+    token = api_token.value if api_token else os.getenv("RW_USER_TOKEN", "")
+    key = (ep.root, ep.workspace_path, hashlib.sha256(token.encode()).hexdigest()[:16] if token else "platform")
+    client = _CLIENTS.get(key)
+    if client is None:
+        client = _CLIENTS[key] = AsyncWorkspaceClient(ep, api_token)
+    return client
+
+
+# The async keyword variants live in `lazy_keywords`, which imports this module
+# when one of them first runs; they are re-exported so ``Library
+# RW.Workspace.async_client`` keeps offering them.
+from RW.Workspace.lazy_keywords import (  # noqa: E402
+    create_runsession_async,
+    get_all_slxs_async,
+    get_persona_details_async,
+    import_memo_variable_async,
+    import_runsession_details_async,
+    patch_runsession_async,
+    perform_task_search_async,
+    perform_task_searches_async,
+)
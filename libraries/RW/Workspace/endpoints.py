@@ -0,0 +1,106 @@
+"""
+Workspace API location, resolved once per process.
+
+Keywords used to read RW_WORKSPACE / RW_WORKSPACE_API_URL, strip the
+`workspaces/` prefix from the workspace name and (in some places) add a
+missing `/workspaces` suffix to the API root on every call. `workspace_endpoints`
+does that once per (API root, workspace) pair and hands back the same
+`WorkspaceEndpoints`, which builds every Workspace API URL the libraries use.
+"""
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+from robot.api.deco import not_keyword
+
+from RW import platform
+from RW.Workspace.http_session import get_workspace_session
+
+
+@not_keyword
+def normalize_workspace_path(workspace: str) -> str:
+    """*workspace* without a leading ``/`` or ``workspaces/`` prefix."""
+    workspace_path = workspace.lstrip('/')
+    if workspace_path.startswith('workspaces/'):
+        workspace_path = workspace_path[len('workspaces/'):]
+    return workspace_path
+
+
+class WorkspaceEndpoints:
+    """URL templates for one workspace on one Workspace API."""
+
+    def __init__(self, root: str, workspace: str):
+        self.root = root
+        self.workspace_path = normalize_workspace_path(workspace)
+        # RW_WORKSPACE_API_URL may or may not already end in /workspaces
+        api = root.rstrip('/')
+        if not api.endswith('/workspaces'):
+            api += '/workspaces'
+        self.base = f"{api}/{self.workspace_path}"
+
+    def __repr__(self) -> str:
+        return f"WorkspaceEndpoints({self.base!r})"
+
+    def url(self, *parts: str) -> str:
+        """``base/part/...``, e.g. ``url("slxs", name, "runbook")``."""
+        return "/".join((self.base, *(str(p).strip('/') for p in parts)))
+
+    def qualify(self, short_name: str) -> str:
+        """Workspace-qualified name (``<workspace>--<short_name>``) for SLXs and personas."""
+        return short_name if "--" in short_name else f"{self.workspace_path}--{short_name}"
+
+    def slx(self, short_name: str) -> str:
+        return self.url("slxs", short_name)
+
+    def runsessions(self, runsession_id: Optional[str] = None) -> str:
+        if runsession_id is None:
+            return self.url("runsessions")
+        return self.url("runsessions", runsession_id)
+
+    def persona(self, persona: str) -> str:
+        return self.url("personas", self.qualify(persona))
+
+    @property
+    def task_search(self) -> str:
+        return self.url("task-search")
+
+    @property
+    def workspace_config(self) -> str:
+        return self.url("branches", "main", "workspace.yaml") + "?format=json"
+
+    def session(self, api_token: Optional[platform.Secret] = None) -> requests.Session:
+        """The pooled session for this API (auth precedence of `get_workspace_session`)."""
+        return get_workspace_session(self.root, api_token)
+
+
+_ENDPOINTS: Dict[Tuple[str, str], WorkspaceEndpoints] = {}
+_LOCK = threading.Lock()
+
+
+def import_platform_variable(varname: str) -> str:
+    """Return the value of a RunWhen platform-provided var or raise ImportError."""
+    if not varname.startswith("RW_"):
+        raise ValueError(f"{varname!r} is not a platform variable")
+    value = os.getenv(varname)
+    if not value:
+        raise ImportError(f"{varname} is unset")
+    return value
+
+
+@not_keyword
+def workspace_endpoints(root: Optional[str] = None, workspace: Optional[str] = None) -> WorkspaceEndpoints:
+    """
+    The shared `WorkspaceEndpoints` for *root* and *workspace*, defaulting to
+    RW_WORKSPACE_API_URL and RW_WORKSPACE. Raises ImportError when a needed
+    platform variable is unset, like `Import Platform Variable`.
+    """
+    root = root or import_platform_variable("RW_WORKSPACE_API_URL")
+    workspace = workspace or import_platform_variable("RW_WORKSPACE")
+    key = (root, workspace)
+    ep = _ENDPOINTS.get(key)
+    if ep is None:
+        with _LOCK:
+            ep = _ENDPOINTS.setdefault(key, WorkspaceEndpoints(root, workspace))
+    return ep
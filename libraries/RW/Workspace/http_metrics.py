@@ -0,0 +1,182 @@
+"""
+Per-endpoint HTTP metrics for the RW keyword libraries.
+
+`request_with_retry` (and the async client) record every call here, keyed by
+an endpoint template – method, host and path with identifiers replaced, e.g.
+``GET papi.example.com/api/v3/workspaces/{workspace}/runsessions/{runsession}``
+– so a handler's time can be attributed to catalog paging, task search,
+runsession writes or persona lookups. Per template we keep the call count,
+status codes, retries, response bytes and a bounded latency sample for
+p50/p95/p99.
+
+`Dump Http Metrics` writes the summary table into the Robot log and,
+optionally, a JSON file for trend tracking. Set RW_HTTP_METRICS=0 to turn
+recording off.
+"""
+
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+import urllib.parse
+
+from robot.api.deco import keyword, not_keyword
+from robot.libraries.BuiltIn import BuiltIn
+
+HTTP_METRICS_ENABLED: bool = os.getenv("RW_HTTP_METRICS", "1").lower() not in ("0", "false", "no", "off")
+
+# Latency samples kept per endpoint template (reservoir sampling beyond that)
+HTTP_METRICS_SAMPLES: int = int(os.getenv("RW_HTTP_METRICS_SAMPLES", "2048"))
+
+# Path segments that name a resource; the segment after one is its identifier
+_COLLECTIONS = {
+    "workspaces": "{workspace}",
+    "slxs": "{slx}",
+    "runsessions": "{runsession}",
+    "runrequests": "{runrequest}",
+    "personas": "{persona}",
+    "branches": "{branch}",
+    "issues": "{issue}",
+    "incidents": "{incident}",
+    "users": "{user}",
+}
+# Numbers, and long or digit-bearing tokens (hashes, webhook secrets) – not "v3"
+_ID_SEGMENT = re.compile(r"^\d+$|^(?=.*\d)[\w\-]{8,}$|^[\w\-]{20,}$")
+
+
+@not_keyword
+def endpoint_template(method: str, url: str) -> str:
+    """``METHOD host/path`` with identifiers (and any credentials in the path) templated out."""
+    parts = urllib.parse.urlparse(url)
+    out: List[str] = []
+    placeholder: Optional[str] = None
+    for segment in parts.path.split("/"):
+        if not segment:
+            continue
+        if placeholder is not None:
+            out.append(placeholder)
+            placeholder = None
+            continue
+        placeholder = _COLLECTIONS.get(segment.lower())
+        out.append("{id}" if placeholder is None and _ID_SEGMENT.match(segment) else segment)
+    return f"{method.upper()} {parts.hostname or ''}/{'/'.join(out)}"
+
+
+class _EndpointStats:
+    """Internal: counters and latency reservoir for one endpoint template."""
+
+    def __init__(self):
+        self.count = 0
+        self.statuses: Counter = Counter()
+        self.retries = 0
+        self.bytes = 0
+        self.total_seconds = 0.0
+        self.samples: List[float] = []
+
+    def add(self, status: str, retries: int, nbytes: int, seconds: float) -> None:
+        self.count += 1
+        self.statuses[status] += 1
+        self.retries += retries
+        self.bytes += nbytes
+        self.total_seconds += seconds
+        if len(self.samples) < HTTP_METRICS_SAMPLES:
+            self.samples.append(seconds)
+        else:
+            slot = random.randrange(self.count)
+            if slot < HTTP_METRICS_SAMPLES:
+                self.samples[slot] = seconds
+
+    def summary(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+
+        def pct(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 1)
+
+        return {
+            "count": self.count,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "total_ms": round(self.total_seconds * 1000, 1),
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "p99_ms": pct(0.99),
+        }
+
+
+_STATS: Dict[str, _EndpointStats] = {}
+_LOCK = threading.Lock()
+
+
+@not_keyword
+def record_request(method: str, url: str, status: Any, retries: int, nbytes: int, seconds: float) -> None:
+    """Record one finished call; *status* is the HTTP status or the exception name."""
+    if not HTTP_METRICS_ENABLED:
+        return
+    template = endpoint_template(method, url)
+    with _LOCK:
+        stats = _STATS.get(template)
+        if stats is None:
+            stats = _STATS[template] = _EndpointStats()
+        stats.add(str(status), retries, nbytes, seconds)
+
+
+def get_http_metrics() -> Dict[str, Dict[str, Any]]:
+    """Return the per-endpoint metrics recorded so far, slowest total time first."""
+    with _LOCK:
+        summaries = {template: stats.summary() for template, stats in _STATS.items()}
+    return dict(sorted(summaries.items(), key=lambda kv: kv[1]["total_ms"], reverse=True))
+
+
+def reset_http_metrics() -> None:
+    """Forget every recorded HTTP call."""
+    with _LOCK:
+        _STATS.clear()
+
+
+def _html_table(metrics: Dict[str, Dict[str, Any]]) -> str:
+    head = ("Endpoint", "Count", "Statuses", "Retries", "Bytes", "Total ms", "p50 ms", "p95 ms", "p99 ms")
+    rows = []
+    for template, m in metrics.items():
+        statuses = " ".join(f"{code}×{n}" for code, n in m["statuses"].items())
+        cells = (template, m["count"], statuses, m["retries"], m["bytes"],
+                 m["total_ms"], m["p50_ms"], m["p95_ms"], m["p99_ms"])
+        rows.append("<tr>" + "".join(f"<td>{_escape(c)}</td>" for c in cells) + "</tr>")
+    return (
+        "<table border='1' cellpadding='3'><tr>"
+        + "".join(f"<th>{h}</th>" for h in head)
+        + "</tr>" + "".join(rows) + "</table>"
+    )
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+@keyword("Dump Http Metrics")
+def dump_http_metrics(json_path: Optional[str] = None, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Log the per-endpoint HTTP summary table into the Robot report and return
+    the metrics. With *json_path*, also write them (plus a timestamp) as JSON
+    for trend tracking. *reset* clears the counters afterwards.
+    """
+    metrics = get_http_metrics()
+    if metrics:
+        BuiltIn().log(_html_table(metrics), html=True)
+    else:
+        BuiltIn().log("No HTTP calls recorded", level="INFO")
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as fh:
+            json.dump({"generated": time.time(), "endpoints": metrics}, fh, indent=2)
+        BuiltIn().log(f"HTTP metrics written to {json_path}", level="INFO")
+
+    if reset:
+        reset_http_metrics()
+    return metrics
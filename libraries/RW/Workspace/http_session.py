@@ -0,0 +1,136 @@
+"""
+Process-wide registry of pooled `requests` sessions for the RW keyword libraries.
+
+Every keyword used to build a fresh `requests.Session()` (or call bare
+`requests.post`), paying a new TCP + TLS handshake per API call. Sessions are
+now shared per (base URL, auth source) for the lifetime of the Robot process,
+so a runbook making a dozen Workspace API calls reuses warm keep-alive
+connections.
+
+Auth sources:
+  • bearer token   – explicit `platform.Secret` or RW_USER_TOKEN (local runs)
+  • platform       – `platform.get_authenticated_session()` inside the runtime
+  • anonymous      – third-party APIs whose credentials travel per request
+                     (Slack webhook URLs, PagerDuty/GitHub token headers)
+"""
+
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from robot.api.deco import not_keyword
+
+from RW import platform
+
+# Distinct hosts kept per session, and connections kept per host. The per-host
+# pool is sized for the concurrent SLX page fetches and task searches.
+POOL_CONNECTIONS: int = int(os.getenv("RW_HTTP_POOL_CONNECTIONS", "8"))
+POOL_MAXSIZE: int = int(os.getenv("RW_HTTP_POOL_MAXSIZE", "32"))
+
+
+_ACCEPT_ENCODING: Optional[str] = None
+
+
+def _brotli_installed() -> bool:
+    import importlib.util
+
+    return any(importlib.util.find_spec(m) is not None for m in ("brotli", "brotlicffi"))
+
+
+@not_keyword
+def accept_encoding() -> str:
+    """
+    Accept-Encoding sent by the pooled sessions, worked out when the first
+    one is created. Compressed transfer shrinks JSON pages and runsessions
+    5-10x; br is only offered when urllib3/aiohttp can decode it.
+    """
+    global _ACCEPT_ENCODING
+    if _ACCEPT_ENCODING is None:
+        _ACCEPT_ENCODING = os.getenv("RW_HTTP_ACCEPT_ENCODING") or (
+            "br, gzip, deflate" if _brotli_installed() else "gzip, deflate"
+        )
+    return _ACCEPT_ENCODING
+
+
+_SESSIONS: Dict[Tuple[str, str], requests.Session] = {}
+_LOCK = threading.Lock()
+
+
+def _base_url(url: str) -> str:
+    parts = urlparse(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _mount_pool(sess: requests.Session) -> requests.Session:
+    """Give *sess* keep-alive connection pools sized for concurrent use, and compression."""
+    if getattr(sess, "_rw_pooled", False):
+        return sess
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+    sess.headers["Accept-Encoding"] = accept_encoding()
+    sess._rw_pooled = True
+    return sess
+
+
+def _registered(key: Tuple[str, str], headers: Dict[str, str]) -> requests.Session:
+    with _LOCK:
+        sess = _SESSIONS.get(key)
+        if sess is None:
+            sess = _mount_pool(requests.Session())
+            sess.headers.update(headers)
+            _SESSIONS[key] = sess
+        return sess
+
+
+@not_keyword
+def get_bearer_session(url: str, token: str) -> requests.Session:
+    """Shared session for *url*'s host authenticated with bearer *token*."""
+    fingerprint = hashlib.sha256(token.encode()).hexdigest()[:16]
+    return _registered(
+        (_base_url(url), f"bearer:{fingerprint}"),
+        {"Content-Type": "application/json", "Authorization": f"Bearer {token}"},
+    )
+
+
+@not_keyword
+def get_anonymous_session(url: str) -> requests.Session:
+    """Shared session for *url*'s host with no default credentials."""
+    return _registered((_base_url(url), "anonymous"), {})
+
+
+@not_keyword
+def get_platform_session() -> requests.Session:
+    """The runtime's authenticated session, with pooled adapters mounted."""
+    return _mount_pool(platform.get_authenticated_session())
+
+
+@not_keyword
+def get_workspace_session(url: str, api_token: Optional[platform.Secret] = None) -> requests.Session:
+    """
+    Shared session for a Workspace API *url*.
+
+    Auth precedence matches what the keywords always did: an explicit
+    *api_token*, then RW_USER_TOKEN (local / test override), then the
+    runtime's platform-authenticated session.
+    """
+    if api_token:
+        return get_bearer_session(url, api_token.value)
+    token = os.getenv("RW_USER_TOKEN")
+    if token:
+        return get_bearer_session(url, token)
+    return get_platform_session()
+
+
+@not_keyword
+def close_sessions() -> None:
+    """Close and forget every pooled session (mainly for tests and forks)."""
+    with _LOCK:
+        sessions = list(_SESSIONS.values())
+        _SESSIONS.clear()
+    for sess in sessions:
+        sess.close()
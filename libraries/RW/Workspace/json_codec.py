@@ -0,0 +1,104 @@
+"""
+JSON encoding and decoding for the RW keyword libraries.
+
+Runsessions carry whole webhook bodies in their memos and an SLX page holds
+500 full specs, so JSON work shows up in every handler. `loads` / `dumps`
+use orjson when it is installed (several times faster, and it decodes the
+response bytes directly) and the standard library otherwise;
+RW_JSON_BACKEND=json forces the standard library. orjson is imported on
+first use, so loading a keyword library that only might handle JSON costs
+nothing.
+
+Both backends produce the same Python values. Encoded text differs only in
+whitespace and in orjson writing non-ASCII characters as UTF-8 rather than
+``\\u`` escapes. Decode errors are `json.JSONDecodeError` either way, so
+existing ``except json.JSONDecodeError`` handlers keep working.
+"""
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+from robot.api.deco import not_keyword
+
+JSON_BACKEND: str = os.getenv("RW_JSON_BACKEND", "auto").lower()
+
+_ORJSON: Any = None
+
+
+def _orjson() -> Any:
+    """Internal: the orjson module, imported on first use (None when not installed or disabled)."""
+    global _ORJSON
+    if _ORJSON is None:
+        try:
+            if JSON_BACKEND == "json":
+                raise ImportError("RW_JSON_BACKEND=json")
+            import orjson
+        except ImportError:
+            orjson = False
+        _ORJSON = orjson
+    return _ORJSON or None
+
+
+@not_keyword
+def json_backend() -> str:
+    """``"orjson"`` or ``"json"``: the library `loads` / `dumps` use."""
+    return "orjson" if _orjson() is not None else "json"
+
+
+@not_keyword
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Decode JSON text or UTF-8 bytes."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@not_keyword
+def dumps(
+    obj: Any,
+    *,
+    sort_keys: bool = False,
+    indent: Optional[int] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Encode *obj* as JSON text (compact unless *indent* is 2)."""
+    orjson = _orjson()
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits; let the standard library decide
+            pass
+    separators = None if indent else (",", ":")
+    return json.dumps(obj, sort_keys=sort_keys, indent=indent, default=default, separators=separators)
+
+
+@not_keyword
+def dumps_bytes(obj: Any) -> bytes:
+    """Compact UTF-8 JSON for *obj*, for storing or sending rather than display."""
+    orjson = _orjson()
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+@not_keyword
+def response_json(resp: Any) -> Any:
+    """
+    The JSON body of *resp*, decoded from its raw bytes. Falls back to
+    ``resp.json()`` – and its error – when the bytes are not UTF-8 JSON.
+    """
+    try:
+        return loads(resp.content)
+    except ValueError:
+        return resp.json()
@@ -0,0 +1,208 @@
+"""
+Keywords of RW.Workspace whose implementation is imported on first use.
+
+Robot inspects every keyword when it imports the library, so the functions
+it sees for the async variants and the HTTP metrics live here, with the
+modules behind them (`async_client`, `http_metrics`) only imported once one
+of these keywords – or, for the metrics, the first request – runs.
+"""
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import requests
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+
+from RW import platform
+from RW.Workspace.endpoints import import_platform_variable
+from RW.Workspace.json_codec import dumps
+from RW.Workspace.runsession_cache import _runsession_text
+from RW.Workspace.workspace_utils import _normalize_fields, warning_log
+
+if TYPE_CHECKING:
+    from RW.Workspace.async_client import AsyncWorkspaceClient
+
+
+def _async_client(api_token: Optional[platform.Secret] = None) -> "AsyncWorkspaceClient":
+    """Internal: `async_client.get_async_client`, importing the async client on first use."""
+    from RW.Workspace.async_client import get_async_client
+
+    return get_async_client(api_token)
+
+
+# ===========================================================================
+# Async keyword variants (Robot Framework 6.1+)
+# ===========================================================================
+
+@keyword("Perform Task Search Async")
+async def perform_task_search_async(
+    query: str,
+    slx_scope: Optional[List[str]] = None,
+    persona: Optional[str] = None,
+    timeout: float = 120.0,
+) -> Dict:
+    """Async `Perform Task Search` / `Perform Task Search With Persona`; {} on failure."""
+    try:
+        return await _async_client().task_search(query, slx_scope, persona, timeout)
+    except ImportError:
+        return {}
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        BuiltIn().log(f"Task search failed: {e}", level="WARN")
+        return {}
+
+
+@keyword("Perform Task Searches Async")
+async def perform_task_searches_async(searches: List[Dict]) -> List[Dict]:
+    """
+    Async `Perform Task Searches`: every spec (query, slx_scope/scope,
+    persona, timeout) runs concurrently, bounded by RW_ASYNC_CONCURRENCY.
+    Results are in input order; a failed or malformed search yields {}.
+    """
+    async def one(spec: Any) -> Dict:
+        if not isinstance(spec, dict) or not spec.get("query"):
+            BuiltIn().log(f"Skipping malformed task search spec: {spec!r}", level="WARN")
+            return {}
+        return await perform_task_search_async(
+            spec["query"],
+            spec.get("slx_scope", spec.get("scope")),
+            spec.get("persona"),
+            float(spec.get("timeout", 120.0)),
+        )
+
+    return list(await asyncio.gather(*(one(spec) for spec in searches or [])))
+
+
+@keyword("Get All Slxs Async")
+async def get_all_slxs_async() -> List[Dict]:
+    """Every SLX in the current workspace, pages fetched concurrently; [] on failure."""
+    try:
+        return await _async_client().list_slxs()
+    except ImportError:
+        return []
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        warning_log("Paging SLXs failed", str(e))
+        return []
+
+
+@keyword("Import Runsession Details Async")
+async def import_runsession_details_async(
+    runsession_id: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Optional[str]:
+    """Async `Import Runsession Details`: RunSession JSON string, or None."""
+    try:
+        if not runsession_id:
+            runsession_id = import_platform_variable("RW_SESSION_ID")
+        data = await _async_client().get_runsession(runsession_id, _normalize_fields(fields))
+        return _runsession_text(data)
+    except ImportError:
+        BuiltIn().log("Missing required vars for import_runsession_details_async", level="WARN")
+        return None
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        warning_log("Import RunSession details failed", str(e))
+        return None
+
+
+@keyword("Import Memo Variable Async")
+async def import_memo_variable_async(key: str) -> Optional[str]:
+    """Async `Import Memo Variable`: the memo value as JSON string, or None."""
+    try:
+        runreq = str(import_platform_variable("RW_RUNREQUEST_ID"))
+        runsess = import_platform_variable("RW_SESSION_ID")
+        data = await _async_client().get_runsession(runsess, ["runRequests.id", "runRequests.memo"])
+    except ImportError:
+        BuiltIn().log("Missing vars for import_memo_variable_async", level="WARN")
+        return None
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        warning_log("Fetching memo failed", str(e))
+        return None
+
+    for rr in data.get("runRequests", []):
+        if str(rr.get("id")) == runreq:
+            for memo in rr.get("memo", []):
+                if isinstance(memo, dict) and key in memo:
+                    try:
+                        return dumps(memo[key])
+                    except (TypeError, ValueError):
+                        return dumps(str(memo[key]))
+    return dumps(None)
+
+
+@keyword("Get Persona Details Async")
+async def get_persona_details_async(persona: str) -> Dict:
+    """Async `Get Persona Details`; {} on failure."""
+    try:
+        return await _async_client().get_persona(persona)
+    except ImportError:
+        return {}
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        BuiltIn().log(f"Persona lookup failed: {e}", level="WARN")
+        return {}
+
+
+@keyword("Create Runsession Async")
+async def create_runsession_async(body: Dict, api_token: Optional[platform.Secret] = None) -> Dict:
+    """
+    POST a RunSession *body* (e.g. from `Create Runsession From Task Search`
+    with ``dry_run=True``); returns the created RunSession or {}.
+    """
+    try:
+        return await _async_client(api_token).create_runsession(body)
+    except ImportError:
+        return {}
+    except requests.RequestException as e:
+        BuiltIn().log(f"[create_runsession_async] POST failed: {e}", level="WARN")
+        return {}
+
+
+@keyword("Patch Runsession Async")
+async def patch_runsession_async(
+    patch_body: Dict,
+    runsession_id: Optional[str] = None,
+    api_token: Optional[platform.Secret] = None,
+) -> Dict:
+    """
+    Merge-patch a RunSession (e.g. a body from `Add Tasks To Runsession From
+    Search` with ``dry_run=True``); returns the server's JSON or {}.
+    """
+    try:
+        if runsession_id is None:
+            runsession_id = import_platform_variable("RW_SESSION_ID")
+        return await _async_client(api_token).patch_runsession(runsession_id, patch_body)
+    except ImportError:
+        return {}
+    except requests.RequestException as e:
+        BuiltIn().log(f"[patch_runsession_async] PATCH failed: {e}", level="WARN")
+        return {}
+
+
+# ===========================================================================
+# HTTP metrics
+# ===========================================================================
+
+def get_http_metrics() -> Dict[str, Dict[str, Any]]:
+    """Return the per-endpoint metrics recorded so far, slowest total time first."""
+    from RW.Workspace import http_metrics
+
+    return http_metrics.get_http_metrics()
+
+
+def reset_http_metrics() -> None:
+    """Forget every recorded HTTP call."""
+    from RW.Workspace import http_metrics
+
+    http_metrics.reset_http_metrics()
+
+
+@keyword("Dump Http Metrics")
+def dump_http_metrics(json_path: Optional[str] = None, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Log the per-endpoint HTTP summary table into the Robot report and return
+    the metrics. With *json_path*, also write them (plus a timestamp) as JSON
+    for trend tracking. *reset* clears the counters afterwards.
+    """
+    from RW.Workspace import http_metrics
+
+    return http_metrics.dump_http_metrics(json_path, reset)
@@ -0,0 +1,266 @@
+"""
+Shared retry, backoff and circuit-breaker policy for RW HTTP calls.
+
+Every RW keyword library sends its requests through `request_with_retry`, so
+transient failures are handled the same way everywhere:
+
+  • jittered exponential backoff between attempts
+  • `Retry-After` honoured on 429 / 503 responses
+  • idempotency-aware rules – GET/HEAD/OPTIONS/PUT/DELETE retry on
+    timeouts, connection errors and retryable statuses; POST and PATCH only
+    retry when the server provably did not process the request (connect
+    failure, or 429/503 asking us to come back later) unless the caller
+    marks the request as idempotent (e.g. task search). Runsession PATCHes
+    append runRequests, so repeating one after a read timeout could queue
+    the same tasks twice
+  • a per-host circuit breaker, so once an API is clearly degraded further
+    calls fail immediately with `CircuitOpenError` instead of each handler
+    waiting out its own timeouts
+
+`CircuitOpenError` subclasses `requests.ConnectionError`, so existing
+`except requests.RequestException` handlers keep working unchanged. Every
+call's outcome, retries, bytes and latency are recorded in `http_metrics`.
+"""
+
+import email.utils
+import os
+import random
+import threading
+import time
+from typing import Dict, FrozenSet, Optional
+from urllib.parse import urlparse
+
+import requests
+from robot.api.deco import not_keyword
+
+try:
+    from robot.api import logger as robot_logger
+except ImportError:
+    import logging
+    robot_logger = logging.getLogger("robot_fallback")
+
+
+# PATCH is left out: the runsession PATCHes append to runRequests
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised without touching the network while a host's circuit is open."""
+
+
+class RetryPolicy:
+    """How many times, and how patiently, a request is retried."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504}),
+    ):
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        return cls(
+            max_attempts=int(os.getenv("RW_HTTP_MAX_ATTEMPTS", "3")),
+            backoff_base=float(os.getenv("RW_HTTP_BACKOFF_BASE", "1.0")),
+            backoff_max=float(os.getenv("RW_HTTP_BACKOFF_MAX", "30.0")),
+        )
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before attempt number *attempt* + 1 (full jitter)."""
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.backoff_max)
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def retry_status(self, status: int, idempotent: bool) -> bool:
+        if status not in self.retry_statuses:
+            return False
+        # 429/503 mean "not processed, come back later" – safe for any method
+        return idempotent or status in (429, 503)
+
+    @staticmethod
+    def retry_exception(exc: requests.RequestException, idempotent: bool) -> bool:
+        if isinstance(exc, CircuitOpenError):
+            return False
+        if isinstance(exc, requests.ConnectTimeout):
+            return True  # never reached the server
+        if isinstance(exc, (requests.Timeout, requests.ConnectionError)):
+            return idempotent
+        return False
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure breaker for one host.
+
+    After `failure_threshold` consecutive failures (any error raised while
+    sending the request, or a 5xx) the circuit opens for `reset_timeout` seconds. The first
+    call after that is let through as a probe: success closes the circuit,
+    failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+
+DEFAULT_POLICY = RetryPolicy.from_env()
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+@not_keyword
+def circuit_breaker(url: str) -> CircuitBreaker:
+    """The shared breaker for *url*'s host."""
+    host = urlparse(url).netloc.lower()
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=int(os.getenv("RW_CIRCUIT_FAILURE_THRESHOLD", "5")),
+                reset_timeout=float(os.getenv("RW_CIRCUIT_RESET_SECONDS", "30")),
+            )
+            _BREAKERS[host] = breaker
+        return breaker
+
+
+@not_keyword
+def reset_circuit_breakers() -> None:
+    """Close every circuit (e.g. after an API outage is known to be over)."""
+    with _BREAKERS_LOCK:
+        _BREAKERS.clear()
+
+
+def _response_bytes(resp: requests.Response, streamed: bool) -> int:
+    if streamed:
+        return int(resp.headers.get("Content-Length") or 0)
+    return len(resp.content or b"")
+
+
+def _retry_after_seconds(resp: requests.Response) -> Optional[float]:
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return when.timestamp() - time.time()
+
+
+@not_keyword
+def request_with_retry(
+    session: requests.Session,
+    method: str,
+    url: str,
+    *,
+    idempotent: Optional[bool] = None,
+    policy: Optional[RetryPolicy] = None,
+    **kwargs,
+) -> requests.Response:
+    """
+    Send ``session.request(method, url, **kwargs)`` under the shared policy.
+
+    Returns the final response (callers still `raise_for_status()`); raises
+    the last `requests` exception when attempts are exhausted, or
+    `CircuitOpenError` when the host's circuit is open. *idempotent*
+    overrides the method-based default, e.g. for read-only POST endpoints.
+    """
+    # Imported on the first request rather than with the libraries
+    from RW.Workspace.http_metrics import record_request
+
+    method = method.upper()
+    policy = policy or DEFAULT_POLICY
+    if idempotent is None:
+        idempotent = method in IDEMPOTENT_METHODS
+    breaker = circuit_breaker(url)
+    started = time.perf_counter()
+
+    attempt = 0
+    while True:
+        if not breaker.allow():
+            record_request(method, url, "CircuitOpen", max(attempt - 1, 0), 0, time.perf_counter() - started)
+            raise CircuitOpenError(
+                f"Circuit open for {urlparse(url).netloc}: failing fast after "
+                f"{breaker.failures} consecutive failures"
+            )
+
+        try:
+            resp = session.request(method, url, **kwargs)
+        except BaseException as exc:
+            # Whatever went wrong, record it – a probe left unanswered would
+            # keep the circuit open for good
+            breaker.record_failure()
+            if not isinstance(exc, requests.RequestException):
+                raise
+            attempt += 1
+            if attempt >= policy.max_attempts or not policy.retry_exception(exc, idempotent):
+                record_request(method, url, type(exc).__name__, attempt - 1, 0, time.perf_counter() - started)
+                raise
+            delay = policy.backoff(attempt)
+            robot_logger.info(f"{method} {url} failed ({exc}); retry {attempt} in {delay:.1f}s")
+            time.sleep(delay)
+            continue
+
+        if resp.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+        attempt += 1
+        if attempt >= policy.max_attempts or not policy.retry_status(resp.status_code, idempotent):
+            record_request(
+                method, url, resp.status_code, attempt - 1,
+                _response_bytes(resp, kwargs.get("stream", False)), time.perf_counter() - started,
+            )
+            return resp
+        delay = policy.backoff(attempt, _retry_after_seconds(resp))
+        robot_logger.info(f"{method} {url} → {resp.status_code}; retry {attempt} in {delay:.1f}s")
+        resp.close()
+        time.sleep(delay)
@@ -0,0 +1,82 @@
+"""
+Process-wide runsession caches shared by RW.Workspace and RW.RunSession.
+
+Kept apart from workspace_utils so that RW.RunSession, which only needs to
+parse the runsession text Robot hands it and drop stale entries after its
+own writes, does not import the whole Workspace keyword module.
+"""
+
+import os
+from typing import Any, Dict, Optional, Union
+
+from robot.api.deco import not_keyword
+
+from RW.Workspace.json_codec import dumps, loads
+from RW.Workspace.ttl_cache import TTLCache
+
+# RunSession JSON fetched within RUNSESSION_CACHE_TTL seconds is reused, so
+# Import Runsession Details, Import Memo Variable, the SLX short-name lookup
+# and Import Related RunSession Details download a runsession once per run.
+# Entries are keyed by (runsession URL, requested fields); a cached full copy
+# also answers any projected request.
+RUNSESSION_CACHE_TTL: float = float(os.getenv("RW_RUNSESSION_CACHE_TTL", "30"))
+
+_RUNSESSION_CACHE = TTLCache(maxsize=64, ttl=RUNSESSION_CACHE_TTL, name="runsession")
+
+# The runsession JSON text handed to Robot, mapped to the dict it was encoded
+# from. Runbooks pass that text on to Import Related RunSession Details and the
+# RW.RunSession analysis keywords; looking it up here means each runsession is
+# decoded once per run rather than once per keyword. Keys are the text itself,
+# so a lookup costs one hash of the string (cached on the str object) and a
+# collision can never return another runsession.
+_PARSED_RUNSESSIONS = TTLCache(maxsize=8, ttl=3600, name="runsession-text")
+
+
+def invalidate_runsession_cache(runsession_id: Optional[str] = None) -> None:
+    """
+    Forget cached runsession JSON – for *runsession_id* only, or every
+    runsession when omitted – so the next keyword re-fetches it (e.g. after
+    patching the runsession mid-suite). The RW keywords that PATCH or POST a
+    runsession call this themselves.
+    """
+    if runsession_id is None:
+        _RUNSESSION_CACHE.clear()
+        _PARSED_RUNSESSIONS.clear()
+        return
+    suffix = f"/runsessions/{runsession_id}"
+    _RUNSESSION_CACHE.invalidate_matching(lambda key: key[0].endswith(suffix))
+    # Parsed text of that runsession, so Parse RunSession can't serve it either
+    _PARSED_RUNSESSIONS.invalidate_where(
+        lambda _, data: isinstance(data, dict) and str(data.get("id")) == str(runsession_id)
+    )
+
+
+def _forget_created_runsession(created: Any) -> None:
+    """Internal: drop anything cached under the id of a runsession just POSTed."""
+    if isinstance(created, dict) and created.get("id") is not None:
+        invalidate_runsession_cache(str(created["id"]))
+
+
+def _runsession_text(data: Dict) -> str:
+    """Internal: encode *data* for Robot and remember the text's parsed form."""
+    text = dumps(data)
+    _PARSED_RUNSESSIONS.put(text, data)
+    return text
+
+
+@not_keyword
+def parse_runsession_json(data: Union[str, bytes, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    The runsession dict for *data*: a dict is returned as is, JSON text is
+    decoded on first sight and served from memory after that. Raises
+    json.JSONDecodeError for invalid text.
+
+    The result for text is shared with every other caller and must not be
+    modified; keywords that hand runsession data back to Robot return
+    copies of it.
+    """
+    if isinstance(data, dict):
+        return data
+    if not isinstance(data, str):
+        return loads(data)
+    return _PARSED_RUNSESSIONS.get_or_load(data, lambda: loads(data))
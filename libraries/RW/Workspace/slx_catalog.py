@@ -0,0 +1,614 @@
+"""
+SLX listing, paging and the shared catalog snapshot behind the RW.Workspace
+SLX lookup keywords.
+
+Not a keyword module: `workspace_utils` imports it from those keywords on
+their first call, so a runbook that never looks up SLXs doesn't load it (or
+the SLX index) at all.
+"""
+
+import concurrent.futures
+import itertools
+import os
+import threading
+import time
+import urllib.parse
+from collections import deque
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+from robot.api.deco import not_keyword
+
+from RW.Workspace.endpoints import WorkspaceEndpoints
+from RW.Workspace.json_codec import loads, response_json
+from RW.Workspace.retry_policy import request_with_retry
+from RW.Workspace.slx_index import SlxRecord, SlxSnapshot, TagMatch
+from RW.Workspace.ttl_cache import TTLCache
+from RW.Workspace.workspace_utils import (
+    _pushdown_supported,
+    _record_pushdown,
+    _with_query,
+    platform_logger,
+    warning_log,
+)
+
+# Pages fetched in parallel once the listing total is known (1 = sequential)
+SLX_PAGE_CONCURRENCY: int = int(os.getenv("RW_SLX_PAGE_CONCURRENCY", "4"))
+
+# SLXs requested per listing page
+SLX_PAGE_SIZE: int = int(os.getenv("RW_SLX_PAGE_SIZE", "500"))
+
+# Full SLXs fetched in parallel for the hits of a catalog lookup
+SLX_FETCH_CONCURRENCY: int = int(os.getenv("RW_SLX_FETCH_CONCURRENCY", "8"))
+
+# Push `Get Slxs With Tag` filters down to the SLX listing. Off unless the API
+# is known to support it: support can only be learnt per process, so on an API
+# that ignores the filter every runbook would list its SLXs twice
+SLX_TAG_FILTER_PUSHDOWN: bool = os.getenv("RW_SLX_TAG_FILTER", "false").lower() in ("1", "true", "yes")
+
+# Query parameter used to push a "name:value" tag filter down to the SLX listing
+SLX_TAG_FILTER_PARAM: str = os.getenv("RW_SLX_TAG_FILTER_PARAM", "tag")
+
+
+# ===========================================================================
+# Internal paginator
+# ===========================================================================
+
+def _fetch_slx_page(
+    session: requests.Session,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+) -> Optional[Tuple[requests.Response, Dict]]:
+    """
+    Internal: GET a single SLX page under the shared retry policy.
+
+    Returns ``(response, body)``; *body* is empty for a ``304 Not Modified``.
+    Returns None once timeouts are exhausted, re-raises any other failure.
+    """
+    try:
+        resp = request_with_retry(session, "GET", url, headers=headers, timeout=120)  # Increased timeout to 120 seconds to match search timeouts
+    except requests.Timeout:
+        warning_log("Max retries reached, giving up on paging SLXs")
+        return None
+    if resp.status_code == 304:
+        return resp, {}
+    resp.raise_for_status()
+    return resp, response_json(resp)
+
+
+def _next_slx_page_url(body: Dict, resp_url: str) -> Optional[str]:
+    """Internal: work out the next page URL from either `next` or `page` meta."""
+    # style A – SmartLink pagination
+    url = body.get("next")
+
+    # style B – offset/limit
+    if url is None and "page" in body:
+        p = body["page"]
+        ret = len(body.get("results", []))
+        total = p.get("total", ret)
+        off = p.get("offset", 0) + ret
+        if off < total:
+            url = _with_query(resp_url, offset=off)
+
+    return url
+
+
+def _remaining_slx_page_urls(body: Dict, resp_url: str) -> Optional[List[str]]:
+    """
+    Internal: URLs of every page after *body* when the listing total is known
+    from the first response (`page.total`, or `count` with an offset-style
+    `next` link). Returns None when only sequential `next` following works.
+    """
+    ret = len(body.get("results", []))
+    next_url = body.get("next")
+
+    if next_url:
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(next_url).query)
+        if "count" not in body or "offset" not in query:
+            return None  # cursor-style links – must be followed one by one
+        total = body["count"]
+        first = int(query["offset"][0])
+        stride = int(query["limit"][0]) if "limit" in query else ret
+        base = next_url
+    elif "page" in body:
+        p = body["page"]
+        total = p.get("total", ret)
+        first = p.get("offset", 0) + ret
+        stride = ret
+        base = resp_url
+    else:
+        return []
+
+    if not isinstance(total, int) or stride <= 0:
+        return None
+    return [_with_query(base, offset=off, limit=stride) for off in range(first, total, stride)]
+
+
+def _walk_slx_pages(
+    start_url: str,
+    session: requests.Session,
+    first_page: Optional[Tuple[requests.Response, Dict]] = None,
+    concurrency: Optional[int] = None,
+) -> Tuple[List[Dict], bool]:
+    """
+    Internal: collect every SLX reachable from *start_url*.
+
+    Returns ``(slxs, complete)`` where *complete* is False when paging gave up
+    part-way through. *first_page* lets a caller hand over a page it already
+    fetched (e.g. a conditional GET that came back 200).
+
+    Once the first page reveals the listing total, the remaining pages are
+    fetched by up to *concurrency* threads (default `SLX_PAGE_CONCURRENCY`)
+    and reassembled in order; each page keeps its own retry/backoff. Listings
+    that only expose `next` links are followed sequentially.
+    """
+    if concurrency is None:
+        concurrency = SLX_PAGE_CONCURRENCY
+
+    if concurrency > 1:
+        page = first_page if first_page is not None else _fetch_slx_page(session, start_url)
+        if page is None:
+            return [], False
+        resp, body = page
+        remaining = _remaining_slx_page_urls(body, resp.url)
+        if remaining is None:
+            first_page = page  # fall through to sequential paging
+        else:
+            collected: List[Dict] = list(body.get("results", []))
+            if not remaining:
+                return collected, True
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(concurrency, len(remaining))) as pool:
+                pages = pool.map(lambda u: _fetch_slx_page(session, u), remaining)
+                for page in pages:
+                    if page is None:
+                        # Same as sequential paging: keep what came before the failure
+                        return collected, False
+                    collected.extend(page[1].get("results", []))
+            return collected, True
+
+    collected = []
+    pages = _iter_slx_pages(start_url, session, first_page=first_page)
+    while True:
+        try:
+            _, body = next(pages)
+        except StopIteration as done:
+            return collected, done.value
+        collected.extend(body.get("results", []))
+
+
+def _iter_slx_pages(
+    start_url: str,
+    session: requests.Session,
+    first_page: Optional[Tuple[requests.Response, Dict]] = None,
+) -> Generator[Tuple[requests.Response, Dict], None, bool]:
+    """
+    Internal: lazily yield ``(response, body)`` for each SLX page in order.
+
+    The generator's return value is True when the last page was reached and
+    False when paging gave up part-way through.
+    """
+    url: Optional[str] = start_url
+
+    while url:
+        if first_page is not None:
+            page, first_page = first_page, None
+        else:
+            page = _fetch_slx_page(session, url)
+        if page is None:
+            return False
+        yield page
+        resp, body = page
+        url = _next_slx_page_url(body, resp.url)
+
+    return True
+
+
+def _prefetched_slx_pages(
+    start_url: str,
+    session: requests.Session,
+    concurrency: Optional[int] = None,
+    first_page: Optional[Tuple[requests.Response, Dict]] = None,
+) -> Generator[Tuple[requests.Response, Dict], None, bool]:
+    """
+    Internal: `_iter_slx_pages` with up to *concurrency* page requests
+    (default `SLX_PAGE_CONCURRENCY`) kept in flight ahead of the consumer.
+    *first_page* is used as in `_walk_slx_pages`.
+
+    Once the first page reveals the listing total, the following pages are
+    fetched concurrently as in `_walk_slx_pages`; listings that only expose
+    `next` links fetch page N+1 while page N is consumed. A consumer that
+    stops early leaves at most *concurrency* requests behind, whose results
+    are discarded.
+    """
+    if concurrency is None:
+        concurrency = SLX_PAGE_CONCURRENCY
+    if concurrency <= 1:
+        return (yield from _iter_slx_pages(start_url, session, first_page=first_page))
+
+    page = first_page if first_page is not None else _fetch_slx_page(session, start_url)
+    first_page = None
+    if page is None:
+        return False
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        resp, body = page
+        remaining = _remaining_slx_page_urls(body, resp.url)
+        if remaining is None:
+            # `next` links only – one request ahead is all that can be known
+            while True:
+                next_url = _next_slx_page_url(body, resp.url)
+                ahead = pool.submit(_fetch_slx_page, session, next_url) if next_url else None
+                yield page
+                if ahead is None:
+                    return True
+                page = ahead.result()
+                if page is None:
+                    return False
+                resp, body = page
+
+        del resp, body  # held by *page* only, until the consumer is done with it
+        yield page
+        urls = iter(remaining)
+        window = deque(pool.submit(_fetch_slx_page, session, u) for u in itertools.islice(urls, concurrency))
+        while window:
+            page = window.popleft().result()
+            if page is None:
+                return False
+            next_url = next(urls, None)
+            if next_url is not None:
+                window.append(pool.submit(_fetch_slx_page, session, next_url))
+            yield page
+        return True
+    finally:
+        # Don't wait for requests an early stop made unnecessary
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+@not_keyword
+def iter_slxs(start_url: str, session: requests.Session) -> Iterator[Dict]:
+    """
+    Yield SLXs from the listing at *start_url* in catalog order.
+
+    Nothing is requested until the first SLX is consumed. Pages are fetched
+    a few ahead of the caller (`SLX_PAGE_CONCURRENCY`, concurrently when the
+    listing total is known), and none beyond those once the caller stops
+    iterating, so callers that only need the first few matches never pay
+    for (or hold) the rest of the catalog.
+    """
+    for _, body in _prefetched_slx_pages(start_url, session):
+        yield from body.get("results", [])
+
+
+def _slx_records(
+    pages: Generator[Tuple[requests.Response, Dict], None, bool],
+) -> Tuple[List[SlxRecord], List[Tuple[str, Dict[str, str]]], bool]:
+    """
+    Internal: reduce each page from *pages* (see `_prefetched_slx_pages`) to
+    `SlxRecord`s as soon as it arrives and drop its body, so a snapshot never
+    holds more than the pages in flight instead of the whole listing.
+    Returns ``(records, validators, complete)``: *validators* holds
+    `_page_validators` for each page, *complete* is as in `_walk_slx_pages`.
+    """
+    records: List[SlxRecord] = []
+    validators: List[Tuple[str, Dict[str, str]]] = []
+    while True:
+        try:
+            resp, body = next(pages)
+        except StopIteration as done:
+            return records, validators, done.value
+        validators.append(_page_validators(resp))
+        records.extend(SlxRecord.from_slx(slx) for slx in body.get("results", []))
+        del resp, body
+
+
+def _page_through_slxs(
+    start_url: str,
+    session: requests.Session,
+    concurrency: Optional[int] = None,
+) -> List[Dict]:
+    """Internal: generic paginator compatible with both `next` and `page` meta."""
+    collected, _ = _walk_slx_pages(start_url, session, concurrency=concurrency)
+    return collected
+
+
+def _slx_list_url(ep: WorkspaceEndpoints, **params: Any) -> str:
+    """Internal: first-page URL of a workspace's SLX listing."""
+    url = f"{ep.url('slxs')}?limit={SLX_PAGE_SIZE}"
+    return _with_query(url, **params) if params else url
+
+
+# ===========================================================================
+# SLX catalog snapshot
+# ===========================================================================
+#
+# `Get Slxs With Tag`, `Get Slxs With Entity Reference` and
+# `Get Slxs With Targeted Entity Reference` all need the complete SLX
+# listing. Rather than paging the workspace once per keyword call, they share
+# one in-process snapshot per listing URL. Within `SLX_CATALOG_TTL` seconds the
+# snapshot is served as-is; after that it is revalidated with conditional GETs
+# (If-None-Match / If-Modified-Since) of every listing page – a page's
+# validators only vouch for that page – and re-paged when any page reports a
+# change or cannot answer conditionally. The first page is asked first, so a
+# change there costs no more than paging the listing.
+#
+# Snapshots hold slim `SlxRecord`s only. The SLXs a lookup returns are fetched
+# again by name (`_full_slxs`), concurrently, and kept for SLX_CATALOG_TTL.
+
+SLX_CATALOG_TTL: float = float(os.getenv("RW_SLX_CATALOG_TTL", "60"))
+
+
+class _SlxCatalog:
+    """Internal: current SLX snapshot plus the validators needed to refresh it."""
+
+    def __init__(self, start_url: str):
+        self.start_url = start_url
+        self.snapshot = SlxSnapshot([])
+        # `_page_validators` of every listing page, in order
+        self.pages: List[Tuple[str, Dict[str, str]]] = []
+        self.fetched_at: Optional[float] = None
+        self.lock = threading.Lock()
+
+    def is_fresh(self, max_age: float) -> bool:
+        return self.fetched_at is not None and time.monotonic() - self.fetched_at < max_age
+
+    def store(self, snapshot: SlxSnapshot, pages: List[Tuple[str, Dict[str, str]]]) -> None:
+        self.snapshot = snapshot
+        self.pages = pages
+        self.fetched_at = time.monotonic()
+
+
+_SLX_CATALOGS: Dict[str, _SlxCatalog] = {}
+_SLX_CATALOGS_LOCK = threading.Lock()
+
+
+def _page_validators(resp: requests.Response) -> Tuple[str, Dict[str, str]]:
+    """Internal: ``(url, conditional headers)`` to revalidate the page *resp* answered."""
+    headers: Dict[str, str] = {}
+    if resp.headers.get("ETag"):
+        headers["If-None-Match"] = resp.headers["ETag"]
+    if resp.headers.get("Last-Modified"):
+        headers["If-Modified-Since"] = resp.headers["Last-Modified"]
+    return resp.url, headers
+
+
+def _slx_pages_unchanged(session: requests.Session, pages: List[Tuple[str, Dict[str, str]]]) -> Optional[bool]:
+    """
+    Internal: conditionally GET each of *pages* (see `_page_validators`), up
+    to `SLX_PAGE_CONCURRENCY` at a time. True when every page answers
+    ``304 Not Modified``; False when one has changed, is gone or has no
+    validators; None when the API could not be reached.
+    """
+    def unchanged(page: Tuple[str, Dict[str, str]]) -> Optional[bool]:
+        url, headers = page
+        if not headers:
+            return False
+        try:
+            got = _fetch_slx_page(session, url, headers=headers)
+        except requests.HTTPError:
+            return False  # e.g. the listing shrank past this page
+        return None if got is None else got[0].status_code == 304
+
+    if len(pages) <= 1 or SLX_PAGE_CONCURRENCY <= 1:
+        outcomes: Iterable[Optional[bool]] = map(unchanged, pages)  # stops at the first change
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(SLX_PAGE_CONCURRENCY, len(pages))) as pool:
+            outcomes = list(pool.map(unchanged, pages))
+    for outcome in outcomes:
+        if outcome is not True:
+            return outcome
+    return True
+
+
+def _get_slx_catalog(
+    start_url: str,
+    session: requests.Session,
+    max_age: Optional[float] = None,
+) -> SlxSnapshot:
+    """
+    Internal: return the shared SLX snapshot for *start_url*, refreshing it
+    first when it is older than *max_age* seconds.
+
+    Raises the same request/JSON errors as `_page_through_slxs`.
+    """
+    if max_age is None:
+        max_age = SLX_CATALOG_TTL
+
+    with _SLX_CATALOGS_LOCK:
+        catalog = _SLX_CATALOGS.setdefault(start_url, _SlxCatalog(start_url))
+
+    with catalog.lock:
+        if catalog.is_fresh(max_age):
+            return catalog.snapshot
+
+        headers = catalog.pages[0][1] if catalog.fetched_at is not None and catalog.pages else {}
+        first_page = _fetch_slx_page(session, start_url, headers=headers or None)
+        if first_page is not None and first_page[0].status_code == 304:
+            unchanged = _slx_pages_unchanged(session, catalog.pages[1:])
+            if unchanged:
+                platform_logger.debug("SLX catalog unchanged for %s", start_url)
+                catalog.fetched_at = time.monotonic()
+                return catalog.snapshot
+            # Changed further down the listing: page it all again
+            first_page = None if unchanged is None else _fetch_slx_page(session, start_url)
+        if first_page is None:
+            # Could not reach the API at all – serve the stale copy if we have one
+            return catalog.snapshot
+
+        pages = _prefetched_slx_pages(start_url, session, first_page=first_page)
+        del first_page
+        records, validators, complete = _slx_records(pages)
+        snapshot = SlxSnapshot(records)
+        if complete:
+            catalog.store(snapshot, validators)
+        return snapshot
+
+
+def _cached_slx_catalog(start_url: str, session: requests.Session) -> Optional[SlxSnapshot]:
+    """
+    Internal: the (revalidated) snapshot for *start_url*, or None while no
+    snapshot has been taken yet – callers then stream the listing instead.
+    """
+    with _SLX_CATALOGS_LOCK:
+        catalog = _SLX_CATALOGS.get(start_url)
+    if catalog is None or catalog.fetched_at is None:
+        return None
+    return _get_slx_catalog(start_url, session)
+
+
+def _scan_slx_catalog(start_url: str, session: requests.Session) -> Iterator[SlxRecord]:
+    """
+    Internal: stream a cold catalog as `SlxRecord`s that still carry their
+    SLX (``record.slx``), with the next pages already being fetched (see
+    `_prefetched_slx_pages`) so a scan that needs most of the catalog is not
+    left paging sequentially.
+
+    A scan that runs to the last page leaves a snapshot of slim records
+    behind for later lookups; one abandoned early (hit cap reached) stores
+    nothing. Each page body is dropped once the caller has moved past it.
+    """
+    pages = _prefetched_slx_pages(start_url, session)
+    records: List[SlxRecord] = []
+    validators: List[Tuple[str, Dict[str, str]]] = []
+    while True:
+        try:
+            resp, body = next(pages)
+        except StopIteration as done:
+            complete = done.value
+            break
+        validators.append(_page_validators(resp))
+        for slx in body.get("results", []):
+            record = SlxRecord.from_slx(slx, keep=True)
+            records.append(SlxRecord(record.short_name, record.alias, record.tags))
+            yield record
+        del resp, body
+
+    if complete and validators:
+        with _SLX_CATALOGS_LOCK:
+            catalog = _SLX_CATALOGS.setdefault(start_url, _SlxCatalog(start_url))
+        with catalog.lock:
+            catalog.store(SlxSnapshot(records), validators)
+
+
+_SLX_DETAILS = TTLCache(maxsize=256, ttl=SLX_CATALOG_TTL, name="slx")
+
+
+def _slx_url(list_url: str, short_name: str) -> str:
+    """Internal: URL of one SLX in the listing at *list_url*."""
+    return f"{list_url.split('?', 1)[0]}/{short_name}"
+
+
+def _fetch_slx(session: requests.Session, url: str) -> bytes:
+    """Internal: the JSON body of the SLX at *url*; empty when it no longer exists."""
+    resp = request_with_retry(session, "GET", url, timeout=120)
+    if resp.status_code == 404:
+        return b""
+    resp.raise_for_status()
+    return resp.content
+
+
+def _full_slxs(session: requests.Session, list_url: str, records: List[SlxRecord]) -> List[Dict]:
+    """
+    Internal: the full SLX for each of *records*, in order, fetched by name
+    (`SLX_FETCH_CONCURRENCY` at a time) and cached for `SLX_CATALOG_TTL`.
+    Each call decodes fresh dicts. SLXs deleted since the snapshot was taken
+    are left out. Raises the usual request errors.
+    """
+    urls = [_slx_url(list_url, record.short_name) for record in records if record.short_name]
+
+    def load(url: str) -> bytes:
+        return _SLX_DETAILS.get_or_load(url, lambda: _fetch_slx(session, url))
+
+    if len(urls) <= 1 or SLX_FETCH_CONCURRENCY <= 1:
+        bodies = [load(url) for url in urls]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(SLX_FETCH_CONCURRENCY, len(urls)), thread_name_prefix="rw-slx-fetch"
+        ) as pool:
+            bodies = list(pool.map(load, urls))
+    return [loads(body) for body in bodies if body]
+
+
+def invalidate_slx_catalog() -> None:
+    """Drop every SLX catalog snapshot and cached SLX (see `workspace_utils.invalidate_slx_catalog`)."""
+    with _SLX_CATALOGS_LOCK:
+        _SLX_CATALOGS.clear()
+    _SLX_DETAILS.clear()
+
+
+# ===========================================================================
+# Server-side tag filtering (opt-in, RW_SLX_TAG_FILTER)
+# ===========================================================================
+
+def _filtered_slx_listing(
+    ep: WorkspaceEndpoints,
+    session: requests.Session,
+    pair: Tuple[str, str],
+) -> Optional[List[Dict]]:
+    """
+    Internal: SLXs tagged with *pair*, listed with the tag filter pushed down
+    to the API. Returns None when the API rejects or ignores the filter (or
+    paging fails part-way), so the caller falls back to the full catalog.
+    """
+    root = ep.root
+    url = _slx_list_url(ep, **{SLX_TAG_FILTER_PARAM: f"{pair[0]}:{pair[1]}"})
+    try:
+        first_page = _fetch_slx_page(session, url)
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 400:
+            _record_pushdown(root, "tag_filter", False)
+            return None
+        raise
+    if first_page is None:
+        return None
+
+    results = first_page[1].get("results", [])
+    if results:
+        honoured = all(pair in SlxRecord.from_slx(slx).tags for slx in results)
+        _record_pushdown(root, "tag_filter", honoured)
+        if not honoured:
+            return None
+
+    slxs, complete = _walk_slx_pages(url, session, first_page=first_page)
+    return slxs if complete else None
+
+
+def _tag_filtered_slxs(
+    ep: WorkspaceEndpoints,
+    session: requests.Session,
+    wanted: set,
+    match_all: bool,
+) -> Optional[List[Dict]]:
+    """
+    Internal: answer a tag lookup with server-side filtered listings – one per
+    pair for "any" (fetched concurrently), the first pair for "all" – then
+    re-check every hit client-side. None means "use the catalog instead".
+    """
+    if not SLX_TAG_FILTER_PUSHDOWN or _pushdown_supported(ep.root, "tag_filter") is False:
+        return None
+    pairs = sorted(wanted)
+    if match_all:
+        pairs = pairs[:1]
+    elif len(pairs) > SLX_PAGE_CONCURRENCY:
+        return None  # more round trips than paging the catalog is worth
+
+    if len(pairs) == 1:
+        listings = [_filtered_slx_listing(ep, session, pairs[0])]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(pairs), thread_name_prefix="rw-slx-filter") as pool:
+            listings = list(pool.map(
+                lambda pair: _filtered_slx_listing(ep, session, pair), pairs
+            ))
+    if any(listing is None for listing in listings):
+        return None
+
+    predicate = TagMatch(wanted, match_all=match_all)
+    hits: List[Dict] = []
+    seen: set = set()
+    for listing in listings:
+        for slx in listing:
+            record = SlxRecord.from_slx(slx)
+            key = record.short_name or id(slx)
+            if key not in seen and predicate.matches(record):
+                seen.add(key)
+                hits.append(slx)
+    return hits
@@ -0,0 +1,410 @@
+"""
+In-memory SLX lookup structures built from a workspace's SLX listing.
+
+Nothing in here talks to the Workspace API – `workspace_utils` fetches the
+listing and hands it over as an `SlxSnapshot`, whose indexes are built lazily
+the first time a lookup needs them and then reused for the snapshot's lifetime.
+
+Snapshots keep each SLX as a slim `SlxRecord` rather than the full JSON
+dict: lookups only need the short name, alias and tags. Lookups return
+records; `workspace_utils` fetches the full SLX again for the ones a keyword
+actually returns.
+"""
+
+import sys
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from robot.api.deco import not_keyword
+
+
+TagPair = Tuple[str, str]
+
+
+@not_keyword
+def normalize_tag_pair(name: Any, value: Any) -> TagPair:
+    """Return the case-insensitive key used for tag matching."""
+    return str(name or "").strip().lower(), str(value or "").strip().lower()
+
+
+@not_keyword
+def slx_tag_value_contains(slx: Dict, tag_names: Set[str], terms: Iterable[str]) -> bool:
+    """
+    True when *slx* has a tag named in *tag_names* (lowercase) whose lowercased
+    value contains any of the lowercase *terms* (single-SLX check).
+    """
+    for tag in slx.get("spec", {}).get("tags", []):
+        if str(tag.get("name") or "").lower() in tag_names:
+            value = str(tag.get("value") or "").lower()
+            if any(term in value for term in terms):
+                return True
+    return False
+
+
+class SlxRecord:
+    """
+    Slim, read-only projection of one SLX: short name, alias and tags.
+
+    ``tags`` holds normalised ``(name, value)`` pairs whose strings are
+    interned, so the handful of distinct tag names (and common values such as
+    resource types) are stored once per process instead of once per SLX.
+    Snapshot records keep nothing else; records built while streaming pages
+    can keep the page's dict in ``slx``. Both the v2 shape (``short_name``,
+    top-level ``alias``) and the legacy one (``shortName``, ``spec.alias``)
+    are accepted.
+    """
+
+    __slots__ = ("short_name", "alias", "tags", "slx")
+
+    def __init__(self, short_name: str, alias: str, tags: Tuple[TagPair, ...], slx: Optional[Dict] = None):
+        self.short_name = short_name
+        self.alias = alias
+        self.tags = tags
+        self.slx = slx
+
+    @classmethod
+    def from_slx(cls, slx: Dict, keep: bool = False) -> "SlxRecord":
+        """
+        Project *slx*. With ``keep=True`` the dict itself is kept as ``slx``
+        (for short-lived records, e.g. while streaming pages).
+        """
+        spec = slx.get("spec") or {}
+        tags = []
+        for tag in spec.get("tags", []):
+            name, value = normalize_tag_pair(tag.get("name"), tag.get("value"))
+            tags.append((sys.intern(name), sys.intern(value)))
+        return cls(
+            slx.get("shortName") or slx.get("short_name", ""),
+            spec.get("alias") or slx.get("alias") or "",
+            tuple(tags),
+            slx if keep else None,
+        )
+
+    def corpus(self) -> str:
+        """Lowercased alias + tag text used by the broader entity-reference tier."""
+        parts = [self.alias.lower()]
+        for name, value in self.tags:
+            parts.extend([name, value, f"{name}:{value}"])
+        return " ".join(parts)
+
+
+class TagMatch:
+    """Predicate: the SLX carries any (or, with *match_all*, every) tag pair."""
+
+    def __init__(self, pairs: Iterable[TagPair], match_all: bool = False, limit: Optional[int] = None):
+        self.pairs = frozenset(pairs)
+        self.match_all = match_all
+        self.limit = limit
+
+    def matches(self, record: SlxRecord) -> bool:
+        if not self.pairs:
+            return False
+        if self.match_all:
+            return self.pairs.issubset(record.tags)
+        return not self.pairs.isdisjoint(record.tags)
+
+
+class TagValueMatch:
+    """
+    Predicate: a tag named in *tag_names* has a value containing any of the
+    *terms* (same semantics as `slx_tag_value_contains`).
+    """
+
+    def __init__(self, tag_names: Iterable[str], terms: Iterable[str], limit: Optional[int] = None):
+        self.tag_names = {t.lower() for t in tag_names}
+        self.terms = [t.lower() for t in terms]
+        self.limit = limit
+
+    def matches(self, record: SlxRecord) -> bool:
+        terms = self.terms
+        return any(
+            name in self.tag_names and any(term in value for term in terms)
+            for name, value in record.tags
+        )
+
+
+@not_keyword
+def match_slxs(records: Iterable[SlxRecord], predicates: Dict[str, Any]) -> Dict[str, List[SlxRecord]]:
+    """
+    Evaluate several `TagMatch` / `TagValueMatch` predicates in a single pass
+    over *records* and return ``{predicate key: matching records}`` (catalog
+    order).
+
+    Tags are normalised once per SLX (by `SlxRecord`) and shared by every
+    predicate; a predicate stops collecting once its *limit* is reached, and
+    the scan ends as soon as every predicate is satisfied.
+    """
+    results: Dict[str, List[SlxRecord]] = {key: [] for key in predicates}
+    open_predicates = {key: p for key, p in predicates.items() if p.limit is None or p.limit > 0}
+    for record in records:
+        if not open_predicates:
+            break
+        for key, predicate in list(open_predicates.items()):
+            if predicate.matches(record):
+                hits = results[key]
+                hits.append(record)
+                if predicate.limit and len(hits) >= predicate.limit:
+                    del open_predicates[key]
+    return results
+
+
+class SlxTagIndex:
+    """
+    Inverted index from normalised ``(tag name, tag value)`` pairs to the
+    positions of the SLXs carrying them.
+
+    Positions refer to the listing the index was built from, so results can be
+    returned in catalog order without re-scanning it.
+    """
+
+    def __init__(self, records: List[SlxRecord]):
+        postings: Dict[TagPair, Set[int]] = defaultdict(set)
+        for pos, record in enumerate(records):
+            for pair in record.tags:
+                postings[pair].add(pos)
+        self._postings: Dict[TagPair, Set[int]] = dict(postings)
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def positions(self, pair: TagPair) -> Set[int]:
+        """Return the positions of SLXs tagged with *pair* (already normalised)."""
+        return self._postings.get(pair, set())
+
+    def lookup(self, pairs: Iterable[TagPair], match_all: bool = False) -> List[int]:
+        """
+        Return sorted positions of SLXs matching *pairs*.
+
+        With ``match_all=False`` an SLX matches when it carries any of the
+        pairs (set union); with ``match_all=True`` it must carry all of them
+        (set intersection).
+        """
+        wanted = set(pairs)
+        if not wanted:
+            return []
+
+        if match_all:
+            # Intersect smallest posting lists first so we bail out early.
+            ordered = sorted((self.positions(p) for p in wanted), key=len)
+            hits = set(ordered[0])
+            for posting in ordered[1:]:
+                if not hits:
+                    break
+                hits &= posting
+        else:
+            hits = set()
+            for pair in wanted:
+                hits |= self.positions(pair)
+
+        return sorted(hits)
+
+
+class SubstringIndex:
+    """
+    Trigram index answering ``term in doc`` over a fixed list of lowercase
+    documents, each owned by an SLX position.
+
+    A lookup only verifies the documents in the shortest posting list of the
+    term's trigrams, so selective terms touch a handful of documents instead
+    of the whole catalog. Terms shorter than three characters cannot be
+    narrowed down and fall back to a plain scan.
+    """
+
+    GRAM = 3
+
+    def __init__(self, docs: List[str], owners: List[int]):
+        self._docs = docs
+        self._owners = owners
+        grams: Dict[str, List[int]] = defaultdict(list)
+        n = self.GRAM
+        for doc_id, doc in enumerate(docs):
+            for gram in {doc[i:i + n] for i in range(len(doc) - n + 1)}:
+                grams[gram].append(doc_id)
+        self._grams: Dict[str, List[int]] = dict(grams)
+
+    def _candidates(self, term: str) -> Iterable[int]:
+        n = self.GRAM
+        if len(term) < n:
+            return range(len(self._docs))
+        shortest: Optional[List[int]] = None
+        for gram in {term[i:i + n] for i in range(len(term) - n + 1)}:
+            posting = self._grams.get(gram)
+            if posting is None:
+                return ()
+            if shortest is None or len(posting) < len(shortest):
+                shortest = posting
+        return shortest or ()
+
+    def owners_containing(self, term: str) -> Set[int]:
+        """Return positions of SLXs owning a document that contains *term*."""
+        docs, owners = self._docs, self._owners
+        return {owners[d] for d in self._candidates(term) if term in docs[d]}
+
+
+@not_keyword
+def slx_corpus(slx: Dict) -> str:
+    """Lowercased alias + tag text used by the broader entity-reference tier."""
+    spec = slx.get("spec", {})
+    corpus = [spec.get("alias") or slx.get("alias") or ""]
+    for t in spec.get("tags", []):
+        n, v = t.get("name", ""), t.get("value", "")
+        corpus.extend([str(n), str(v), f"{n}:{v}"])
+    return " ".join(corpus).lower()
+
+
+class SlxSnapshot:
+    """
+    Immutable SLX listing plus the lookup indexes derived from it.
+
+    A new snapshot is created whenever the listing is re-paged, so indexes
+    never have to be patched in place and readers on other threads always see
+    a consistent view. The listing is held as `SlxRecord`s (built page by page
+    while paging) and lookups return the matching records in catalog order.
+    """
+
+    def __init__(self, records: Iterable[SlxRecord]):
+        self.records: List[SlxRecord] = list(records)
+        self._lock = threading.Lock()
+        self._tag_index: Optional[SlxTagIndex] = None
+        self._value_indexes: Dict[str, SubstringIndex] = {}
+        self._corpus_index: Optional[SubstringIndex] = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _at(self, positions: Iterable[int]) -> List[SlxRecord]:
+        records = self.records
+        return [records[pos] for pos in positions]
+
+    @property
+    def tag_index(self) -> SlxTagIndex:
+        if self._tag_index is None:
+            with self._lock:
+                if self._tag_index is None:
+                    self._tag_index = SlxTagIndex(self.records)
+        return self._tag_index
+
+    def with_tags(self, pairs: Iterable[TagPair], match_all: bool = False) -> List[SlxRecord]:
+        """Return SLXs (in catalog order) matching the normalised tag *pairs*."""
+        return self._at(self.tag_index.lookup(pairs, match_all=match_all))
+
+    def match(self, predicates: Dict[str, Any]) -> Dict[str, List[SlxRecord]]:
+        """Evaluate *predicates* in one pass over the snapshot (see `match_slxs`)."""
+        return match_slxs(self.records, predicates)
+
+    def value_index(self, tag_name: str) -> SubstringIndex:
+        """Substring index over the lowercased values of tags named *tag_name*."""
+        tag_name = tag_name.lower()
+        index = self._value_indexes.get(tag_name)
+        if index is None:
+            with self._lock:
+                index = self._value_indexes.get(tag_name)
+                if index is None:
+                    docs: List[str] = []
+                    owners: List[int] = []
+                    for pos, record in enumerate(self.records):
+                        for name, value in record.tags:
+                            if name == tag_name:
+                                docs.append(value)
+                                owners.append(pos)
+                    index = SubstringIndex(docs, owners)
+                    self._value_indexes[tag_name] = index
+        return index
+
+    @property
+    def corpus_index(self) -> SubstringIndex:
+        """Substring index over each SLX's alias + tag corpus."""
+        if self._corpus_index is None:
+            with self._lock:
+                if self._corpus_index is None:
+                    docs = [record.corpus() for record in self.records]
+                    self._corpus_index = SubstringIndex(docs, list(range(len(docs))))
+        return self._corpus_index
+
+    def with_tag_values_containing(
+        self,
+        tag_names: Iterable[str],
+        terms: Iterable[str],
+        limit: Optional[int] = None,
+    ) -> List[SlxRecord]:
+        """
+        Return SLXs (in catalog order) having a tag named in *tag_names* whose
+        lowercased value contains any of the lowercase *terms*.
+        """
+        terms = list(terms)
+        hits: Set[int] = set()
+        for name in set(tag_names):
+            index = self.value_index(name)
+            for term in terms:
+                hits |= index.owners_containing(term)
+        return self._at(sorted(hits)[:limit])
+
+    def with_corpus_containing(self, terms: Iterable[str], limit: Optional[int] = None) -> List[SlxRecord]:
+        """
+        Return SLXs (in catalog order) whose alias + tag corpus contains any of
+        the lowercase *terms*.
+        """
+        hits: Set[int] = set()
+        for term in terms:
+            hits |= self.corpus_index.owners_containing(term)
+        return self._at(sorted(hits)[:limit])
+
+
+class SlxGroupIndex:
+    """
+    SLX → slxGroups map precomputed from a workspace.yaml (``spec.slxGroups``).
+
+    Finding an SLX's group(s) is a dict lookup instead of a scan of every
+    group's member list.
+    """
+
+    def __init__(self, workspace_config: Dict):
+        groups = (workspace_config or {}).get("spec", {}).get("slxGroups", []) or []
+        self.group_slxs: List[List[str]] = [list(g.get("slxs", []) or []) for g in groups]
+        self.group_names: List[str] = [str(g.get("name", "")) for g in groups]
+        memberships: Dict[str, List[int]] = defaultdict(list)
+        for gid, slxs in enumerate(self.group_slxs):
+            for slx in slxs:
+                if not memberships[slx] or memberships[slx][-1] != gid:
+                    memberships[slx].append(gid)
+        self._memberships: Dict[str, List[int]] = dict(memberships)
+
+    def groups_of(self, slx_name: str) -> List[int]:
+        """Indexes (in workspace.yaml order) of the groups containing *slx_name*."""
+        return self._memberships.get(slx_name, [])
+
+    def nearby(self, slx_name: str, depth: int = 1, all_groups: bool = False) -> List[str]:
+        """
+        SLXs within *depth* group hops of *slx_name*.
+
+        With ``depth=1`` and ``all_groups=False`` this is the member list of
+        the first group containing the SLX, exactly as listed. Otherwise the
+        members of every group reached are merged in discovery order without
+        duplicates; each extra hop adds the groups of SLXs found so far.
+        """
+        first = self.groups_of(slx_name)
+        if not first:
+            return []
+        if depth <= 1 and not all_groups:
+            return list(self.group_slxs[first[0]])
+
+        seen_groups: Set[int] = set()
+        seen_slxs: Set[str] = set()
+        result: List[str] = []
+        frontier = first if all_groups else first[:1]
+        for _ in range(max(1, depth)):
+            next_frontier: List[int] = []
+            for gid in frontier:
+                if gid in seen_groups:
+                    continue
+                seen_groups.add(gid)
+                for slx in self.group_slxs[gid]:
+                    if slx not in seen_slxs:
+                        seen_slxs.add(slx)
+                        result.append(slx)
+                        next_frontier.extend(self.groups_of(slx))
+            frontier = next_frontier
+            if not frontier:
+                break
+        return result
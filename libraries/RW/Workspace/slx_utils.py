@@ -9,6 +9,9 @@ from typing import Optional, Dict
 from robot.api.deco import keyword
 from robot.libraries.BuiltIn import BuiltIn
 
+from RW.Workspace.json_codec import response_json
+from RW.Workspace.runsession_cache import parse_runsession_json
+
 
 @keyword("Get Current SLX Short Name")
 def get_current_slx_short_name() -> Optional[str]:
@@ -43,12 +46,13 @@ def get_current_slx_short_name() -> Optional[str]:
         # Last resort: try getting from runsession details (requires RW_SESSION_ID)
         from RW.Workspace.workspace_utils import import_runsession_details
         
-        runsession_json = import_runsession_details()
+        runsession_json = import_runsession_details(fields=["runRequests.slxName"])
         if not runsession_json:
             BuiltIn().log("Could not retrieve runsession details", level="WARN")
             return None
         
-        runsession = json.loads(runsession_json)
+        # Import Runsession Details registered this text, so it is not decoded again
+        runsession = parse_runsession_json(runsession_json)
         
         # Get the most recent runRequest
         run_requests = runsession.get("runRequests", [])
@@ -93,8 +97,9 @@ def get_current_sli_interval_seconds(slx_short_name: Optional[str] = None) -> Op
         Log    SLI runs every ${interval} seconds
     """
     try:
-        from RW.Workspace.workspace_utils import import_platform_variable
-        from RW import platform
+        from RW.Workspace.endpoints import workspace_endpoints
+        from RW.Workspace.http_session import get_workspace_session
+        from RW.Workspace.retry_policy import request_with_retry
         
         # Try to use RW_SLX_API_URL if it's available (already has full URL)
         slx_api_url = os.getenv("RW_SLX_API_URL")
@@ -105,8 +110,7 @@ def get_current_sli_interval_seconds(slx_short_name: Optional[str] = None) -> Op
             BuiltIn().log(f"Using RW_SLX_API_URL: {slx_url}", level="INFO")
         else:
             # Construct URL from workspace and SLX name
-            ws = import_platform_variable("RW_WORKSPACE")
-            root = import_platform_variable("RW_WORKSPACE_API_URL")
+            ep = workspace_endpoints()
             
             # Get SLX short name (use provided or try to auto-detect)
             if not slx_short_name:
@@ -116,34 +120,16 @@ def get_current_sli_interval_seconds(slx_short_name: Optional[str] = None) -> Op
                     return 60
             else:
                 BuiltIn().log(f"Using provided SLX: {slx_short_name}", level="INFO")
-            
-            # Handle workspace prefix
-            workspace_path = ws.lstrip('/')
-            if workspace_path.startswith('workspaces/'):
-                workspace_path = workspace_path[len('workspaces/'):]
-            
-            # Handle case where root might already include "/workspaces" suffix
-            base_url = root.rstrip('/')
-            if base_url.endswith('/workspaces'):
-                slx_url = f"{base_url}/{workspace_path}/slxs/{slx_short_name}"
-            else:
-                slx_url = f"{base_url}/workspaces/{workspace_path}/slxs/{slx_short_name}"
+
+            slx_url = ep.slx(slx_short_name)
         
-        # Build authenticated session
-        token = os.getenv("RW_USER_TOKEN")
-        if token:
-            sess = requests.Session()
-            sess.headers.update({
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {token}",
-            })
-        else:
-            sess = platform.get_authenticated_session()
+        # Shared authenticated session (RW_USER_TOKEN overrides locally)
+        sess = get_workspace_session(slx_url)
         
         try:
-            response = sess.get(slx_url, timeout=120)
+            response = request_with_retry(sess, "GET", slx_url, timeout=120)
             response.raise_for_status()
-            slx_data = response.json()
+            slx_data = response_json(response)
             
             # Navigate to sli.spec.intervalSeconds (correct path based on SLX structure)
             sli_spec = slx_data.get("sli", {}).get("spec", {})
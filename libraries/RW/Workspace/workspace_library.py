@@ -0,0 +1,97 @@
+"""
+`RW.Workspace` as a single GLOBAL library instance.
+
+Robot uses a class named after its module as the library, so
+``Library    RW.Workspace`` now creates one `Workspace` for the whole run.
+It resolves the workspace location once and holds the pooled session, the
+endpoint templates and the keyword caches for the suite's lifetime.
+
+Every existing keyword keeps its name and arguments: the instance serves the
+package's keyword functions (hybrid library API), and those functions resolve
+the same shared `WorkspaceEndpoints` the instance holds.
+"""
+
+import importlib
+import inspect
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from robot.api.deco import keyword
+
+from RW.Workspace.endpoints import WorkspaceEndpoints, workspace_endpoints
+from RW.Workspace.ttl_cache import TTLCache
+from RW.Workspace.runsession_cache import _RUNSESSION_CACHE, invalidate_runsession_cache
+from RW.Workspace.workspace_utils import (
+    _TASK_SEARCH_CACHE,
+    clear_task_search_cache,
+    invalidate_slx_catalog,
+    invalidate_workspace_config,
+)
+
+
+def _module_keywords() -> Dict[str, Callable]:
+    """Internal: what Robot would expose for the package as a module library."""
+    package = importlib.import_module("RW.Workspace")
+    return {
+        name: obj
+        for name, obj in vars(package).items()
+        if not name.startswith("_")
+        and inspect.isroutine(obj)
+        and not getattr(obj, "robot_not_keyword", False)
+    }
+
+
+class Workspace:
+    """Workspace API keywords sharing one resolved workspace, session and cache set."""
+
+    ROBOT_LIBRARY_SCOPE = "GLOBAL"
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self):
+        self.ROBOT_LIBRARY_LISTENER = self
+        self._endpoints: Optional[WorkspaceEndpoints] = None
+        self._keywords = _module_keywords()
+
+    def get_keyword_names(self) -> List[str]:
+        return [*self._keywords, "reset_workspace_state"]
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__["_keywords"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @property
+    def endpoints(self) -> WorkspaceEndpoints:
+        """RW_WORKSPACE / RW_WORKSPACE_API_URL, resolved on first use (ImportError if unset)."""
+        if self._endpoints is None:
+            self._endpoints = workspace_endpoints()
+        return self._endpoints
+
+    @property
+    def session(self) -> requests.Session:
+        return self.endpoints.session()
+
+    @property
+    def caches(self) -> Dict[str, TTLCache]:
+        return {"task_search": _TASK_SEARCH_CACHE, "runsession": _RUNSESSION_CACHE}
+
+    def close(self) -> None:
+        """Listener hook run when Robot is done with the library: close the async clients' aiohttp sessions."""
+        async_client = sys.modules.get("RW.Workspace.async_client")
+        if async_client is not None:
+            async_client._close_sessions()
+
+    @keyword("Reset Workspace State")
+    def reset_workspace_state(self) -> None:
+        """
+        Re-resolve the workspace on next use and drop the cached SLX catalog,
+        runsessions, task searches and workspace.yaml (e.g. after a suite
+        changes RW_WORKSPACE or edits the workspace).
+        """
+        self._endpoints = None
+        invalidate_slx_catalog()
+        invalidate_runsession_cache()
+        clear_task_search_cache()
+        invalidate_workspace_config()
@@ -9,17 +9,38 @@ Scope: GLOBAL
 # ──────────────────────────────────────────────────────────────────────────────
 import os
 import re
+import sys
+import copy
+import hashlib
 import json
 import time
 import logging
+import threading
 import requests
+import concurrent.futures
 from datetime import datetime
-from typing import Any, Dict, List, Tuple, Optional
+import urllib.parse
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Optional, Union
 from robot.libraries.BuiltIn import BuiltIn
 from robot.api.deco import keyword
 
 from RW import platform                      
-from RW.Core import Core                     
+from RW.Workspace.endpoints import import_platform_variable, workspace_endpoints
+from RW.Workspace.http_session import get_bearer_session, get_workspace_session
+from RW.Workspace.json_codec import dumps, loads, response_json
+from RW.Workspace.retry_policy import request_with_retry
+from RW.Workspace.runsession_cache import (
+    _RUNSESSION_CACHE,
+    _forget_created_runsession,
+    _runsession_text,
+    invalidate_runsession_cache,
+    parse_runsession_json,
+)
+from RW.Workspace.ttl_cache import TTLCache
+
+# The SLX catalog and index are imported by the functions that use them, on the first lookup
+if TYPE_CHECKING:
+    from RW.Workspace.slx_index import SlxGroupIndex
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Logging guarantees  – creates both Robot and Python loggers safely.
@@ -46,7 +67,7 @@ def warning_log(msg: str, *details: Any) -> None:
         robot_logger.info(f"WARNING: {msg}")
 
     # stringify every detail first
-    text = " | ".join(json.dumps(d) if isinstance(d, (dict, list)) else str(d)
+    text = " | ".join(dumps(d) if isinstance(d, (dict, list)) else str(d)
                       for d in details)
 
     platform_logger.warning("%s – %s", msg, text)
@@ -76,61 +97,149 @@ def _slx_alias(slx: Dict) -> str:
 
 
 # ===========================================================================
-# Internal paginator
+# Server-side filtering / projection
 # ===========================================================================
+#
+# Tag filters (opt-in, RW_SLX_TAG_FILTER) and `fields=` projections are pushed
+# down to the API as query parameters when it honours them. Whether it does is
+# learnt from the first response per API root (a 400, or results the parameter
+# should have excluded, mean "no") and remembered for the rest of the process.
+# Results are always re-checked client-side, so an API that ignores a
+# parameter costs bytes but never changes what a keyword returns.
 
-def _page_through_slxs(start_url: str, session: requests.Session) -> List[Dict]:
-    """Internal: generic paginator compatible with both `next` and `page` meta."""
-    url = start_url
-    collected: List[Dict] = []
-    max_retries = 3
+_PUSHDOWN_SUPPORT: Dict[Tuple[str, str], bool] = {}
 
-    while url:
-        retry_delay = 2  # Reset retry_delay for each new URL
-        for attempt in range(max_retries):
-            try:
-                resp = session.get(url, timeout=120)  # Increased timeout to 120 seconds to match search timeouts
-                resp.raise_for_status()
-                body = resp.json()
+
+def _pushdown_supported(root: str, feature: str) -> Optional[bool]:
+    """Internal: True/False once probed for *feature* on *root*, else None."""
+    return _PUSHDOWN_SUPPORT.get((root, feature))
+
+
+def _record_pushdown(root: str, feature: str, supported: bool) -> None:
+    if _PUSHDOWN_SUPPORT.get((root, feature)) != supported:
+        platform_logger.debug("API %s %s %s", root, "honours" if supported else "ignores", feature)
+    _PUSHDOWN_SUPPORT[(root, feature)] = supported
+
+
+def _with_query(url: str, **params: Any) -> str:
+    """Internal: return *url* with the given query parameters set/replaced."""
+    parts = urllib.parse.urlparse(url)
+    query = urllib.parse.parse_qs(parts.query, keep_blank_values=True)
+    for k, v in params.items():
+        query[k] = [str(v)]
+    return urllib.parse.urlunparse(parts._replace(query=urllib.parse.urlencode(query, doseq=True)))
+
+
+def _normalize_fields(fields: Optional[Any]) -> List[str]:
+    """Internal: accept a list or a comma-separated string of dotted field paths."""
+    if not fields:
+        return []
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    return [f.strip() for f in fields if f and f.strip()]
+
+
+def _project_fields(data: Any, fields: List[str]) -> Any:
+    """
+    Internal: keep only the dotted *fields* of *data* (lists are projected
+    element-wise), mirroring what a `fields=` aware API returns.
+    """
+    tree: Dict[str, Any] = {}
+    for path in fields:
+        node = tree
+        parts = path.split(".")
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if child is True:
                 break
-            except requests.Timeout:
-                if attempt < max_retries - 1:
-                    warning_log(f"Timeout on attempt {attempt + 1}, retrying in {retry_delay}s...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    warning_log("Max retries reached, giving up on paging SLXs")
-                    return collected
-            except (requests.RequestException, json.JSONDecodeError) as e:
-                warning_log(f"Request failed on attempt {attempt + 1}: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    raise
-
-        collected.extend(body.get("results", []))
-
-        # style A – SmartLink pagination
-        url = body.get("next")
-
-        # style B – offset/limit
-        if url is None and "page" in body:
-            p = body["page"]
-            ret = len(body.get("results", []))
-            total = p.get("total", ret)
-            off = p.get("offset", 0) + ret
-            if off < total:
-                url = re.sub(r"offset=\d+", f"offset={off}", resp.url)
-
-    return collected
+            node = child
+        else:
+            node[parts[-1]] = True
+
+    def apply(value: Any, spec: Any) -> Any:
+        if spec is True:
+            return value
+        if isinstance(value, list):
+            return [apply(v, spec) for v in value]
+        if isinstance(value, dict):
+            return {k: apply(value[k], sub) for k, sub in spec.items() if k in value}
+        return value
+
+    return apply(data, tree)
+
+
+def _get_json_projected(
+    session: requests.Session,
+    root: str,
+    url: str,
+    fields: List[str],
+    **kwargs: Any,
+) -> Any:
+    """
+    Internal: GET *url* and return its JSON, limited to *fields* when given.
+
+    The projection is requested with `fields=` unless *root* is known to
+    reject or ignore it, and is always applied client-side too.
+    """
+    if not fields:
+        rsp = request_with_retry(session, "GET", url, **kwargs)
+        rsp.raise_for_status()
+        return response_json(rsp)
+
+    pushed = _pushdown_supported(root, "fields") is not False
+    rsp = request_with_retry(
+        session, "GET", _with_query(url, fields=",".join(fields)) if pushed else url, **kwargs
+    )
+    if pushed and rsp.status_code == 400:
+        _record_pushdown(root, "fields", False)
+        pushed = False
+        rsp = request_with_retry(session, "GET", url, **kwargs)
+    rsp.raise_for_status()
+    data = response_json(rsp)
+    if pushed and isinstance(data, dict):
+        top_level = {f.split(".", 1)[0] for f in fields}
+        _record_pushdown(root, "fields", set(data) <= top_level)
+    return _project_fields(data, fields)
+
+
+# ===========================================================================
+# SLX catalog
+# ===========================================================================
+#
+# Paging, the shared catalog snapshot and the SLX index live in `slx_catalog`
+# / `slx_index`, imported by the lookup keywords below on their first call.
+
+def invalidate_slx_catalog() -> None:
+    """
+    Drop every cached SLX catalog snapshot so the next SLX lookup re-pages
+    the workspace. Useful after SLXs were added or changed mid-suite.
+    """
+    catalog = sys.modules.get("RW.Workspace.slx_catalog")
+    if catalog is not None:  # nothing is cached before the first lookup
+        catalog.invalidate_slx_catalog()
 
 
 # ===========================================================================
 # SLX-related helpers
 # ===========================================================================
 
-def get_slxs_with_tag(tag_list: List[Any]) -> List[Dict]:
+def _wanted_tag_pairs(tag_list: List[Any]) -> set:
+    """Internal: normalised pairs from {"name", "value"} dicts / "name:value" strings."""
+    from RW.Workspace.slx_index import normalize_tag_pair
+
+    wanted: set[Tuple[str, str]] = set()
+    for item in tag_list or []:
+        if isinstance(item, dict):
+            name, val = item.get("name"), item.get("value")
+        elif isinstance(item, str) and ":" in item:
+            name, val = item.split(":", 1)
+        else:
+            continue
+        wanted.add(normalize_tag_pair(name, val))
+    return wanted
+
+
+def get_slxs_with_tag(tag_list: List[Any], match: str = "any") -> List[Dict]:
     """
     Return all SLXs whose *spec.tags* contain at least one tag in *tag_list*.
 
@@ -138,60 +247,50 @@ def get_slxs_with_tag(tag_list: List[Any]) -> List[Dict]:
       • {"name": "...", "value": "..."} dictionaries
       • "name:value" strings
 
-    Matching is case-insensitive on both name and value.
+    `match` selects the semantics across the requested tags:
+      • "any" (or "or")  – SLX carries at least one of them (default)
+      • "all" (or "and") – SLX carries every one of them
+
+    Matching is case-insensitive on both name and value and is answered from
+    the catalog snapshot's inverted tag index, hits being fetched by name.
+    While no snapshot exists yet the listing is streamed once instead – or,
+    with RW_SLX_TAG_FILTER enabled, the tag filter is pushed down to the API
+    (RW_SLX_TAG_FILTER_PARAM); SLXs then come back grouped per requested tag
+    rather than in catalog order.
     """
+    from RW.Workspace.slx_catalog import _cached_slx_catalog, _full_slxs, _scan_slx_catalog, _slx_list_url, _tag_filtered_slxs
+    from RW.Workspace.slx_index import TagMatch
+
+    match_mode = str(match).strip().lower()
+    if match_mode not in {"any", "or", "all", "and"}:
+        raise ValueError(f"match must be 'any' or 'all', got {match!r}")
+    match_all = match_mode in {"all", "and"}
+
     try:
-        ws = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
+        ep = workspace_endpoints()
     except ImportError:
         return []
 
-    wanted: set[Tuple[str, str]] = set()
-    for item in tag_list:
-        if isinstance(item, dict):
-            name, val = item.get("name"), item.get("value")
-        elif isinstance(item, str) and ":" in item:
-            name, val = item.split(":", 1)
-        else:
-            continue
-        wanted.add((name.strip().lower(), val.strip().lower()))
+    wanted = _wanted_tag_pairs(tag_list)
     if not wanted:
         return []
 
-    token = os.getenv("RW_USER_TOKEN")
-    if token:
-        sess = requests.Session()
-        sess.headers.update({
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        })
-    else:
-        sess = platform.get_authenticated_session()
-
-    # Handle case where ws might already include "workspaces/" prefix
-    workspace_path = ws.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    start_url = f"{root}/{workspace_path}/slxs?limit=500"
+    sess = ep.session()
+    start_url = _slx_list_url(ep)
     try:
-        all_slxs = _page_through_slxs(start_url, sess)
+        snapshot = _cached_slx_catalog(start_url, sess)
+        if snapshot is None:
+            # Cold catalog – let the API filter, if it can, instead of paging everything
+            hits = _tag_filtered_slxs(ep, sess, wanted, match_all)
+            if hits is not None:
+                return hits
+            predicate = TagMatch(wanted, match_all=match_all)
+            return [record.slx for record in _scan_slx_catalog(start_url, sess) if predicate.matches(record)]
+        return _full_slxs(sess, start_url, snapshot.with_tags(wanted, match_all=match_all))
     except (requests.RequestException, json.JSONDecodeError) as e:
         warning_log("Fetching SLXs failed", str(e))
         return []
 
-    matches: List[Dict] = []
-    for slx in all_slxs:
-        for tag in slx.get("spec", {}).get("tags", []):
-            pair = (
-                str(tag.get("name", "")).strip().lower(),
-                str(tag.get("value", "")).strip().lower(),
-            )
-            if pair in wanted:
-                matches.append(slx)
-                break
-    return matches
-
 
 @keyword("Get Slxs With Entity Reference")
 def get_slxs_with_entity_reference(entity_refs: List[str]) -> List[Dict]:
@@ -202,79 +301,56 @@ def get_slxs_with_entity_reference(entity_refs: List[str]) -> List[Dict]:
     
     This function prioritizes precision over recall to keep search scopes manageable.
     """
-    try:
-        ws = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
-    except ImportError:
-        return []
-
-    token = os.getenv("RW_USER_TOKEN")
-    if token:
-        sess = requests.Session()
-        sess.headers.update({
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        })
-    else:
-        sess = platform.get_authenticated_session()
+    from RW.Workspace.slx_catalog import _cached_slx_catalog, _full_slxs, _scan_slx_catalog, _slx_list_url
+    from RW.Workspace.slx_index import TagValueMatch
 
-    # Handle case where ws might already include "workspaces/" prefix
-    workspace_path = ws.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    start_url = f"{root}/{workspace_path}/slxs?limit=500"
     try:
-        all_slxs = _page_through_slxs(start_url, sess)
-    except (requests.RequestException, json.JSONDecodeError) as e:
-        warning_log("Paging SLXs failed", str(e))
+        ep = workspace_endpoints()
+    except ImportError:
         return []
 
+    sess = ep.session()
     terms = {t.lower() for t in entity_refs if isinstance(t, str) and t}
     if not terms:
         return []
 
-    # Tier 1: High-priority matches (specific tag types)
-    priority_hits: List[Dict] = []
     priority_tag_names = {"resource_name", "child_resource", "entity_name", "target_resource"}
-    
-    for slx in all_slxs:
-        spec = slx.get("spec", {})
-        tags = spec.get("tags", [])
-        
-        # Check for priority tag matches
-        for tag in tags:
-            tag_name = tag.get("name", "").lower()
-            tag_value = tag.get("value", "").lower()
-            
-            if tag_name in priority_tag_names and any(term in tag_value for term in terms):
-                priority_hits.append(slx)
-                break
+    max_priority_matches = 50  # Limit to 50 to prevent scope explosion
+    max_broader_matches = 20  # Strict limit to prevent API overload
+
+    start_url = _slx_list_url(ep)
+    try:
+        snapshot = _cached_slx_catalog(start_url, sess)
+        if snapshot is not None:
+            # Tier 1: High-priority matches (specific tag types)
+            priority_hits = _full_slxs(sess, start_url, snapshot.with_tag_values_containing(
+                priority_tag_names, terms, limit=max_priority_matches
+            ))
+            # Tier 2: Broader matches, only needed when tier 1 found nothing.
+            # Only alias and tags are indexed, configProvided and additionalContext are skipped
+            broader_hits = [] if priority_hits else _full_slxs(sess, start_url, snapshot.with_corpus_containing(
+                terms, limit=max_broader_matches
+            ))
+        else:
+            # Cold catalog – stream pages and stop once tier 1 is full
+            priority = TagValueMatch(priority_tag_names, terms)
+            priority_hits, broader_hits = [], []
+            for record in _scan_slx_catalog(start_url, sess):
+                if priority.matches(record):
+                    priority_hits.append(record.slx)
+                    if len(priority_hits) >= max_priority_matches:
+                        break
+                elif (not priority_hits and len(broader_hits) < max_broader_matches
+                      and any(term in record.corpus() for term in terms)):
+                    broader_hits.append(record.slx)
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        warning_log("Paging SLXs failed", str(e))
+        return []
     
     # If we found priority matches, return them (limit to prevent scope explosion)
     if priority_hits:
         BuiltIn().log(f"Found {len(priority_hits)} SLXs with priority tag matches", level="INFO")
-        return priority_hits[:50]  # Limit to 50 to prevent scope explosion
-    
-    # Tier 2: Broader matches but with strict limits
-    broader_hits: List[Dict] = []
-    max_broader_matches = 20  # Strict limit to prevent API overload
-    
-    for slx in all_slxs:
-        if len(broader_hits) >= max_broader_matches:
-            break
-            
-        spec = slx.get("spec", {})
-        corpus = [_slx_alias(slx)]
-
-        # Only check tags, skip configProvided and additionalContext for broader search
-        for t in spec.get("tags", []):
-            n, v = t.get("name", ""), t.get("value", "")
-            corpus.extend([n, v, f"{n}:{v}"])
-
-        joined = " ".join(corpus).lower()
-        if any(term in joined for term in terms):
-            broader_hits.append(slx)
+        return priority_hits
     
     if broader_hits:
         BuiltIn().log(f"Found {len(broader_hits)} SLXs with broader matches (limited to {max_broader_matches})", level="INFO")
@@ -286,7 +362,11 @@ def get_slxs_with_entity_reference(entity_refs: List[str]) -> List[Dict]:
 
 
 @keyword("Get Slxs With Targeted Entity Reference")
-def get_slxs_with_targeted_entity_reference(entity_refs: List[str], tag_types: List[str] = None) -> List[Dict]:
+def get_slxs_with_targeted_entity_reference(
+    entity_refs: List[str],
+    tag_types: List[str] = None,
+    max_results: int = 0,
+) -> List[Dict]:
     """
     Return SLXs that reference entities in *entity_refs* using specific tag types.
     
@@ -294,66 +374,124 @@ def get_slxs_with_targeted_entity_reference(entity_refs: List[str], tag_types: L
         entity_refs: List of entity names/identifiers to search for
         tag_types: List of specific tag names to match against (e.g., ["resource_name", "child_resource"])
                    If None, defaults to ["resource_name", "child_resource", "entity_name"]
+        max_results: Stop after this many matches (0 = no limit). On a cold
+                     catalog no further SLX pages are requested once reached.
     
     Returns:
         List of SLXs that have matching tags of the specified types
     """
+    from RW.Workspace.slx_catalog import _cached_slx_catalog, _full_slxs, _scan_slx_catalog, _slx_list_url
+    from RW.Workspace.slx_index import TagValueMatch
+
     if tag_types is None:
         tag_types = ["resource_name", "child_resource", "entity_name"]
     
     try:
-        ws = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
+        ep = workspace_endpoints()
     except ImportError:
         return []
 
-    token = os.getenv("RW_USER_TOKEN")
-    if token:
-        sess = requests.Session()
-        sess.headers.update({
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        })
-    else:
-        sess = platform.get_authenticated_session()
-
-    # Handle case where ws might already include "workspaces/" prefix
-    workspace_path = ws.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    start_url = f"{root}/{workspace_path}/slxs?limit=500"
-    try:
-        all_slxs = _page_through_slxs(start_url, sess)
-    except (requests.RequestException, json.JSONDecodeError) as e:
-        warning_log("Paging SLXs failed", str(e))
-        return []
-
+    sess = ep.session()
     terms = {t.lower() for t in entity_refs if isinstance(t, str) and t}
     tag_types_set = {t.lower() for t in tag_types}
     
     if not terms:
         return []
 
-    hits: List[Dict] = []
-    
-    for slx in all_slxs:
-        spec = slx.get("spec", {})
-        tags = spec.get("tags", [])
-        
-        # Check for matches in specified tag types
-        for tag in tags:
-            tag_name = tag.get("name", "").lower()
-            tag_value = tag.get("value", "").lower()
-            
-            if tag_name in tag_types_set and any(term in tag_value for term in terms):
-                hits.append(slx)
-                break
+    limit = int(max_results) or None
+    start_url = _slx_list_url(ep)
+    try:
+        snapshot = _cached_slx_catalog(start_url, sess)
+        if snapshot is not None:
+            # Check for matches in specified tag types
+            hits = _full_slxs(sess, start_url, snapshot.with_tag_values_containing(tag_types_set, terms, limit=limit))
+        else:
+            # Cold catalog – stream pages, stopping once the cap is reached
+            predicate = TagValueMatch(tag_types_set, terms)
+            hits = []
+            for record in _scan_slx_catalog(start_url, sess):
+                if predicate.matches(record):
+                    hits.append(record.slx)
+                    if limit and len(hits) >= limit:
+                        break
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        warning_log("Paging SLXs failed", str(e))
+        return []
     
     BuiltIn().log(f"Found {len(hits)} SLXs with targeted tag matches for types: {tag_types}", level="INFO")
     return hits
 
 
+def _slx_predicate(spec: Dict) -> Any:
+    """Internal: build a `TagMatch` / `TagValueMatch` from a keyword-level spec."""
+    from RW.Workspace.slx_index import TagMatch, TagValueMatch
+
+    limit = int(spec.get("max_results", 0) or 0) or None
+    if "tags" in spec:
+        match_mode = str(spec.get("match", "any")).strip().lower()
+        if match_mode not in {"any", "or", "all", "and"}:
+            raise ValueError(f"match must be 'any' or 'all', got {spec.get('match')!r}")
+        return TagMatch(_wanted_tag_pairs(spec["tags"]), match_all=match_mode in {"all", "and"}, limit=limit)
+    if "entity_refs" in spec:
+        tag_types = spec.get("tag_types") or ["resource_name", "child_resource", "entity_name"]
+        terms = {t.lower() for t in spec["entity_refs"] if isinstance(t, str) and t}
+        return TagValueMatch(tag_types, terms, limit=limit)
+    raise ValueError(f"SLX predicate needs 'tags' or 'entity_refs': {spec!r}")
+
+
+def get_slxs_matching(predicates: Dict[str, Dict]) -> Dict[str, List[Dict]]:
+    """
+    Evaluate several SLX lookups in one pass over one catalog fetch.
+
+    *predicates* maps a key of your choice to either
+      • {"tags": [...], "match": "any"|"all"}      – like `Get Slxs With Tag`
+      • {"entity_refs": [...], "tag_types": [...]} – like
+        `Get Slxs With Targeted Entity Reference`
+    each optionally with "max_results". Returns ``{key: [SLX, ...]}`` with
+    SLXs in catalog order. When the catalog is cold and every predicate is
+    capped, paging stops as soon as all caps are reached.
+    """
+    matches, notes = _slxs_matching_outcome(predicates)
+    _log_notes(notes)
+    return matches
+
+
+def _slxs_matching_outcome(predicates: Dict[str, Dict]) -> Tuple[Dict[str, List[Dict]], List[Tuple[str, str]]]:
+    """
+    Internal: `get_slxs_matching` without logging. Returns ``(matches,
+    notes)`` – notes being ``(level, message)`` pairs – so worker threads can
+    hand their log lines back to the Robot thread.
+    """
+    from RW.Workspace.slx_catalog import _cached_slx_catalog, _full_slxs, _scan_slx_catalog, _slx_list_url
+    from RW.Workspace.slx_index import match_slxs
+
+    compiled = {key: _slx_predicate(spec) for key, spec in predicates.items()}
+    empty = {key: [] for key in compiled}
+    if not compiled:
+        return empty, []
+
+    try:
+        ep = workspace_endpoints()
+    except ImportError:
+        return empty, []
+
+    sess = ep.session()
+    start_url = _slx_list_url(ep)
+    try:
+        snapshot = _cached_slx_catalog(start_url, sess)
+        if snapshot is not None:
+            matches = {key: _full_slxs(sess, start_url, hits) for key, hits in snapshot.match(compiled).items()}
+        else:
+            matches = {
+                key: [record.slx for record in hits]
+                for key, hits in match_slxs(_scan_slx_catalog(start_url, sess), compiled).items()
+            }
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        return empty, [("WARN", f"Paging SLXs failed: {e}")]
+
+    return matches, [("INFO", "SLX predicate matches: " + ", ".join(f"{k}={len(v)}" for k, v in matches.items()))]
+
+
 @keyword("Run Tasks For SLX")
 def run_tasks_for_slx(slx: str) -> Optional[Dict]:
     """
@@ -363,39 +501,18 @@ def run_tasks_for_slx(slx: str) -> Optional[Dict]:
     """
     try:
         runsess = import_platform_variable("RW_SESSION_ID")
-        ws = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
+        ep = workspace_endpoints()
     except ImportError:
         return None
 
-    token = os.getenv("RW_USER_TOKEN")
-    if token:
-        sess = requests.Session()
-        sess.headers.update({
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        })
-    else:
-        sess = platform.get_authenticated_session()
+    sess = ep.session()
+    rb_url = ep.url("slxs", slx, "runbook")
+    rs_url = ep.runsessions(runsess)
 
-    # Handle case where ws might already include "workspaces/" prefix
-    workspace_path = ws.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-    
-    # Handle case where root might already include "/workspaces" suffix
-    base_url = root.rstrip('/')
-    if base_url.endswith('/workspaces'):
-        rb_url = f"{base_url}/{workspace_path}/slxs/{slx}/runbook"
-        rs_url = f"{base_url}/{workspace_path}/runsessions/{runsess}"
-    else:
-        rb_url = f"{base_url}/workspaces/{workspace_path}/slxs/{slx}/runbook"
-        rs_url = f"{base_url}/workspaces/{workspace_path}/runsessions/{runsess}"
-        
     try:
-        rb = sess.get(rb_url, timeout=120)
+        rb = request_with_retry(sess, "GET", rb_url, timeout=120)
         rb.raise_for_status()
-        rb_data = rb.json()
+        rb_data = response_json(rb)
         # backend-services-v2 returns resolved_tasks at top level;
         # legacy backend-services nests them under status.codeBundle.tasks
         tasks = rb_data.get("resolved_tasks") or rb_data.get("status", {}).get("codeBundle", {}).get("tasks", [])
@@ -409,14 +526,15 @@ def run_tasks_for_slx(slx: str) -> Optional[Dict]:
 
     patch_body = {
         "runRequests": [{
-            "slxName": f"{workspace_path}--{slx}",
+            "slxName": f"{ep.workspace_path}--{slx}",
             "taskTitles": tasks
         }]
     }
     try:
-        rsp = sess.patch(rs_url, json=patch_body, timeout=120)  # Increased timeout to 120 seconds
+        rsp = request_with_retry(sess, "PATCH", rs_url, json=patch_body, timeout=120)  # Increased timeout to 120 seconds
         rsp.raise_for_status()
-        return rsp.json()
+        invalidate_runsession_cache(runsess)
+        return response_json(rsp)
     except (requests.RequestException, json.JSONDecodeError) as e:
         warning_log("RunSession patch failed", str(e))
         return None
@@ -436,36 +554,16 @@ def create_runsession_for_slx(slx: str, source: str = "cronScheduler") -> Option
         The created runsession JSON or None on failure
     """
     try:
-        ws = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
+        ep = workspace_endpoints()
     except ImportError:
         return None
 
-    token = os.getenv("RW_USER_TOKEN")
-    if token:
-        sess = requests.Session()
-        sess.headers.update({
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        })
-    else:
-        sess = platform.get_authenticated_session()
-
-    # Handle case where ws might already include "workspaces/" prefix
-    workspace_path = ws.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-    
-    # Handle case where root might already include "/workspaces" suffix
-    base_url = root.rstrip('/')
-    if base_url.endswith('/workspaces'):
-        rb_url = f"{base_url}/{workspace_path}/slxs/{slx}/runbook"
-    else:
-        rb_url = f"{base_url}/workspaces/{workspace_path}/slxs/{slx}/runbook"
+    sess = ep.session()
+    rb_url = ep.url("slxs", slx, "runbook")
     try:
-        rb = sess.get(rb_url, timeout=120)
+        rb = request_with_retry(sess, "GET", rb_url, timeout=120)
         rb.raise_for_status()
-        rb_data = rb.json()
+        rb_data = response_json(rb)
         # backend-services-v2 returns resolved_tasks at top level;
         # legacy backend-services nests them under status.codeBundle.tasks
         tasks = rb_data.get("resolved_tasks") or rb_data.get("status", {}).get("codeBundle", {}).get("tasks", [])
@@ -481,7 +579,7 @@ def create_runsession_for_slx(slx: str, source: str = "cronScheduler") -> Option
     body = {
         "generateName": "cron-scheduled",
         "runRequests": [{
-            "slxName": f"{workspace_path}--{slx}",
+            "slxName": f"{ep.workspace_path}--{slx}",
             "taskTitles": tasks,
             "fromSearchQuery": source  # Use fromSearchQuery field (compatible with API)
         }],
@@ -489,65 +587,69 @@ def create_runsession_for_slx(slx: str, source: str = "cronScheduler") -> Option
     }
     
     # Create new runsession
-    if base_url.endswith('/workspaces'):
-        rs_url = f"{base_url}/{workspace_path}/runsessions"
-    else:
-        rs_url = f"{base_url}/workspaces/{workspace_path}/runsessions"
     try:
-        rsp = sess.post(rs_url, json=body, timeout=120)
+        rsp = request_with_retry(sess, "POST", ep.runsessions(), json=body, timeout=120)
         rsp.raise_for_status()
-        return rsp.json()
+        created = response_json(rsp)
+        _forget_created_runsession(created)
+        return created
     except (requests.RequestException, json.JSONDecodeError) as e:
         warning_log("RunSession creation failed", str(e))
         return None
 
 
 # ===========================================================================
-# Platform variable + import helpers
+# RunSession import helpers
 # ===========================================================================
 
-def import_platform_variable(varname: str) -> str:
-    """Return the value of a RunWhen platform-provided var or raise ImportError."""
-    if not varname.startswith("RW_"):
-        raise ValueError(f"{varname!r} is not a platform variable")
-    value = os.getenv(varname)
-    if not value:
-        raise ImportError(f"{varname} is unset")
-    return value
+def _fetch_runsession(
+    root: str,
+    url: str,
+    fields: Optional[List[str]] = None,
+    session: Optional[requests.Session] = None,
+) -> Dict:
+    """
+    Internal: memoised GET of the runsession at *url*, limited to *fields*
+    when given. Raises the usual request/JSON errors. The returned dict is
+    shared with the cache – treat it as read-only.
+    """
+    fields = fields or []
+    if fields:
+        full = _RUNSESSION_CACHE.peek((url, ()))
+        if full is not None:
+            return _project_fields(full, fields)
+    sess = session or get_workspace_session(root)
+    return _RUNSESSION_CACHE.get_or_load(
+        (url, tuple(fields)),
+        lambda: _get_json_projected(sess, root, url, fields, timeout=120, verify=platform.REQUEST_VERIFY),
+    )
 
 
-def import_runsession_details(runsession_id: Optional[str] = None) -> Optional[str]:
+def import_runsession_details(
+    runsession_id: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Optional[str]:
     """
     Fetch full RunSession details as JSON string. Uses RW_USER_TOKEN if set.
+
+    *fields* (list or comma-separated dotted paths, e.g. ``runRequests.slxName``)
+    limits the result to those fields; the projection is requested from the
+    API when it supports `fields=` so large memos are never downloaded.
     """
     try:
         if not runsession_id:
             runsession_id = import_platform_variable("RW_SESSION_ID")
-        ws = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
+        ep = workspace_endpoints()
     except ImportError:
         BuiltIn().log("Missing required vars for import_runsession_details", level="WARN")
         return None
 
-    # Handle case where ws might already include "workspaces/" prefix
-    workspace_path = ws.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    url = f"{root}/{workspace_path}/runsessions/{runsession_id}"
+    url = ep.runsessions(runsession_id)
     BuiltIn().log(f"Fetching RunSession: {url}", level="INFO")
 
-    token = os.getenv("RW_USER_TOKEN")
-    if token:
-        sess = requests.Session()
-        sess.headers.update({"Authorization": f"Bearer {token}"})
-    else:
-        sess = platform.get_authenticated_session()
-
     try:
-        rsp = sess.get(url, timeout=120, verify=platform.REQUEST_VERIFY)
-        rsp.raise_for_status()
-        return json.dumps(rsp.json())
+        data = _fetch_runsession(ep.root, url, _normalize_fields(fields))
+        return _runsession_text(data)
     except (requests.RequestException, json.JSONDecodeError) as e:
         warning_log("Import RunSession details failed", str(e))
         return None
@@ -561,61 +663,68 @@ def import_memo_variable(key: str) -> Optional[str]:
     try:
         runreq = str(import_platform_variable("RW_RUNREQUEST_ID"))
         runsess = import_platform_variable("RW_SESSION_ID")
-        ws = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
+        ep = workspace_endpoints()
     except ImportError:
         BuiltIn().log("Missing vars for import_memo_variable", level="WARN")
         return None
 
-    # Handle case where ws might already include "workspaces/" prefix
-    workspace_path = ws.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    url = f"{root}/{workspace_path}/runsessions/{runsess}"
+    url = ep.runsessions(runsess)
     BuiltIn().log(f"Fetching memos: {url}", level="INFO")
-    
-    token = os.getenv("RW_USER_TOKEN")
-    if token:
-        sess = requests.Session()
-        sess.headers.update({
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        })
-    else:
-        sess = platform.get_authenticated_session()
 
     try:
-        rsp = sess.get(url, timeout=120, verify=platform.REQUEST_VERIFY)
-        rsp.raise_for_status()
-        for rr in rsp.json().get("runRequests", []):
+        data = _fetch_runsession(ep.root, url, ["runRequests.id", "runRequests.memo"])
+        for rr in data.get("runRequests", []):
             if str(rr.get("id")) == runreq:
                 for memo in rr.get("memo", []):
                     if isinstance(memo, dict) and key in memo:
                         val = memo[key]
                         try:
-                            return json.dumps(val)
+                            return dumps(val)
                         except (TypeError, ValueError):
-                            return json.dumps(str(val))
-        return json.dumps(None)
+                            return dumps(str(val))
+        return dumps(None)
     except (requests.RequestException, json.JSONDecodeError) as e:
         warning_log("Fetching memo failed", str(e))
         return None
 
 
+# runRequest fields whose changes mean the related runsession is still moving
+_RUNREQUEST_STATUS_FIELDS = ("id", "status", "state", "closed", "responseTime", "taskTitles", "issues")
+
+
+def _runrequest_fingerprint(runsession: Dict) -> str:
+    """Internal: hash of every runRequest's status-bearing fields."""
+    status = [
+        {k: rr.get(k) for k in _RUNREQUEST_STATUS_FIELDS if k in rr}
+        for rr in runsession.get("runRequests", [])
+        if isinstance(rr, dict)
+    ]
+    return hashlib.sha256(dumps(status, sort_keys=True, default=str).encode()).hexdigest()
+
+
 def import_related_runsession_details(
-    json_string: str,
+    json_string: Union[str, Dict[str, Any]],
     api_token: Optional[platform.Secret] = None,
     poll_interval: float = 5.0,
     max_wait_seconds: float = 300.0,
+    min_poll_interval: float = 1.0,
+    stable_polls: int = 3,
 ) -> Optional[str]:
     """
     Parse 'runsessionId' from notes and poll until runRequests stable.
-    Returns JSON string of final runsession or None.
+    Returns JSON string of final runsession or None. *json_string* may also
+    be the already-parsed runsession.
+
+    Each poll is a conditional GET (If-None-Match on the last ETag), so an
+    unchanged runsession costs a 304 instead of the full payload. The
+    runsession counts as stable once a hash of its runRequests' statuses is
+    unchanged for *stable_polls* polls in a row. Polls start
+    *min_poll_interval* apart and back off towards *poll_interval* while
+    nothing changes, dropping back to the minimum whenever something does.
     """
     try:
-        data = json.loads(json_string)
-        notes = json.loads(data.get("notes", "{}"))
+        data = parse_runsession_json(json_string)
+        notes = loads(data.get("notes", "{}"))
         runsession_id = notes.get("runsessionId")
         if not runsession_id:
             BuiltIn().log("No runsessionId in notes", level="WARN")
@@ -625,60 +734,118 @@ def import_related_runsession_details(
         return None
 
     try:
-        ws = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
+        ep = workspace_endpoints()
     except ImportError as e:
         BuiltIn().log(f"Missing vars: {e}", level="WARN")
         return None
 
-    # Handle case where ws might already include "workspaces/" prefix
-    workspace_path = ws.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    endpoint = f"{root}/{workspace_path}/runsessions/{runsession_id}"
+    endpoint = ep.runsessions(runsession_id)
     BuiltIn().log(f"Polling: {endpoint}", level="INFO")
 
     # choose session
-    if api_token:
-        sess = requests.Session()
-        sess.headers.update({"Authorization": f"Bearer {api_token.value}"})
-    else:
-        token = os.getenv("RW_USER_TOKEN")
-        if token:
-            sess = requests.Session()
-            sess.headers.update({"Authorization": f"Bearer {token}"})
-        else:
-            sess = platform.get_authenticated_session()
+    sess = ep.session(api_token)
 
+    min_poll_interval = min(min_poll_interval, poll_interval)
+    interval = min_poll_interval
     stable = 0
-    last_len = None
+    polls = 0
+    sd: Optional[Dict] = None
+    etag: Optional[str] = None
+    last_fingerprint: Optional[str] = None
     start = time.time()
 
     while True:
+        headers = {"If-None-Match": etag} if etag and sd is not None else None
         try:
-            rsp = sess.get(endpoint, timeout=10, verify=platform.REQUEST_VERIFY)
+            rsp = request_with_retry(
+                sess, "GET", endpoint, headers=headers, timeout=10, verify=platform.REQUEST_VERIFY
+            )
             rsp.raise_for_status()
-            sd = rsp.json()
+            polls += 1
+            if rsp.status_code == 304:
+                fingerprint = last_fingerprint
+            else:
+                sd = response_json(rsp)
+                etag = rsp.headers.get("ETag")
+                fingerprint = _runrequest_fingerprint(sd)
         except (requests.RequestException, json.JSONDecodeError) as e:
             BuiltIn().log(f"Polling error: {e}", level="WARN")
             return None
 
-        rr = sd.get("runRequests", [])
-        curr = len(rr)
-        if last_len is not None and curr == last_len:
+        if fingerprint == last_fingerprint:
             stable += 1
+            interval = min(interval * 2, poll_interval)
         else:
             stable = 0
-        last_len = curr
-
-        if stable >= 3:
-            return json.dumps(sd)
+            interval = min_poll_interval
+        last_fingerprint = fingerprint
+
+        if stable >= stable_polls:
+            _RUNSESSION_CACHE.put((endpoint, ()), sd)
+            BuiltIn().log(
+                f"RunSession {runsession_id} stable after {polls} polls in {time.time() - start:.1f}s",
+                level="INFO",
+            )
+            return _runsession_text(sd)
 
         if time.time() - start > max_wait_seconds:
             raise TimeoutError(f"Timeout waiting for runsession {runsession_id}")
 
-        time.sleep(poll_interval)
+        time.sleep(interval)
+
+# workspace.yaml is served from memory for WORKSPACE_CONFIG_TTL seconds, then
+# revalidated with a conditional GET (ETag / Last-Modified) like the SLX catalog.
+WORKSPACE_CONFIG_TTL: float = float(os.getenv("RW_WORKSPACE_CONFIG_TTL", "60"))
+
+
+class _WorkspaceConfig:
+    """Internal: cached workspace.yaml, its validators and derived SLX-group index."""
+
+    def __init__(self):
+        self.config: Dict = {}
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.fetched_at: Optional[float] = None
+        self._group_index: Optional[SlxGroupIndex] = None
+        self.lock = threading.Lock()
+
+    def is_fresh(self, max_age: float) -> bool:
+        return self.fetched_at is not None and time.monotonic() - self.fetched_at < max_age
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def store(self, config: Dict, resp: requests.Response) -> None:
+        self.config = config
+        self._group_index = None
+        self.etag = resp.headers.get("ETag")
+        self.last_modified = resp.headers.get("Last-Modified")
+        self.fetched_at = time.monotonic()
+
+    @property
+    def group_index(self) -> "SlxGroupIndex":
+        from RW.Workspace.slx_index import SlxGroupIndex
+
+        index = self._group_index
+        if index is None:
+            index = self._group_index = SlxGroupIndex(self.config)
+        return index
+
+
+_WORKSPACE_CONFIGS: Dict[str, _WorkspaceConfig] = {}
+_WORKSPACE_CONFIGS_LOCK = threading.Lock()
+
+
+def invalidate_workspace_config() -> None:
+    """Drop the cached workspace.yaml so the next lookup downloads it again."""
+    with _WORKSPACE_CONFIGS_LOCK:
+        _WORKSPACE_CONFIGS.clear()
+
 
 def get_workspace_config() -> list | dict:
     """
@@ -690,50 +857,68 @@ def get_workspace_config() -> list | dict:
       • during local / unit testing – where you may export RW_USER_TOKEN to
         override the auth header.
 
+    The result is cached per workspace for RW_WORKSPACE_CONFIG_TTL seconds and
+    then revalidated conditionally; treat it as read-only.
+
     Falls back to an empty dictionary on any failure.
     """
     # ── 0. Resolve workspace + API root ─────────────────────────────────────
     try:
-        ws   = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
+        ep = workspace_endpoints()
     except ImportError:
         return {}          # running outside expected context
 
-    # Handle case where ws might already include "workspaces/" prefix
-    workspace_path = ws.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-    
-    url = f"{root.rstrip('/')}/{workspace_path}/branches/main/workspace.yaml?format=json"
-
-    # ── 1. Build an authenticated session ──────────────────────────────────
-    user_token = os.getenv("RW_USER_TOKEN")
-    if user_token:
-        # Local test override
-        sess = requests.Session()
-        sess.headers.update({"Authorization": f"Bearer {user_token}"})
-    else:
-        # inside a runbook/runtime – session already carries auth headers
-        sess = platform.get_authenticated_session()
+    url = ep.workspace_config
 
-    sess.headers.setdefault("Content-Type", "application/json")
+    with _WORKSPACE_CONFIGS_LOCK:
+        entry = _WORKSPACE_CONFIGS.setdefault(url, _WorkspaceConfig())
 
-    # ── 2. Fetch & return the file ─────────────────────────────────────────
-    try:
-        resp = sess.get(url, timeout=120)  # Increased timeout to 120 seconds
-        resp.raise_for_status()
-        # API shape: { "asJson": { …workspace.yaml parsed… } }
-        return resp.json().get("asJson", {})
-    except (requests.RequestException, json.JSONDecodeError) as e:
-        BuiltIn().log(
-            f"[get_workspace_config] Failed fetching workspace.yaml for '{ws}': {e}",
-            level="WARN",
-        )
-        platform_logger.exception(e)
-        return {}
+    with entry.lock:
+        if entry.is_fresh(WORKSPACE_CONFIG_TTL):
+            return entry.config
+
+        # ── 1. Shared authenticated session (RW_USER_TOKEN overrides locally) ──
+        sess = ep.session()
+
+        # ── 2. Fetch (or revalidate) & return the file ─────────────────────────
+        headers = entry.conditional_headers() if entry.fetched_at is not None else None
+        try:
+            resp = request_with_retry(sess, "GET", url, headers=headers or None, timeout=120)  # Increased timeout to 120 seconds
+            if resp.status_code == 304:
+                entry.fetched_at = time.monotonic()
+                return entry.config
+            resp.raise_for_status()
+            # API shape: { "asJson": { …workspace.yaml parsed… } }
+            entry.store(response_json(resp).get("asJson", {}), resp)
+            return entry.config
+        except (requests.RequestException, json.JSONDecodeError) as e:
+            BuiltIn().log(
+                f"[get_workspace_config] Failed fetching workspace.yaml for '{ep.workspace_path}': {e}",
+                level="WARN",
+            )
+            platform_logger.exception(e)
+            # Serve the last good copy, if any, rather than nothing
+            return entry.config if entry.fetched_at is not None else {}
+
+
+def _slx_group_index(workspace_config: dict) -> "SlxGroupIndex":
+    """Internal: the precomputed group index when *workspace_config* is the cached one."""
+    from RW.Workspace.slx_index import SlxGroupIndex
 
+    with _WORKSPACE_CONFIGS_LOCK:
+        entries = list(_WORKSPACE_CONFIGS.values())
+    for entry in entries:
+        if entry.config is workspace_config and entry.fetched_at is not None:
+            return entry.group_index
+    return SlxGroupIndex(workspace_config)
 
-def get_nearby_slxs(workspace_config: dict, slx_name: str) -> list:
+
+def get_nearby_slxs(
+    workspace_config: dict,
+    slx_name: str,
+    depth: int = 1,
+    all_groups: bool = False,
+) -> list:
     """
     Given a RunWhen workspace config (in dictionary form) and the short name
     of a specific SLX (e.g. "rc-ob-grnsucsc1c-redis-health-a7c33f4e"),
@@ -741,20 +926,15 @@ def get_nearby_slxs(workspace_config: dict, slx_name: str) -> list:
 
     :param workspace_config: Dict representing workspace.yaml as JSON.
     :param slx_name: The SLX short name to look for.
+    :param depth: Group hops to follow; 2 also includes the groups of every
+                  SLX found in the first hop, and so on.
+    :param all_groups: Merge every group containing `slx_name` rather than
+                       only the first one.
     :return: A list of SLX short names in the same slxGroup as `slx_name`.
              If no group is found containing `slx_name`, returns an empty list.
     """
-    # Navigate to the "slxGroups" array under "spec".
-    slx_groups = workspace_config.get("spec", {}).get("slxGroups", [])
-
-    for group in slx_groups:
-        slxs = group.get("slxs", [])
-        if slx_name in slxs:
-            # Return the entire list of slxs in this group.
-            return slxs
-
-    # If we don't find the slx in any group, return an empty list.
-    return []
+    # The SLX → group map is built once per cached workspace.yaml
+    return _slx_group_index(workspace_config).nearby(slx_name, depth=int(depth), all_groups=all_groups)
 
 def get_workspace_slxs(
     rw_api_url: str,
@@ -764,28 +944,17 @@ def get_workspace_slxs(
     """
     Get all SLXs in a workspace (paginated) and return combined JSON string.
     """
-    # Handle case where rw_workspace might already include "workspaces/" prefix
-    workspace_path = rw_workspace.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-    
-    # Handle case where rw_api_url might already include "/workspaces" suffix
-    base_url = rw_api_url.rstrip('/')
-    if base_url.endswith('/workspaces'):
-        url = f"{base_url}/{workspace_path}/slxs?limit=500"
-    else:
-        url = f"{base_url}/workspaces/{workspace_path}/slxs?limit=500"
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_token.value}",
-    }
+    from RW.Workspace.slx_catalog import _slx_list_url
+
+    url = _slx_list_url(workspace_endpoints(rw_api_url, rw_workspace))
+    sess = get_bearer_session(url, api_token.value)
     all_results = []
     total = None
 
     while url:
-        resp = requests.get(url, headers=headers, timeout=120) # Increased timeout to 120 seconds
+        resp = request_with_retry(sess, "GET", url, timeout=120) # Increased timeout to 120 seconds
         resp.raise_for_status()
-        p = resp.json()
+        p = response_json(resp)
         total = p.get("count", len(all_results))
         all_results.extend(p.get("results", []))
         url = p.get("next")
@@ -796,7 +965,7 @@ def get_workspace_slxs(
         "previous": None,
         "results": all_results,
     }
-    return json.dumps(combined)
+    return dumps(combined)
 
 
 # ===========================================================================
@@ -804,7 +973,7 @@ def get_workspace_slxs(
 # ===========================================================================
 
 def _post_json(session: requests.Session, url: str, payload: dict) -> dict:
-    resp = session.post(url, json=payload, timeout=120, verify=platform.REQUEST_VERIFY) # Increased timeout to 120 seconds
+    resp = request_with_retry(session, "POST", url, json=payload, timeout=120, verify=platform.REQUEST_VERIFY) # Increased timeout to 120 seconds
 
     if resp.status_code >= 400:
         curl_cmd = _as_curl(
@@ -822,7 +991,7 @@ def _post_json(session: requests.Session, url: str, payload: dict) -> dict:
         )
 
     resp.raise_for_status()
-    return resp.json()
+    return response_json(resp)
 
 # ─────────────────────────────────────────────────────────────
 # Helper: build a cURL command from a requests session
@@ -857,11 +1026,107 @@ def _as_curl(
 
     # body
     if json_body is not None:
-        parts.append(f"--data-raw '{json.dumps(json_body, separators=(',', ':'))}'")
+        parts.append(f"--data-raw '{dumps(json_body)}'")
 
     parts.append(f"'{url}'")
     return " ".join(parts)
 
+# Identical searches (same normalised query, scope and persona) within
+# TASK_SEARCH_CACHE_TTL seconds are answered from memory, and concurrent
+# identical searches share one POST. Failed searches are never cached.
+TASK_SEARCH_CACHE_TTL: float = float(os.getenv("RW_TASK_SEARCH_CACHE_TTL", "60"))
+TASK_SEARCH_CACHE_SIZE: int = int(os.getenv("RW_TASK_SEARCH_CACHE_SIZE", "256"))
+
+_TASK_SEARCH_CACHE = TTLCache(maxsize=TASK_SEARCH_CACHE_SIZE, ttl=TASK_SEARCH_CACHE_TTL, name="task_search")
+
+
+def _task_search_key(url: str, body: Dict) -> Tuple:
+    """Internal: cache key – whitespace/case-normalised query, sorted scope, persona."""
+    query = tuple(" ".join(str(q).split()).lower() for q in body.get("query", []))
+    scope = tuple(sorted(set(body.get("scope") or [])))
+    return url, query, scope, body.get("persona")
+
+
+def _post_task_search(root: str, url: str, body: Dict, timeout: float) -> Dict:
+    """Internal: one task-search POST; raises on failure."""
+    sess = get_workspace_session(root)
+    # Task search is read-only, so the POST is safe to retry
+    resp = request_with_retry(
+        sess, "POST", url, json=body, timeout=timeout,
+        verify=platform.REQUEST_VERIFY, idempotent=True,
+    )
+    resp.raise_for_status()
+    return response_json(resp)
+
+
+def _task_search_outcome(root: str, url: str, body: Dict, timeout: float) -> Tuple[Dict, Optional[str]]:
+    """
+    Internal: task search through the shared cache. Returns ``(response,
+    problem)`` – ``({}, "why")`` on failure – so worker threads can hand the
+    warning back to the Robot thread, which is the only one Robot logs from.
+    """
+    try:
+        result = _TASK_SEARCH_CACHE.get_or_load(
+            _task_search_key(url, body),
+            lambda: _post_task_search(root, url, body, timeout),
+        )
+    except requests.Timeout:
+        return {}, f"Task search timed out after {timeout} seconds"
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        return {}, f"Task search failed: {e}"
+    # Callers own their copy; the cached response must stay pristine
+    return copy.deepcopy(result), None
+
+
+def _log_notes(notes: List[Tuple[str, str]]) -> None:
+    """Internal: log ``(level, message)`` pairs collected by a worker thread."""
+    for level, message in notes:
+        BuiltIn().log(message, level=level)
+
+
+def _cached_task_search(root: str, url: str, body: Dict, timeout: float) -> Dict:
+    """Internal: task search through the shared cache; returns {} on failure."""
+    result, problem = _task_search_outcome(root, url, body, timeout)
+    if problem:
+        BuiltIn().log(problem, level="WARN")
+    return result
+
+
+def _task_search_request(
+    query: str,
+    slx_scope: Optional[List[str]] = None,
+    persona: Optional[str] = None,
+) -> Optional[Tuple[str, str, Dict]]:
+    """
+    Internal: ``(api root, task-search URL, request body)`` for a search, or
+    None when the platform variables are missing.
+    """
+    try:
+        ep = workspace_endpoints()
+    except ImportError:
+        return None
+
+    body = {"query": [query], "scope": slx_scope or []}
+    if persona:
+        body["persona"] = ep.qualify(persona)
+    return ep.root, ep.task_search, body
+
+
+def get_task_search_cache_stats() -> Dict:
+    """
+    Return hit/miss/coalesced/eviction counters of the task-search cache
+    (also logged), for tuning RW_TASK_SEARCH_CACHE_TTL / _SIZE.
+    """
+    stats = _TASK_SEARCH_CACHE.stats()
+    BuiltIn().log(f"Task search cache: {stats}", level="INFO")
+    return stats
+
+
+def clear_task_search_cache() -> None:
+    """Forget every cached task-search response and reset the counters."""
+    _TASK_SEARCH_CACHE.clear()
+
+
 def perform_task_search_with_persona(
     query: str,
     persona: str,
@@ -869,44 +1134,10 @@ def perform_task_search_with_persona(
     timeout: float = 120.0,
 ) -> Dict:
     """Perform a task search as the given persona."""
-    slx_scope = slx_scope or []
-    try:
-        ws = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
-    except ImportError:
-        return {}
-
-    # Handle case where ws might already include "workspaces/" prefix
-    workspace_path = ws.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    if "--" not in persona:
-        persona = f"{workspace_path}--{persona}"
-
-    url = f"{root}/{workspace_path}/task-search"
-    body = {"query": [query], "scope": slx_scope, "persona": persona}
-
-    token = os.getenv("RW_USER_TOKEN")
-    if token:
-        sess = requests.Session()
-        sess.headers.update({
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        })
-    else:
-        sess = platform.get_authenticated_session()
-
-    try:
-        resp = sess.post(url, json=body, timeout=timeout, verify=platform.REQUEST_VERIFY)
-        resp.raise_for_status()
-        return resp.json()
-    except requests.Timeout:
-        BuiltIn().log(f"Task search timed out after {timeout} seconds", level="WARN")
-        return {}
-    except (requests.RequestException, json.JSONDecodeError) as e:
-        BuiltIn().log(f"Task search failed: {e}", level="WARN")
+    request = _task_search_request(query, slx_scope, persona)
+    if request is None:
         return {}
+    return _cached_task_search(*request, timeout)
 
 
 def perform_task_search(
@@ -915,41 +1146,65 @@ def perform_task_search(
     timeout: float = 120.0,
 ) -> Dict:
     """Perform a task search with no persona."""
-    slx_scope = slx_scope or []
-    try:
-        ws = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
-    except ImportError:
+    request = _task_search_request(query, slx_scope)
+    if request is None:
         return {}
+    return _cached_task_search(*request, timeout)
 
-    # Handle case where ws might already include "workspaces/" prefix
-    workspace_path = ws.lstrip('/')
-    if workspace_path.startswith('workspaces/'):
-        workspace_path = workspace_path[len('workspaces/'):]
-        
-    url = f"{root}/{workspace_path}/task-search"
-    body = {"query": [query], "scope": slx_scope}
-
-    token = os.getenv("RW_USER_TOKEN")
-    if token:
-        sess = requests.Session()
-        sess.headers.update({
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        })
+
+# Searches run at once by `Perform Task Searches`
+TASK_SEARCH_CONCURRENCY: int = int(os.getenv("RW_TASK_SEARCH_CONCURRENCY", "4"))
+
+
+def perform_task_searches(
+    searches: List[Dict],
+    max_concurrency: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Run several independent task searches concurrently.
+
+    Each entry of *searches* is a dict with ``query`` and optionally
+    ``slx_scope`` (or ``scope``), ``persona`` and ``timeout`` (default 120).
+    Entries with a persona behave like `Perform Task Search With Persona`,
+    the rest like `Perform Task Search`.
+
+    At most *max_concurrency* searches (default RW_TASK_SEARCH_CONCURRENCY)
+    are in flight at once, so the wall time is roughly that of the slowest
+    search. Results come back in the order of *searches*; a search that fails
+    or is malformed yields ``{}`` and a warning without affecting the others.
+    """
+    if max_concurrency is None:
+        max_concurrency = TASK_SEARCH_CONCURRENCY
+
+    def run_one(spec: Any) -> Tuple[Dict, Optional[str]]:
+        if not isinstance(spec, dict) or not spec.get("query"):
+            return {}, f"Skipping malformed task search spec: {spec!r}"
+        try:
+            request = _task_search_request(
+                spec["query"],
+                spec.get("slx_scope", spec.get("scope")),
+                spec.get("persona"),
+            )
+            if request is None:
+                return {}, None
+            return _task_search_outcome(*request, float(spec.get("timeout", 120.0)))
+        except Exception as e:
+            return {}, f"Task search {spec.get('query')!r} failed: {e}"
+
+    searches = list(searches or [])
+    if len(searches) <= 1 or max_concurrency <= 1:
+        outcomes = [run_one(spec) for spec in searches]
     else:
-        sess = platform.get_authenticated_session()
+        workers = min(max_concurrency, len(searches))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rw-task-search") as pool:
+            outcomes = list(pool.map(run_one, searches))
 
-    try:
-        resp = sess.post(url, json=body, timeout=timeout, verify=platform.REQUEST_VERIFY)
-        resp.raise_for_status()
-        return resp.json()
-    except requests.Timeout:
-        BuiltIn().log(f"Task search timed out after {timeout} seconds", level="WARN")
-        return {}
-    except (requests.RequestException, json.JSONDecodeError) as e:
-        BuiltIn().log(f"Task search failed: {e}", level="WARN")
-        return {}
+    results = []
+    for result, problem in outcomes:
+        if problem:
+            BuiltIn().log(problem, level="WARN")
+        results.append(result)
+    return results
 
 
 def build_task_report_md(
@@ -1008,11 +1263,30 @@ def build_task_report_md(
     return md, total_tasks
 
 
+# Opt-in: start every improved-search strategy at once instead of one by one
+IMPROVED_SEARCH_PARALLEL: bool = os.getenv("RW_IMPROVED_SEARCH_PARALLEL", "false").lower() in ("1", "true", "yes")
+
+
+class _SearchAttempt:
+    """Internal: one planned (and, once run, answered) improved-search strategy."""
+
+    def __init__(self, strategy: str, query: str, scope: Optional[List[str]], notes: List[str]):
+        self.strategy = strategy
+        self.query = query
+        self.scope = scope
+        self.notes = notes            # log lines, emitted from the calling thread
+        self.log: List[Tuple[str, str]] = []  # (level, message) from SLX lookups and the search
+        self.aliases: List[str] = []  # SLX aliases for the fallback query
+        self.skip = False             # planned, but nothing to search for
+        self.response: Dict = {}
+
+
 def perform_improved_task_search(
     entity_data: List[str],
     persona: str,
     confidence_threshold: float = 0.7,
     slx_scope: Optional[List[str]] = None,
+    parallel: Optional[bool] = None,
 ) -> Tuple[Dict, str, List[str], str]:
     """
     Perform an improved multi-tier search strategy for webhook handlers:
@@ -1022,35 +1296,40 @@ def perform_improved_task_search(
     3. Search with SLX spec.tag "resource_name" 
     4. Search with "child_resource" tag names
     
+    By default the strategies run one after another and stop at the first
+    one with high-quality results. With ``parallel=True`` (or
+    RW_IMPROVED_SEARCH_PARALLEL=true) all four are started at once and the
+    highest-priority strategy that clears ``confidence_threshold`` wins;
+    lower-priority searches still queued are cancelled and any in flight are
+    ignored. Either way the same strategy is chosen for the same API answers.
+    
     Args:
         entity_data: List of entity names/identifiers extracted from webhook
         persona: Persona to use for search
         confidence_threshold: Minimum confidence score for high-quality results
         slx_scope: Optional SLX scope to limit search
+        parallel: Run the strategies concurrently (default: RW_IMPROVED_SEARCH_PARALLEL)
         
     Returns:
         Tuple of (search_response, search_strategy_used, slx_scopes_used, search_query_used)
     """
     try:
-        ws = import_platform_variable("RW_WORKSPACE")
-        root = import_platform_variable("RW_WORKSPACE_API_URL")
+        persona = workspace_endpoints().qualify(persona)
     except ImportError:
         return {}, "failed", [], ""
 
-    if "--" not in persona:
-        persona = f"{ws}--{persona}"
-
-    # Collect SLX aliases for fallback
-    collected_aliases = []
+    if parallel is None:
+        parallel = IMPROVED_SEARCH_PARALLEL
 
-    # Helper function to extract resource_type values from SLXs
-    def extract_resource_types_from_slxs(slxs: List[Dict]) -> List[str]:
+    # Helper function to extract resource_type values from SLXs. SLX aliases
+    # are collected into *aliases* along the way for the final fallback.
+    def extract_resource_types_from_slxs(slxs: List[Dict], aliases: List[str]) -> List[str]:
         resource_types = []
         for slx in slxs:
             # Collect aliases for fallback while we're processing SLXs
             alias = _slx_alias(slx).strip()
-            if alias and alias not in collected_aliases:
-                collected_aliases.append(alias)
+            if alias and alias not in aliases:
+                aliases.append(alias)
             
             # Try to get resource context in order of preference:
             # 1. resource_type tag (most specific)
@@ -1098,128 +1377,154 @@ def perform_improved_task_search(
                 
         return resource_types
 
+    # Each strategy plans its search (query, scope, SLX lookups) and returns a
+    # _SearchAttempt, or None when it has nothing to search for. Planning only
+    # touches the shared SLX catalog; the task-search POST is the slow part.
+
+    # Strategies 2-4 need three SLX lookups. They are evaluated together, in
+    # one pass over one catalog fetch, the first time any strategy needs them.
+    slx_matches: Dict[str, List[Dict]] = {}
+    slx_matches_lock = threading.Lock()
+
+    def matched_slxs(key: str, attempt: _SearchAttempt) -> List[Dict]:
+        if not entity_data:
+            return []
+        with slx_matches_lock:
+            if not slx_matches:
+                # Strategies may run on worker threads, which Robot does not
+                # log from: the lookup's log lines travel with the attempt
+                matches, notes = _slxs_matching_outcome({
+                    "targeted": {
+                        "entity_refs": entity_data,
+                        "tag_types": ["resource_name", "child_resource", "entity_name"],
+                    },
+                    "resource_name": {"tags": [{"name": "resource_name", "value": e} for e in entity_data]},
+                    "child_resource": {"tags": [{"name": "child_resource", "value": e} for e in entity_data]},
+                })
+                slx_matches.update(matches)
+                attempt.log.extend(notes)
+        return slx_matches.get(key, [])
+
     # Strategy 1: Search with just the specific entity data (most specific)
-    if entity_data:
+    def plan_specific_entity_data() -> Optional[_SearchAttempt]:
+        if not entity_data:
+            return None
         entity_query = " ".join(entity_data)
-        BuiltIn().log(f"[improved_search] Strategy 1: Searching with specific entity data only: {entity_query}", level="INFO")
-        
-        search_response = perform_task_search_with_persona(
-            query=entity_query,
-            persona=persona,
-            slx_scope=slx_scope
+        return _SearchAttempt(
+            "specific_entity_data", entity_query, slx_scope,
+            [f"Strategy 1: Searching with specific entity data only: {entity_query}"],
         )
-        
-        # Check if we have high-quality results
-        high_quality_tasks = [
-            t for t in search_response.get("tasks", [])
-            if t.get("score", 0) >= confidence_threshold
-        ]
-        
-        if high_quality_tasks:
-            BuiltIn().log(f"[improved_search] Strategy 1 successful: {len(high_quality_tasks)} high-quality tasks found", level="INFO")
-            return search_response, "specific_entity_data", slx_scope or [], entity_query
 
     # Strategy 2: Search with extracted entity data enhanced with resource_type
-    if entity_data:
+    def plan_entity_data_with_resource_type() -> Optional[_SearchAttempt]:
+        if not entity_data:
+            return None
+        attempt = _SearchAttempt("entity_data_with_resource_type", "", slx_scope, [])
         # First, find SLXs that match our entities to get resource_type context
-        matching_slxs = get_slxs_with_targeted_entity_reference(entity_data, ["resource_name", "child_resource", "entity_name"])
-        resource_types = extract_resource_types_from_slxs(matching_slxs)
+        matching_slxs = matched_slxs("targeted", attempt)
+        resource_types = extract_resource_types_from_slxs(matching_slxs, attempt.aliases)
         
         # Build enhanced query with resource types
         query_parts = list(entity_data)
         if resource_types:
             query_parts.extend(resource_types)
-            BuiltIn().log(f"[improved_search] Enhanced entity query with resource context from matching SLXs: {resource_types}", level="INFO")
+            attempt.notes.append(f"Enhanced entity query with resource context from matching SLXs: {resource_types}")
         query_parts.append("health")
         
-        entity_query = " ".join(query_parts)
-        BuiltIn().log(f"[improved_search] Strategy 2: Searching with enhanced entity data: {entity_query}", level="INFO")
-        
-        search_response = perform_task_search_with_persona(
-            query=entity_query,
-            persona=persona,
-            slx_scope=slx_scope
-        )
-        
-        # Check if we have high-quality results
-        high_quality_tasks = [
-            t for t in search_response.get("tasks", [])
-            if t.get("score", 0) >= confidence_threshold
-        ]
+        attempt.query = " ".join(query_parts)
+        attempt.notes.append(f"Strategy 2: Searching with enhanced entity data: {attempt.query}")
+        return attempt
+
+    # Strategies 3 and 4: Search within the SLXs carrying a resource tag
+    def plan_tagged_slxs(strategy: str, number: int, tag_name: str) -> Optional[_SearchAttempt]:
+        attempt = _SearchAttempt(strategy, "health", None, [])
+        slx_list = matched_slxs(tag_name, attempt)
+        if not slx_list:
+            attempt.skip = True
+            return attempt
         
-        if high_quality_tasks:
-            BuiltIn().log(f"[improved_search] Strategy 2 successful: {len(high_quality_tasks)} high-quality tasks found", level="INFO")
-            return search_response, "entity_data_with_resource_type", slx_scope or [], entity_query
-
-    # Strategy 3: Search with SLX spec.tag "resource_name"
-    BuiltIn().log("[improved_search] Strategy 3: Searching with resource_name tags", level="INFO")
-    
-    # Get SLXs with resource_name tags
-    resource_name_tags = [{"name": "resource_name", "value": entity} for entity in entity_data]
-    slx_list = get_slxs_with_tag(resource_name_tags)
-    
-    if slx_list:
-        resource_slx_scopes = [_slx_short_name(slx) for slx in slx_list]
+        tagged_scopes = [_slx_short_name(slx) for slx in slx_list]
         # Combine with existing scope if provided
-        combined_scope = list(set((slx_scope or []) + resource_slx_scopes))
+        attempt.scope = list(set((slx_scope or []) + tagged_scopes))
         
-        # Extract resource types and enhance query for Strategy 3 as well
-        resource_types = extract_resource_types_from_slxs(slx_list)
-        strategy3_query = "health"
+        # Extract resource types and enhance query
+        resource_types = extract_resource_types_from_slxs(slx_list, attempt.aliases)
         if resource_types:
-            strategy3_query = " ".join(resource_types) + " health"
-            BuiltIn().log(f"[improved_search] Strategy 3 enhanced with resource context: {resource_types}", level="INFO")
-        
-        # Try search with resource_name SLXs
-        search_response = perform_task_search_with_persona(
-            query=strategy3_query,
-            persona=persona,
-            slx_scope=combined_scope
-        )
-        
-        high_quality_tasks = [
-            t for t in search_response.get("tasks", [])
-            if t.get("score", 0) >= confidence_threshold
-        ]
-        
-        if high_quality_tasks:
-            BuiltIn().log(f"[improved_search] Strategy 3 successful: {len(high_quality_tasks)} high-quality tasks found", level="INFO")
-            return search_response, "resource_name_tags_with_resource_type", combined_scope, strategy3_query
+            attempt.query = " ".join(resource_types) + " health"
+            attempt.notes.append(f"Strategy {number} enhanced with resource context: {resource_types}")
+        return attempt
+
+    strategies = [
+        plan_specific_entity_data,
+        plan_entity_data_with_resource_type,
+        lambda: plan_tagged_slxs("resource_name_tags_with_resource_type", 3, "resource_name"),
+        lambda: plan_tagged_slxs("child_resource_tags_with_resource_type", 4, "child_resource"),
+    ]
+    headers = {
+        "resource_name_tags_with_resource_type": "Strategy 3: Searching with resource_name tags",
+        "child_resource_tags_with_resource_type": "Strategy 4: Searching with child_resource tags",
+    }
 
-    # Strategy 4: Search with "child_resource" tag names
-    BuiltIn().log("[improved_search] Strategy 4: Searching with child_resource tags", level="INFO")
-    
-    # Get SLXs with child_resource tags
-    child_resource_tags = [{"name": "child_resource", "value": entity} for entity in entity_data]
-    slx_list = get_slxs_with_tag(child_resource_tags)
-    
-    if slx_list:
-        child_slx_scopes = [_slx_short_name(slx) for slx in slx_list]
-        # Combine with existing scope if provided
-        combined_scope = list(set((slx_scope or []) + child_slx_scopes))
-        
-        # Extract resource types and enhance query for Strategy 4 as well
-        resource_types = extract_resource_types_from_slxs(slx_list)
-        strategy4_query = "health"
-        if resource_types:
-            strategy4_query = " ".join(resource_types) + " health"
-            BuiltIn().log(f"[improved_search] Strategy 4 enhanced with resource context: {resource_types}", level="INFO")
-        
-        # Try search with child_resource SLXs
-        search_response = perform_task_search_with_persona(
-            query=strategy4_query,
-            persona=persona,
-            slx_scope=combined_scope
-        )
-        
+    def run(plan) -> Optional[_SearchAttempt]:
+        attempt = plan()
+        if attempt is not None and not attempt.skip:
+            request = _task_search_request(attempt.query, attempt.scope, persona)
+            if request is not None:
+                attempt.response, problem = _task_search_outcome(*request, 120.0)
+                if problem:
+                    attempt.log.append(("WARN", problem))
+        return attempt
+
+    def report(number: int, attempt: Optional[_SearchAttempt]) -> bool:
+        """Log *attempt* and tell whether it has high-quality results."""
+        if attempt is None:
+            return False
+        if attempt.strategy in headers:
+            BuiltIn().log(f"[improved_search] {headers[attempt.strategy]}", level="INFO")
+        for note in attempt.notes:
+            BuiltIn().log(f"[improved_search] {note}", level="INFO")
+        _log_notes(attempt.log)
+        if attempt.skip:
+            return False
+        # Check if we have high-quality results
         high_quality_tasks = [
-            t for t in search_response.get("tasks", [])
+            t for t in attempt.response.get("tasks", [])
             if t.get("score", 0) >= confidence_threshold
         ]
-        
         if high_quality_tasks:
-            BuiltIn().log(f"[improved_search] Strategy 4 successful: {len(high_quality_tasks)} high-quality tasks found", level="INFO")
-            return search_response, "child_resource_tags_with_resource_type", combined_scope, strategy4_query
+            BuiltIn().log(f"[improved_search] Strategy {number} successful: {len(high_quality_tasks)} high-quality tasks found", level="INFO")
+            return True
+        return False
+
+    # Collect SLX aliases for fallback, in strategy order
+    collected_aliases: List[str] = []
+
+    def winner(attempt: _SearchAttempt) -> Tuple[Dict, str, List[str], str]:
+        return attempt.response, attempt.strategy, attempt.scope or [], attempt.query
+
+    if parallel:
+        BuiltIn().log(f"[improved_search] Running {len(strategies)} strategies concurrently", level="INFO")
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(strategies), thread_name_prefix="rw-improved-search")
+        try:
+            futures = [pool.submit(run, plan) for plan in strategies]
+            for number, future in enumerate(futures, start=1):
+                attempt = future.result()
+                if report(number, attempt):
+                    for pending in futures[number:]:
+                        pending.cancel()
+                    return winner(attempt)
+                if attempt is not None:
+                    collected_aliases.extend(a for a in attempt.aliases if a not in collected_aliases)
+        finally:
+            # Don't wait for lower-priority searches still in flight
+            pool.shutdown(wait=False)
+    else:
+        for number, plan in enumerate(strategies, start=1):
+            attempt = run(plan)
+            if report(number, attempt):
+                return winner(attempt)
+            if attempt is not None:
+                collected_aliases.extend(a for a in attempt.aliases if a not in collected_aliases)
 
     # If all strategies fail, perform a fallback search using SLX aliases
     fallback_query = "health"  # Default fallback
@@ -1241,4 +1546,4 @@ def perform_improved_task_search(
         slx_scope=slx_scope
     )
     
-    return search_response, "fallback", slx_scope or [], fallback_query
\ No newline at end of file
+    return search_response, "fallback", slx_scope or [], fallback_query
@@ -0,0 +1,89 @@
+import time
+
+import pytest
+import requests
+
+from RW.Workspace.retry_policy import (
+    CircuitOpenError,
+    RetryPolicy,
+    circuit_breaker,
+    request_with_retry,
+    reset_circuit_breakers,
+)
+
+URL = "https://api.example.test/api/v3/workspaces/ws/slxs"
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class FakeSession:
+    """Hands out the queued outcomes in order: a status code, or an exception to raise."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        resp = requests.Response()
+        resp.status_code = outcome
+        resp._content = b"{}"
+        return resp
+
+
+@pytest.fixture(autouse=True)
+def _fresh_breakers():
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+def _half_open():
+    breaker = circuit_breaker(URL)
+    breaker.failures = breaker.failure_threshold
+    breaker.opened_at = time.monotonic() - breaker.reset_timeout - 1
+    assert breaker.state == "half-open"
+    return breaker
+
+
+def _let_reset_timeout_pass(breaker):
+    breaker.opened_at = time.monotonic() - breaker.reset_timeout - 1
+
+
+def test_probe_failing_with_chunked_encoding_error_reopens_then_recovers():
+    breaker = _half_open()
+    session = FakeSession(requests.exceptions.ChunkedEncodingError("truncated body"), 200)
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        request_with_retry(session, "GET", URL, policy=NO_RETRY)
+    assert breaker.state == "open"
+
+    _let_reset_timeout_pass(breaker)
+    assert request_with_retry(session, "GET", URL, policy=NO_RETRY).status_code == 200
+    assert breaker.state == "closed"
+    assert session.calls == 2
+
+
+def test_probe_failing_with_non_requests_error_does_not_wedge_the_circuit():
+    breaker = _half_open()
+    session = FakeSession(ValueError("bad header value"), 200)
+
+    with pytest.raises(ValueError):
+        request_with_retry(session, "GET", URL, policy=NO_RETRY)
+
+    _let_reset_timeout_pass(breaker)
+    assert request_with_retry(session, "GET", URL, policy=NO_RETRY).status_code == 200
+    assert breaker.state == "closed"
+
+
+def test_open_circuit_fails_fast_without_sending():
+    breaker = circuit_breaker(URL)
+    breaker.failures = breaker.failure_threshold
+    breaker.opened_at = time.monotonic()
+    session = FakeSession(200)
+
+    with pytest.raises(CircuitOpenError):
+        request_with_retry(session, "GET", URL, policy=NO_RETRY)
+    assert session.calls == 0
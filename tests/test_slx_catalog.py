@@ -0,0 +1,76 @@
+import hashlib
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from RW.Workspace import slx_catalog
+from RW.Workspace.retry_policy import reset_circuit_breakers
+
+START_URL = "https://api.example.test/api/v3/workspaces/ws/slxs?limit=2"
+
+
+def slx(short_name, env):
+    return {"shortName": short_name, "spec": {"alias": short_name, "tags": [{"name": "env", "value": env}]}}
+
+
+class FakeListing:
+    """An offset-paged SLX listing whose pages each carry their own ETag and honour If-None-Match."""
+
+    def __init__(self, slxs, page_size=2):
+        self.slxs = slxs
+        self.page_size = page_size
+        self.calls = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        offset = int(parse_qs(urlparse(url).query).get("offset", ["0"])[0])
+        body = {
+            "results": self.slxs[offset:offset + self.page_size],
+            "page": {"offset": offset, "total": len(self.slxs)},
+        }
+        raw = json.dumps(body).encode()
+        etag = '"' + hashlib.sha1(raw).hexdigest() + '"'
+        resp = requests.Response()
+        resp.url = url
+        resp.headers["ETag"] = etag
+        if (headers or {}).get("If-None-Match") == etag:
+            resp.status_code, resp._content = 304, b""
+        else:
+            resp.status_code, resp._content = 200, raw
+        self.calls.append((offset, resp.status_code))
+        return resp
+
+
+@pytest.fixture(autouse=True)
+def _fresh_catalogs():
+    slx_catalog.invalidate_slx_catalog()
+    reset_circuit_breakers()
+    yield
+    slx_catalog.invalidate_slx_catalog()
+
+
+def envs(snapshot):
+    return {record.short_name: dict(record.tags)["env"] for record in snapshot.records}
+
+
+def test_change_on_a_later_page_is_picked_up_while_the_first_page_is_unchanged():
+    listing = FakeListing([slx("a", "prod"), slx("b", "prod"), slx("c", "prod"), slx("d", "prod")])
+    assert envs(slx_catalog._get_slx_catalog(START_URL, listing)) == dict.fromkeys("abcd", "prod")
+
+    listing.slxs[3] = slx("d", "staging")
+    listing.calls.clear()
+    snapshot = slx_catalog._get_slx_catalog(START_URL, listing, max_age=0)
+
+    assert listing.calls[:2] == [(0, 304), (2, 200)]
+    assert envs(snapshot) == {"a": "prod", "b": "prod", "c": "prod", "d": "staging"}
+    assert slx_catalog._get_slx_catalog(START_URL, listing) is snapshot
+
+
+def test_unchanged_listing_is_revalidated_page_by_page_and_kept():
+    listing = FakeListing([slx("a", "prod"), slx("b", "prod"), slx("c", "prod")])
+    first = slx_catalog._get_slx_catalog(START_URL, listing)
+
+    listing.calls.clear()
+    assert slx_catalog._get_slx_catalog(START_URL, listing, max_age=0) is first
+    assert listing.calls == [(0, 304), (2, 304)]